@@ -0,0 +1,38 @@
+import math
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+class BaseBenchmark(BaseCommand):
+    """
+    Base class for benchmarks that create and delete rows in the configured database.
+    Outside DEBUG they only run with --allow-writes, so they are not pointed at a shared
+    database by accident.
+    """
+    help = 'Base class for all database benchmarks'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--allow-writes', action='store_true',
+                            help='Run even though DEBUG is off; benchmark rows are written to the configured database')
+
+    def handle(self, *args, **options):
+        if not (settings.DEBUG or options['allow_writes']):
+            raise CommandError(
+                f"{self.__module__.rsplit('.', 1)[-1]} writes benchmark rows to the configured database; "
+                "rerun with --allow-writes to confirm"
+            )
+        self.benchmark(*args, **options)
+
+    def benchmark(self, *args, **options):
+        """
+        Override this method in your benchmark class.
+        """
+        raise NotImplementedError("Subclasses must implement benchmark()")
+
+    @staticmethod
+    def _percentile(values, percentile):
+        """Nearest-rank percentile"""
+        ordered = sorted(values)
+        if not ordered:
+            return 0.0
+        rank = max(math.ceil(percentile / 100 * len(ordered)) - 1, 0)
+        return ordered[rank]
@@ -0,0 +1,85 @@
+import math
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APIClient
+from authentication.models import CustomUser
+from question.models import Question
+from question.serializers import QuestionResponse
+from question.services import QuestionService
+from tag.models import Tag
+from .base_benchmark import BaseBenchmark
+
+class Command(BaseBenchmark):
+    help = 'Benchmarks the question history endpoint as the history of one user grows'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 5000],
+                            help='History sizes to benchmark, one user each')
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Requests per history size')
+        parser.add_argument('--page-size', type=int, default=6,
+                            help='Questions per page')
+
+    def benchmark(self, *args, **options):
+        self.stdout.write(f"{'history':>8} {'p50 ms':>9} {'p95 ms':>9} {'db queries':>11} {'serialize all ms':>17}")
+
+        for size in options['sizes']:
+            result = self._benchmark_history(size, options)
+            self.stdout.write(
+                f"{size:>8} {result['p50']:>9.1f} {result['p95']:>9.1f} "
+                f"{result['db_queries']:>11.1f} {result['serialize_all']:>17.1f}"
+            )
+
+    def _benchmark_history(self, size, options):
+        suffix = uuid.uuid4().hex[:8]
+        user = CustomUser.objects.create_user(email=f"benchmark-{suffix}@example.com", username=f"benchmark-{suffix}")
+        tag = Tag.objects.create(name=f"bench{suffix[:5]}")
+        now = datetime.now(timezone.utc) + timedelta(hours=7)
+        questions = Question.objects.bulk_create([
+            Question(
+                title=f"Benchmark {index}",
+                question=f"Benchmark question {index}",
+                user=user,
+                created_at=now - timedelta(seconds=index),
+            )
+            for index in range(size)
+        ])
+        Question.tags.through.objects.bulk_create([
+            Question.tags.through(question_id=question.id, tag_id=tag.id) for question in questions
+        ])
+
+        client = APIClient()
+        client.force_authenticate(user=user)
+        url = reverse('get_all')
+        latencies, db_queries = [], []
+
+        try:
+            for iteration in range(options['iterations']):
+                # Spread the requests over the pages of the history
+                page = iteration % max(math.ceil(size / options['page_size']), 1) + 1
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    client.get(url, {'time_range': 'last_week', 'count': options['page_size'], 'p': page})
+                    latencies.append((time.perf_counter() - started) * 1000)
+                db_queries.append(len(queries.captured_queries))
+
+            # What the endpoint used to do before paginating: serialize the whole history
+            started = time.perf_counter()
+            QuestionResponse(QuestionService().get_all(user=user, time_range='last_week'), many=True).data
+            serialize_all = (time.perf_counter() - started) * 1000
+        finally:
+            Question.objects.filter(user=user).delete()
+            tag.delete()
+            user.delete()
+
+        return {
+            'p50': self._percentile(latencies, 50),
+            'p95': self._percentile(latencies, 95),
+            'db_queries': sum(db_queries) / len(db_queries) if db_queries else 0.0,
+            'serialize_all': serialize_all,
+        }
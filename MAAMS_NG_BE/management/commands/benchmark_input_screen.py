@@ -0,0 +1,62 @@
+import re
+import time
+from django.core.management.base import BaseCommand
+from cause.serializers import contains_dangerous_input
+
+# The per-pattern screen BaseCauses.validate_cause used to run, kept as the baseline
+LEGACY_PATTERNS = [
+    r"(\b(SELECT|UNION|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|;|--)\b)",
+    r"'.*'",
+    r"'.*OR.*'",
+    r"'.*UNION.*'",
+    r"'.*DROP.*'",
+    r"<script.*?>.*?</script.*?>",
+    r"onerror\s*=",
+    r"javascript:",
+    r"<img.*?on.*?=",
+    r"<a.*?href.*?javascript:",
+]
+
+# Repeated units that make backtracking patterns retry from every position
+ADVERSARIAL_UNITS = {
+    'benign': "Anggaran perbaikan jalan desa tidak mencukupi ",
+    'quote-or': "'OR ",
+    'img-on': "<img on ",
+    'script-open': "<script>",
+    'anchor-href': "<a href ",
+    'quote-lines': "'a\n<",
+}
+
+def legacy_screen(value: str) -> bool:
+    return any(re.search(pattern, value, re.IGNORECASE) for pattern in LEGACY_PATTERNS)
+
+class Command(BaseCommand):
+    help = 'Benchmarks the cause injection screen against the legacy per-pattern regexes on adversarial inputs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--length', type=int, default=500,
+                            help='Length of every input in characters')
+        parser.add_argument('--iterations', type=int, default=200,
+                            help='Screens per input and implementation')
+
+    def handle(self, *args, **options):
+        self.stdout.write(f"{'input':>12} {'legacy us':>10} {'screen us':>10} {'speedup':>8}")
+
+        for name, unit in ADVERSARIAL_UNITS.items():
+            value = (unit * (options['length'] // len(unit) + 1))[:options['length']]
+            if legacy_screen(value) != contains_dangerous_input(value):
+                self.stderr.write(f"{name}: the screens disagree")
+
+            legacy = self._median_us(legacy_screen, value, options['iterations'])
+            screen = self._median_us(contains_dangerous_input, value, options['iterations'])
+            self.stdout.write(f"{name:>12} {legacy:>10.1f} {screen:>10.1f} {legacy / screen:>7.1f}x")
+
+    @staticmethod
+    def _median_us(screen, value, iterations):
+        timings = []
+        for _ in range(max(iterations, 1)):
+            started = time.perf_counter()
+            screen(value)
+            timings.append((time.perf_counter() - started) * 1_000_000)
+        timings.sort()
+        return timings[len(timings) // 2]
@@ -0,0 +1,143 @@
+import json
+import time
+from pathlib import Path
+from django.conf import settings
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from cause.models import Causes
+from question.models import Question
+from validator.utils.llm_backends import LLMBackend, LocalBackend
+from validator.utils.prompts import prompt_metrics
+from validator.utils.rule_classifier import rule_classifier
+from validator.utils.verdict_cache import verdict_cache
+from .base_benchmark import BaseBenchmark
+
+FIXTURE_PATH = Path(settings.BASE_DIR) / 'cause' / 'fixtures' / 'data.json'
+COLUMNS = 5
+
+class Command(BaseBenchmark):
+    help = 'Benchmarks the validate endpoint on synthetic 5xN grids against the local LLM stand-in'
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument('--rows', type=int, nargs='+', default=[3, 5, 10],
+                            help='Grid heights to benchmark, one 5xN grid each')
+        parser.add_argument('--iterations', type=int, default=20,
+                            help='Validations per grid')
+        parser.add_argument('--latency', type=float, default=0.05,
+                            help='Median latency of one LLM call in seconds')
+        parser.add_argument('--latency-sigma', type=float, default=0.3,
+                            help='Spread of the lognormal latency distribution')
+        parser.add_argument('--error-rate', type=float, default=0.0,
+                            help='Probability that an LLM call fails')
+        parser.add_argument('--root-row', type=int, default=None,
+                            help='Row from which causes are root causes (defaults to the grid height)')
+        parser.add_argument('--batch-mode', action='store_true',
+                            help='Validate with one structured prompt per batch')
+        parser.add_argument('--warm-cache', action='store_true',
+                            help='Let repeated prompts hit the verdict cache instead of always calling the LLM')
+
+    def benchmark(self, *args, **options):
+        texts = self._load_texts()
+        self.stdout.write(
+            f"{'grid':>6} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'llm calls':>10} {'saved':>6} {'tokens':>9} {'db queries':>11} {'errors':>7}"
+        )
+
+        for rows in options['rows']:
+            validator_settings = dict(
+                getattr(settings, 'VALIDATOR', {}),
+                LLM_BACKEND=LocalBackend.name,
+                ASYNC_JOBS=False,
+                BATCH_MODE=options['batch_mode'],
+                LOCAL_LLM={
+                    'LATENCY': {
+                        'DISTRIBUTION': 'lognormal' if options['latency'] > 0 else 'fixed',
+                        'MEAN': options['latency'],
+                        'SIGMA': options['latency_sigma'],
+                    },
+                    'ERROR_RATE': options['error_rate'],
+                    'ROOT_ROW': options['root_row'] or rows,
+                    'RULES': [],
+                },
+            )
+            cache_enabled = verdict_cache.enabled
+            verdict_cache.enabled = options['warm_cache']
+            try:
+                with override_settings(VALIDATOR=validator_settings):
+                    result = self._benchmark_grid(rows, texts, options)
+            finally:
+                verdict_cache.enabled = cache_enabled
+
+            self.stdout.write(
+                f"{f'5x{rows}':>6} {result['p50']:>9.1f} {result['p95']:>9.1f} {result['p99']:>9.1f} "
+                f"{result['llm_calls']:>10.1f} {result['saved']:>6.1f} {result['tokens']:>9.1f} {result['db_queries']:>11.1f} {result['errors']:>7}"
+            )
+
+    def _benchmark_grid(self, rows, texts, options):
+        question = Question.objects.create(question=f"Benchmark question for a 5x{rows} grid", title="Benchmark")
+        Causes.objects.bulk_create([
+            Causes(
+                question=question,
+                column=column,
+                row=row,
+                cause=texts[(column * rows + row) % len(texts)],
+            )
+            for column in range(COLUMNS)
+            for row in range(1, rows + 1)
+        ])
+
+        client = Client()
+        url = reverse('validate_causes', kwargs={'question_id': question.id})
+        latencies, llm_calls, saved, tokens, db_queries, errors = [], [], [], [], [], 0
+
+        try:
+            for _ in range(options['iterations']):
+                self._reset_grid(question, rows)
+
+                calls_before = LLMBackend.call_counts().get(LocalBackend.name, 0)
+                saved_before = rule_classifier.stats()['total']
+                tokens_before = prompt_metrics.stats()['tokens']
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    response = client.patch(url)
+                    latencies.append((time.perf_counter() - started) * 1000)
+
+                errors += response.status_code != 200
+                llm_calls.append(LLMBackend.call_counts().get(LocalBackend.name, 0) - calls_before)
+                saved.append(rule_classifier.stats()['total'] - saved_before)
+                tokens.append(prompt_metrics.stats()['tokens'] - tokens_before)
+                db_queries.append(len(queries.captured_queries))
+        finally:
+            Causes.objects.filter(question=question).delete()
+            question.delete()
+
+        return {
+            'p50': self._percentile(latencies, 50),
+            'p95': self._percentile(latencies, 95),
+            'p99': self._percentile(latencies, 99),
+            'llm_calls': sum(llm_calls) / len(llm_calls),
+            'saved': sum(saved) / len(saved),
+            'tokens': sum(tokens) / len(tokens),
+            'db_queries': sum(db_queries) / len(db_queries),
+            'errors': errors,
+        }
+
+    def _reset_grid(self, question, rows):
+        """Put every cause back to unvalidated and drop the placeholder rows of the previous run"""
+        Causes.objects.filter(question=question, row__gt=rows).delete()
+        Causes.objects.filter(question=question).update(
+            status=False, root_status=False, feedback='', fingerprint='', is_dirty=True
+        )
+
+    def _load_texts(self):
+        """Short cause texts taken from the first sentence of the cause fixtures"""
+        with open(FIXTURE_PATH) as fixture:
+            records = json.load(fixture)
+
+        return [
+            record['fields']['cause'].split('.')[0][:200]
+            for record in records
+            if record['model'] == 'cause.causes' and record['fields']['cause'].strip()
+        ]
@@ -0,0 +1,63 @@
+import threading
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections, connections
+from validator.services import ValidationJobService
+
+class Command(BaseCommand):
+    help = 'Runs a pool of workers that process queued validation jobs'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--workers', type=int, default=getattr(settings, 'VALIDATOR', {}).get('JOB_WORKERS', 2),
+                            help='Number of worker threads')
+        parser.add_argument('--poll-interval', type=float, default=1.0,
+                            help='Seconds to wait before polling an empty queue again')
+        parser.add_argument('--stale-after', type=int, default=15 * 60,
+                            help='Requeue RUNNING jobs older than this many seconds on startup')
+        parser.add_argument('--burst', action='store_true',
+                            help='Exit once the queue is empty instead of waiting for new jobs')
+
+    def handle(self, *args, **options):
+        service = ValidationJobService()
+        stop = threading.Event()
+
+        requeued = service.requeue_stale(options['stale_after'])
+        if requeued:
+            self.stdout.write(self.style.WARNING(f'Requeued {requeued} stale validation job(s)'))
+
+        threads = [
+            threading.Thread(target=self._work, args=(service, stop, options), name=f'validation-worker-{index}')
+            for index in range(options['workers'])
+        ]
+        for thread in threads:
+            thread.start()
+
+        self.stdout.write(self.style.SUCCESS(f'Started {len(threads)} validation worker(s)'))
+
+        try:
+            for thread in threads:
+                while thread.is_alive():
+                    thread.join(timeout=1)
+        except KeyboardInterrupt:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+        self.stdout.write(self.style.SUCCESS('Validation workers stopped'))
+
+    def _work(self, service, stop, options):
+        try:
+            while not stop.is_set():
+                close_old_connections()
+                job = service.claim_next()
+
+                if job is None:
+                    if options['burst']:
+                        return
+                    stop.wait(options['poll_interval'])
+                    continue
+
+                service.run(job)
+                self.stdout.write(f'Validation job {job.id} finished with status {job.status}')
+        finally:
+            connections.close_all()
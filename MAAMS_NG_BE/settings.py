@@ -260,6 +260,111 @@ GOOGLE_CLIENT_ID = os.getenv("GOOGLE_CLIENT_ID")
 
 GROQ_API_KEY = os.getenv("GROQ_API_KEY")
 
+# Validator pipeline configuration
+VALIDATOR = {
+    # Maximum number of row 1 LLM chains validated concurrently
+    'MAX_WORKERS': int(os.getenv("VALIDATOR_MAX_WORKERS", 5)),
+    # Validate pending causes with one structured prompt per batch instead of one prompt per step
+    'BATCH_MODE': os.getenv("VALIDATOR_BATCH_MODE", "False") == "True",
+    # Request single verdicts as JSON objects, falling back to free-text matching when parsing fails
+    'STRUCTURED_OUTPUT': os.getenv("VALIDATOR_STRUCTURED_OUTPUT", "True") == "True",
+    # Queue validations as jobs for `manage.py run_validation_worker` instead of running them in the request
+    'ASYNC_JOBS': os.getenv("VALIDATOR_ASYNC_JOBS", "False") == "True",
+    'JOB_WORKERS': int(os.getenv("VALIDATOR_JOB_WORKERS", 2)),
+    # Content-addressed cache for LLM verdicts (Django cache + in-process LRU)
+    'VERDICT_CACHE': {
+        'ENABLED': os.getenv("VALIDATOR_VERDICT_CACHE_ENABLED", "True") == "True",
+        'TTL': int(os.getenv("VALIDATOR_VERDICT_CACHE_TTL", 60 * 60 * 24)),
+        'LOCAL_MAXSIZE': int(os.getenv("VALIDATOR_VERDICT_CACHE_LOCAL_MAXSIZE", 1024)),
+    },
+    # Deadlines, retries and circuit breaker around Groq calls (times in seconds)
+    'GROQ_RESILIENCE': {
+        'DEADLINE': float(os.getenv("GROQ_DEADLINE", 30)),
+        'ATTEMPT_TIMEOUT': float(os.getenv("GROQ_ATTEMPT_TIMEOUT", 20)),
+        'MAX_RETRIES': int(os.getenv("GROQ_MAX_RETRIES", 2)),
+        'BACKOFF_BASE': float(os.getenv("GROQ_BACKOFF_BASE", 0.5)),
+        'BACKOFF_MAX': float(os.getenv("GROQ_BACKOFF_MAX", 8)),
+        'FAILURE_THRESHOLD': int(os.getenv("GROQ_CIRCUIT_FAILURE_THRESHOLD", 5)),
+        'RECOVERY_TIMEOUT': float(os.getenv("GROQ_CIRCUIT_RECOVERY_TIMEOUT", 30)),
+        'HALF_OPEN_MAX_CALLS': int(os.getenv("GROQ_CIRCUIT_HALF_OPEN_MAX_CALLS", 1)),
+    },
+    # Chat model behind the validator: "groq", "router" for per-type models on top of LLM_ROUTER['BACKEND'],
+    # or "local" for the deterministic stand-in used in load tests
+    'LLM_BACKEND': os.getenv("VALIDATOR_LLM_BACKEND", "groq"),
+    # Models per validation type, tried in order on failure; HEDGE_AFTER (seconds, about the p95 latency)
+    # races a slow request against the next model
+    'LLM_ROUTER': {
+        'BACKEND': os.getenv("LLM_ROUTER_BACKEND", "groq"),
+        'MAX_WORKERS': int(os.getenv("LLM_ROUTER_MAX_WORKERS", 10)),
+        'ROUTES': {
+            'normal': {
+                'MODELS': [os.getenv("LLM_ROUTER_FAST_MODEL", "llama-3.1-8b-instant"), "deepseek-r1-distill-llama-70b"],
+                'HEDGE_AFTER': float(os.getenv("LLM_ROUTER_FAST_HEDGE_AFTER", 1.5)),
+            },
+            'root': {
+                'MODELS': [os.getenv("LLM_ROUTER_FAST_MODEL", "llama-3.1-8b-instant"), "deepseek-r1-distill-llama-70b"],
+                'HEDGE_AFTER': float(os.getenv("LLM_ROUTER_FAST_HEDGE_AFTER", 1.5)),
+            },
+            'false': {'MODELS': ["deepseek-r1-distill-llama-70b"]},
+            'root_type': {'MODELS': ["deepseek-r1-distill-llama-70b"]},
+            'batch': {'MODELS': ["deepseek-r1-distill-llama-70b"]},
+        },
+    },
+    'LOCAL_LLM': {
+        'LATENCY': {
+            # fixed, uniform, normal or lognormal (MEAN is the median for lognormal), in seconds
+            'DISTRIBUTION': os.getenv("LOCAL_LLM_LATENCY_DISTRIBUTION", "lognormal"),
+            'MEAN': float(os.getenv("LOCAL_LLM_LATENCY_MEAN", 0.5)),
+            'SIGMA': float(os.getenv("LOCAL_LLM_LATENCY_SIGMA", 0.3)),
+        },
+        'ERROR_RATE': float(os.getenv("LOCAL_LLM_ERROR_RATE", 0)),
+        'ROOT_ROW': int(os.getenv("LOCAL_LLM_ROOT_ROW", 3)),
+        'SEED': int(os.getenv("LOCAL_LLM_SEED", 42)),
+        'RULES': [],
+    },
+    # Decide obvious verdicts (restated problem or parent, category keywords) without the LLM.
+    # CORRUPTION_TERMS and CATEGORY_TERMS ({1: [...], 2: [...], 3: [...]}) replace the built-in term tables
+    'RULES': {
+        'ENABLED': os.getenv("VALIDATOR_RULES_ENABLED", "True") == "True",
+    },
+    # Speculatively cache the NORMAL and ROOT verdicts of a cause when its text is saved,
+    # once no further edit arrives for DEBOUNCE seconds
+    'PREFETCH': {
+        'ENABLED': os.getenv("VALIDATOR_PREFETCH_ENABLED", "False") == "True",
+        'DEBOUNCE': float(os.getenv("VALIDATOR_PREFETCH_DEBOUNCE", 1.0)),
+        'MAX_WORKERS': int(os.getenv("VALIDATOR_PREFETCH_MAX_WORKERS", 2)),
+    },
+    # Bearer token required by /api/v1/metrics/; the endpoint answers 404 when unset
+    'METRICS_TOKEN': os.getenv("VALIDATOR_METRICS_TOKEN"),
+    # One validation per question at a time; a concurrent request waits up to WAIT_TIMEOUT seconds
+    # for the running one and returns its result. TTL expires the cache lock used on SQLite
+    'LOCK': {
+        'WAIT_TIMEOUT': float(os.getenv("VALIDATOR_LOCK_WAIT_TIMEOUT", 120)),
+        'POLL_INTERVAL': float(os.getenv("VALIDATOR_LOCK_POLL_INTERVAL", 0.2)),
+        'TTL': int(os.getenv("VALIDATOR_LOCK_TTL", 600)),
+    },
+    # MinHash similarity of causes; a cause at least THRESHOLD similar to the cause above it
+    # is rejected as "similar to the previous cause" without asking the LLM
+    'SIMILARITY': {
+        'THRESHOLD': float(os.getenv("VALIDATOR_SIMILARITY_THRESHOLD", 0.8)),
+        'NUM_PERM': int(os.getenv("VALIDATOR_SIMILARITY_NUM_PERM", 64)),
+        'SHINGLE_SIZE': int(os.getenv("VALIDATOR_SIMILARITY_SHINGLE_SIZE", 4)),
+    },
+    # Token budgets for user text inside prompts; longer causes and questions are truncated
+    'PROMPT': {
+        'CAUSE_MAX_TOKENS': int(os.getenv("VALIDATOR_PROMPT_CAUSE_MAX_TOKENS", 100)),
+        'QUESTION_MAX_TOKENS': int(os.getenv("VALIDATOR_PROMPT_QUESTION_MAX_TOKENS", 100)),
+    },
+    # Shared, keep-alive Groq client (timeouts in seconds)
+    'GROQ_CLIENT': {
+        'MAX_CONNECTIONS': int(os.getenv("GROQ_MAX_CONNECTIONS", 20)),
+        'MAX_KEEPALIVE_CONNECTIONS': int(os.getenv("GROQ_MAX_KEEPALIVE_CONNECTIONS", 10)),
+        'KEEPALIVE_EXPIRY': float(os.getenv("GROQ_KEEPALIVE_EXPIRY", 30)),
+        'TIMEOUT': float(os.getenv("GROQ_TIMEOUT", 60)),
+        'CONNECT_TIMEOUT': float(os.getenv("GROQ_CONNECT_TIMEOUT", 5)),
+    },
+}
+
 sentry_sdk.init(
     dsn=os.getenv("SENTRY_DSN"),
     traces_sample_rate=1.0,
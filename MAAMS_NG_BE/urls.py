@@ -16,6 +16,7 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
+from validator.views import MetricsView
 from drf_spectacular.views import (
     SpectacularAPIView,
     SpectacularSwaggerView,
@@ -37,4 +38,7 @@ urlpatterns = [
     # App URLs
     path('api/v1/cause/', include('cause.urls')),
     path('api/v1/question/', include('question.urls')),
+
+    # Validator telemetry for Prometheus
+    path('api/v1/metrics/', MetricsView.as_view(), name='metrics'),
 ]
\ No newline at end of file
@@ -10,4 +10,5 @@ class CreateCauseDataClass(BaseModel):
     cause: str
     status: bool
     root_status: bool
-    feedback: str
\ No newline at end of file
+    feedback: str
+    similarity: float = 0.0
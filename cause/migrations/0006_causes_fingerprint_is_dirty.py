@@ -0,0 +1,23 @@
+# Generated by Django 5.2.1 on 2026-10-17 21:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cause', '0005_alter_causes_cause'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='causes',
+            name='fingerprint',
+            field=models.CharField(blank=True, default='', max_length=64),
+        ),
+        migrations.AddField(
+            model_name='causes',
+            name='is_dirty',
+            field=models.BooleanField(default=True),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 21:43
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cause', '0006_causes_fingerprint_is_dirty'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='causes',
+            name='similarity',
+            field=models.FloatField(default=0.0),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.1 on 2026-10-17 22:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cause', '0007_causes_similarity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='causes',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
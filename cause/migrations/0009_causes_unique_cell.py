@@ -0,0 +1,46 @@
+# Generated by Django 5.2.1 on 2026-10-17 22:10
+
+from django.db import migrations, models
+
+
+def remove_duplicate_cells(apps, schema_editor):
+    """
+    Keep one cause per (question, column, row): a validated one first, then a root cause,
+    then one with text, then one with feedback. 0008 gave every existing row the same
+    updated_at, so recency cannot break ties; remaining ties keep an arbitrary row.
+    """
+    Causes = apps.get_model('cause', 'Causes')
+    duplicated = (
+        Causes.objects.filter(question__isnull=False)
+        .values('question', 'column', 'row')
+        .annotate(count=models.Count('id'))
+        .filter(count__gt=1)
+    )
+    for cell in duplicated:
+        causes = Causes.objects.filter(
+            question=cell['question'], column=cell['column'], row=cell['row']
+        ).annotate(
+            has_cause=models.Case(models.When(cause='', then=False), default=True, output_field=models.BooleanField()),
+            has_feedback=models.Case(models.When(feedback='', then=False), default=True, output_field=models.BooleanField()),
+        ).order_by('-status', '-root_status', '-has_cause', '-has_feedback', 'pk')
+        keep = causes.first()
+        causes.exclude(pk=keep.pk).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('cause', '0008_causes_updated_at'),
+    ]
+
+    operations = [
+        migrations.RunPython(remove_duplicate_cells, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='causes',
+            index=models.Index(fields=['question', 'status'], name='cause_question_status_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='causes',
+            constraint=models.UniqueConstraint(fields=('question', 'column', 'row'), name='unique_cause_cell'),
+        ),
+    ]
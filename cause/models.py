@@ -16,3 +16,20 @@ class Causes(models.Model):
     status = models.BooleanField(default=False)
     root_status = models.BooleanField(default=False)
     feedback = models.CharField(max_length=50, default='')
+    # Hash of the cause and parent texts the stored verdict was decided on
+    fingerprint = models.CharField(max_length=64, blank=True, default='')
+    # Set when the text changed since the last verdict
+    is_dirty = models.BooleanField(default=True)
+    # Highest MinHash similarity (0-1) to the parent cause or a cause in another column
+    similarity = models.FloatField(default=0.0)
+    # Bumped by every write, bulk ones included; part of the grid's version token
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            # One cause per cell; its index also serves (question, column, row) lookups
+            models.UniqueConstraint(fields=['question', 'column', 'row'], name='unique_cause_cell'),
+        ]
+        indexes = [
+            models.Index(fields=['question', 'status'], name='cause_question_status_idx'),
+        ]
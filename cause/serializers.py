@@ -2,6 +2,43 @@ import re
 from rest_framework import serializers
 from .models import Causes
 
+# Injection screen: each pattern is linear, so long inputs cannot trigger backtracking
+_SQL_TOKENS = re.compile(r"\b(?:SELECT|UNION|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|;|--)\b", re.IGNORECASE)
+_QUOTED = re.compile(r"'[^'\n]*'")
+_XSS_MARKERS = re.compile(r"onerror\s*=|javascript:", re.IGNORECASE)
+# Fragments that are dangerous when they appear in this order on one line
+_XSS_SEQUENCES = [
+    [re.compile(fragment, re.IGNORECASE) for fragment in ('<script', '>', '</script', '>')],
+    [re.compile(fragment, re.IGNORECASE) for fragment in ('<img', 'on', '=')],
+]
+
+def contains_dangerous_input(value: str) -> bool:
+    """
+    Screen free text for SQL and XSS fragments in time linear in its length.
+    Flags SQL keywords, ';' or '--' between words, two quotes on one line,
+    onerror=, javascript:, <script ...>...</script ...> and <img ... on...=.
+    """
+    if _SQL_TOKENS.search(value) or _QUOTED.search(value) or _XSS_MARKERS.search(value):
+        return True
+    if '<' not in value:
+        # Every ordered sequence opens with a tag
+        return False
+    return any(
+        _contains_in_order(line, fragments)
+        for line in value.split('\n')
+        for fragments in _XSS_SEQUENCES
+    )
+
+def _contains_in_order(line: str, fragments) -> bool:
+    # Taking the earliest occurrence of each fragment leaves the most room for the next one
+    position = 0
+    for fragment in fragments:
+        match = fragment.search(line, position)
+        if match is None:
+            return False
+        position = match.end()
+    return True
+
 class BaseCauses(serializers.Serializer):
     MODE_CHOICES = Causes.ModeChoices
 
@@ -11,26 +48,9 @@ class BaseCauses(serializers.Serializer):
     cause = serializers.CharField()
 
     def validate_cause(self, value):
-        dangerous_patterns = [
-            # SQL Injection patterns
-            r"(\b(SELECT|UNION|INSERT|UPDATE|DELETE|DROP|ALTER|CREATE|;|--)\b)",
-            r"'.*'",
-            r"'.*OR.*'",
-            r"'.*UNION.*'",
-            r"'.*DROP.*'",
-
-            # XSS patterns
-            r"<script.*?>.*?</script.*?>",
-            r"onerror\s*=",
-            r"javascript:",
-            r"<img.*?on.*?=",
-            r"<a.*?href.*?javascript:",
-        ]
-
-        for pattern in dangerous_patterns:
-            if re.search(pattern, value, re.IGNORECASE):
-                raise serializers.ValidationError("Input contains potentially dangerous SQL or XSS content.")
-                
+        if contains_dangerous_input(value):
+            raise serializers.ValidationError("Input contains potentially dangerous SQL or XSS content.")
+
         return value
 
 class CausesRequest(BaseCauses):
@@ -45,6 +65,29 @@ class CausesRequest(BaseCauses):
     column = serializers.IntegerField()
     mode = serializers.ChoiceField(choices=MODE_CHOICES)
 
+class CausesBulkItem(BaseCauses):
+    class Meta:
+        ref_name = 'CausesBulkItem'
+
+    MODE_CHOICES = Causes.ModeChoices
+
+    row = serializers.IntegerField()
+    column = serializers.IntegerField()
+    mode = serializers.ChoiceField(choices=MODE_CHOICES)
+
+class CausesBulkRequest(serializers.Serializer):
+    class Meta:
+        ref_name = 'CausesBulkRequest'
+
+    question_id = serializers.UUIDField()
+    causes = CausesBulkItem(many=True, allow_empty=False)
+
+class CausesBulkPatchItem(BaseCauses):
+    class Meta:
+        ref_name = 'CausesBulkPatchItem'
+
+    id = serializers.UUIDField()
+
 class CausesResponse(BaseCauses):
     class Meta:
         ref_name = 'CausesResponse'
@@ -55,4 +98,19 @@ class CausesResponse(BaseCauses):
     column = serializers.IntegerField()
     status = serializers.BooleanField()
     root_status = serializers.BooleanField()
-    feedback = serializers.CharField()
\ No newline at end of file
+    feedback = serializers.CharField()
+    similarity = serializers.FloatField(default=0.0)
+
+class CausesGridColumn(serializers.Serializer):
+    class Meta:
+        ref_name = 'CausesGridColumn'
+
+    column = serializers.IntegerField()
+    causes = CausesResponse(many=True)
+
+class CausesGridResponse(serializers.Serializer):
+    class Meta:
+        ref_name = 'CausesGridResponse'
+
+    question_id = serializers.UUIDField()
+    columns = CausesGridColumn(many=True)
@@ -1,7 +1,11 @@
 from typing import List
 from validator.constants import ErrorMsg
-from validator.exceptions import ForbiddenRequestException, NotFoundRequestException
+from validator.exceptions import CauseAlreadyExistsException, ForbiddenRequestException, NotFoundRequestException
 from django.core.exceptions import ObjectDoesNotExist
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+from validator.utils.prefetch import verdict_prefetcher
 from .dataclasses.create_cause import CreateCauseDataClass
 from question.models import Question
 from .models import Causes
@@ -9,13 +13,18 @@ import uuid
 
 class CausesService:
     def create(self, question_id: uuid, cause: str, row: int, column: int, mode: str) -> CreateCauseDataClass:
-        cause = Causes.objects.create(
-            question=Question.objects.get(pk=question_id),
-            row=row,
-            column=column,
-            mode=mode,
-            cause=cause
-        )
+        question = Question.objects.get(pk=question_id)
+        try:
+            with transaction.atomic():
+                cause = Causes.objects.create(
+                    question=question,
+                    row=row,
+                    column=column,
+                    mode=mode,
+                    cause=cause
+                )
+        except IntegrityError:
+            raise CauseAlreadyExistsException(ErrorMsg.CAUSE_ALREADY_EXISTS)
         return CreateCauseDataClass(
             question_id=cause.question.id,
             id=cause.id,
@@ -25,10 +34,49 @@ class CausesService:
             cause=cause.cause,
             status=cause.status,
             root_status=cause.root_status,
-            feedback = cause.feedback
+            feedback = cause.feedback,
+            similarity=cause.similarity
         )
     
 
+    def bulk_create(self, question_id: uuid, causes: List[dict]) -> List[CreateCauseDataClass]:
+        try:
+            question = Question.objects.get(pk=question_id)
+        except ObjectDoesNotExist:
+            raise NotFoundRequestException(ErrorMsg.NOT_FOUND)
+
+        try:
+            with transaction.atomic():
+                created = Causes.objects.bulk_create([
+                    Causes(
+                        question=question,
+                        row=item['row'],
+                        column=item['column'],
+                        mode=item['mode'],
+                        cause=item['cause']
+                    )
+                    for item in causes
+                ])
+        except IntegrityError:
+            # A cell in the batch, or listed twice in it, already holds a cause
+            raise CauseAlreadyExistsException(ErrorMsg.CAUSE_ALREADY_EXISTS)
+
+        return [
+            CreateCauseDataClass(
+                question_id=question.id,
+                id=cause.id,
+                row=cause.row,
+                column=cause.column,
+                mode=cause.mode,
+                cause=cause.cause,
+                status=cause.status,
+                root_status=cause.root_status,
+                feedback = cause.feedback,
+                similarity=cause.similarity
+            )
+            for cause in created
+        ]
+
     def get(self, question_id: uuid, pk: uuid) -> CreateCauseDataClass:
         try:
             cause = Causes.objects.get(pk=pk, question_id=question_id)
@@ -44,7 +92,8 @@ class CausesService:
             cause=cause.cause,
             status=cause.status,
             root_status=cause.root_status,
-            feedback = cause.feedback
+            feedback = cause.feedback,
+            similarity=cause.similarity
         )
 
     def get_list(self, question_id: uuid) -> List[CreateCauseDataClass]:
@@ -64,19 +113,48 @@ class CausesService:
                 cause=cause.cause,
                 status=cause.status,
                 root_status=cause.root_status,
-                feedback = cause.feedback
+                feedback = cause.feedback,
+                similarity=cause.similarity
             )
             for cause in causes
         ]
 
+    def get_grid(self, question_id: uuid) -> dict:
+        try:
+            question = Question.objects.get(pk=question_id)
+        except ObjectDoesNotExist:
+            raise NotFoundRequestException(ErrorMsg.NOT_FOUND)
+
+        columns = {}
+        for cause in Causes.objects.filter(question=question).order_by('column', 'row'):
+            columns.setdefault(cause.column, []).append(cause)
+
+        return {
+            'question_id': question.id,
+            'columns': [{'column': column, 'causes': rows} for column, rows in columns.items()],
+        }
+
+    def grid_version(self, question_id: uuid) -> str:
+        """Version token of a question's causes: changes whenever one is written, added or removed"""
+        version = Causes.objects.filter(question_id=question_id).aggregate(count=Count('id'), updated=Max('updated_at'))
+        updated = int(version['updated'].timestamp() * 1_000_000) if version['updated'] else 0
+        return f"{version['count']}-{updated}"
+
     def patch_cause(self, question_id: uuid, pk: uuid, cause: str) -> CreateCauseDataClass:
         try:
             causes = Causes.objects.get(question_id=question_id, pk=pk)
-            causes.cause = cause
+            text_changed = causes.cause != cause
+            if text_changed:
+                causes.cause = cause
+                causes.is_dirty = True  # The stored verdict no longer matches the text
             causes.save()
         except ObjectDoesNotExist:
             raise NotFoundRequestException(ErrorMsg.CAUSE_NOT_FOUND)
 
+        if text_changed:
+            # Warm the verdict cache for the coming validation (no-op unless enabled)
+            transaction.on_commit(lambda: verdict_prefetcher.schedule(question_id, causes.id))
+
         return CreateCauseDataClass(
             question_id=question_id,
             id=causes.id,
@@ -86,5 +164,44 @@ class CausesService:
             cause=causes.cause,
             status=causes.status,
             root_status=causes.root_status,
-            feedback = causes.feedback
-        )
\ No newline at end of file
+            feedback = causes.feedback,
+            similarity=causes.similarity
+        )
+
+    def bulk_patch(self, question_id: uuid, causes: List[dict]) -> List[CreateCauseDataClass]:
+        targets = Causes.objects.filter(question_id=question_id).in_bulk([item['id'] for item in causes])
+        if len(targets) != len({item['id'] for item in causes}):
+            raise NotFoundRequestException(ErrorMsg.CAUSE_NOT_FOUND)
+
+        changed = {}
+        now = timezone.now()
+        for item in causes:
+            target = targets[item['id']]
+            if target.cause != item['cause']:
+                target.cause = item['cause']
+                target.is_dirty = True  # The stored verdict no longer matches the text
+                target.updated_at = now  # bulk_update skips auto_now fields
+                changed[target.id] = target
+
+        if changed:
+            # A single UPDATE ... CASE statement, run atomically by bulk_update
+            Causes.objects.bulk_update(changed.values(), ['cause', 'is_dirty', 'updated_at'])
+            for cause_id in changed:
+                # Warm the verdict cache for the coming validation (no-op unless enabled)
+                transaction.on_commit(lambda cause_id=cause_id: verdict_prefetcher.schedule(question_id, cause_id))
+
+        return [
+            CreateCauseDataClass(
+                question_id=question_id,
+                id=cause.id,
+                row=cause.row,
+                column=cause.column,
+                mode=cause.mode,
+                cause=cause.cause,
+                status=cause.status,
+                root_status=cause.root_status,
+                feedback = cause.feedback,
+                similarity=cause.similarity
+            )
+            for cause in (targets[item['id']] for item in causes)
+        ]
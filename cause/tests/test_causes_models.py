@@ -1,4 +1,7 @@
-from django.test import TestCase
+from unittest import skipUnless
+from django.db import IntegrityError, connection, transaction
+from django.db.migrations.executor import MigrationExecutor
+from django.test import TestCase, TransactionTestCase
 from question.models import Question
 from ..models import Causes
 import uuid
@@ -39,3 +42,69 @@ class CausesModelTest(TestCase):
         self.assertEqual(causes.column, 1)
         self.assertEqual(causes.mode, Causes.ModeChoices.PRIBADI)
         self.assertEqual(causes.cause, 'cause')
+
+    def test_cell_holds_one_cause(self):
+        with self.assertRaises(IntegrityError), transaction.atomic():
+            Causes.objects.create(question=self.question, row=1, column=1, cause='duplicate')
+
+        # Causes without a question are not part of any grid
+        Causes.objects.create(question=None, row=1, column=1, cause='guest')
+        Causes.objects.create(question=None, row=1, column=1, cause='guest')
+
+    @skipUnless(connection.vendor == 'postgresql', 'Query plans are checked on PostgreSQL')
+    def test_grid_lookups_use_indexes(self):
+        with connection.cursor() as cursor:
+            # The table is tiny, so make the planner show which index it would pick
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+        cell_plan = Causes.objects.filter(question=self.question, column=1, row=1).explain()
+        status_plan = Causes.objects.filter(question=self.question, status=False).explain()
+
+        self.assertIn('unique_cause_cell', cell_plan)
+        self.assertIn('cause_question_status_idx', status_plan)
+
+
+class CausesDuplicateCellMigrationTest(TransactionTestCase):
+    migrate_from = [('cause', '0008_causes_updated_at')]
+    migrate_to = [('cause', '0009_causes_unique_cell')]
+
+    def tearDown(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(executor.loader.graph.leaf_nodes())
+
+    def test_keeps_validated_cause_of_duplicated_cell(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+        OldQuestion = apps.get_model('question', 'Question')
+        OldCauses = apps.get_model('cause', 'Causes')
+
+        question = OldQuestion.objects.create(question='pertanyaan')
+        OldCauses.objects.create(question=question, row=1, column=0, cause='draft')
+        validated = OldCauses.objects.create(question=question, row=1, column=0, cause='validated', status=True)
+        other = OldCauses.objects.create(question=question, row=2, column=0, cause='other')
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+
+        self.assertEqual(
+            sorted(Causes.objects.filter(question_id=question.id).values_list('pk', flat=True)),
+            sorted([validated.pk, other.pk])
+        )
+
+    def test_keeps_cause_with_text_when_no_duplicate_is_validated(self):
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_from)
+        apps = executor.loader.project_state(self.migrate_from).apps
+        OldQuestion = apps.get_model('question', 'Question')
+        OldCauses = apps.get_model('cause', 'Causes')
+
+        question = OldQuestion.objects.create(question='pertanyaan')
+        written = OldCauses.objects.create(question=question, row=1, column=0, cause='written', feedback='')
+        for _ in range(3):
+            OldCauses.objects.create(question=question, row=1, column=0, cause='', feedback='')
+
+        executor = MigrationExecutor(connection)
+        executor.migrate(self.migrate_to)
+
+        self.assertEqual(list(Causes.objects.filter(question_id=question.id).values_list('pk', flat=True)), [written.pk])
@@ -0,0 +1,72 @@
+import random
+import time
+from io import StringIO
+from django.core.management import call_command
+from django.test import SimpleTestCase
+from cause.serializers import BaseCauses, CausesBulkPatchItem, contains_dangerous_input
+from MAAMS_NG_BE.management.commands.benchmark_input_screen import ADVERSARIAL_UNITS, legacy_screen
+
+class TestInjectionScreen(SimpleTestCase):
+    def test_flags_dangerous_input(self):
+        for value in [
+            "SELECT * FROM users",
+            "a;b",
+            "x--y",
+            "nama 'budi' saja",
+            "<script>alert(1)</script>",
+            "<SCRIPT src=x>y</script >",
+            "<img src=x onerror=alert(1)>",
+            "<img src=x onload = 1>",
+            "<a href='javascript:alert(1)'>",
+            "onerror =",
+        ]:
+            with self.subTest(value=value):
+                self.assertTrue(contains_dangerous_input(value))
+
+    def test_allows_ordinary_causes(self):
+        for value in [
+            "Anggaran perbaikan jalan desa tidak mencukupi",
+            "Kepala desa's rumah",
+            "'quote\nsplit across lines'",
+            "<script>\n</script>",
+            "<img src=x>\nalt on=",
+            "selection; -- dropped",
+        ]:
+            with self.subTest(value=value):
+                self.assertFalse(contains_dangerous_input(value))
+
+    def test_matches_legacy_patterns(self):
+        fragments = ["'", "\n", "<script", "</script", ">", "<img", "on", "=", "onerror", " ", "a",
+                     "drop", "DROPS", ";", "--", "<", "/", "javascript", ":", "<a", "href", "\t"]
+        generator = random.Random(7)
+        for _ in range(20000):
+            value = ''.join(generator.choice(fragments) for _ in range(generator.randint(0, 12)))
+            self.assertEqual(contains_dangerous_input(value), legacy_screen(value), repr(value))
+
+    def test_adversarial_input_screens_in_bounded_time(self):
+        for name, unit in ADVERSARIAL_UNITS.items():
+            value = (unit * 500)[:500]
+            timings = []
+            for _ in range(5):
+                started = time.perf_counter()
+                contains_dangerous_input(value)
+                timings.append(time.perf_counter() - started)
+            with self.subTest(input=name):
+                # A linear scan of 500 characters takes well under a millisecond
+                self.assertLess(min(timings), 0.005)
+
+    def test_every_cause_serializer_uses_the_screen(self):
+        self.assertFalse(BaseCauses(data={'cause': "<script>x</script>"}).is_valid())
+        serializer = CausesBulkPatchItem(data=[{'id': '00000000-0000-0000-0000-000000000001', 'cause': "a;b"}], many=True)
+        self.assertFalse(serializer.is_valid())
+
+    def test_benchmark_reports_every_input(self):
+        out = StringIO()
+        err = StringIO()
+
+        call_command('benchmark_input_screen', '--iterations', '3', stdout=out, stderr=err)
+
+        lines = out.getvalue().splitlines()
+        self.assertIn('screen us', lines[0])
+        self.assertEqual([line.split()[0] for line in lines[1:]], list(ADVERSARIAL_UNITS))
+        self.assertEqual(err.getvalue(), '')
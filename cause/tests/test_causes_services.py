@@ -1,12 +1,15 @@
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from unittest.mock import Mock, patch
 import uuid
 
 from validator.constants import ErrorMsg
-from validator.exceptions import NotFoundRequestException
+from validator.exceptions import CauseAlreadyExistsException, NotFoundRequestException
 from django.core.exceptions import ObjectDoesNotExist
 from cause.models import Causes
 from cause.services import CausesService
+from validator.utils.cause_grid import CauseGrid
 from cause.dataclasses.create_cause import CreateCauseDataClass
 from question.models import Question
 
@@ -37,6 +40,7 @@ class TestCausesService(TestCase):
         mock_cause.status = False
         mock_cause.root_status = False
         mock_cause.feedback = ''
+        mock_cause.similarity = 0.0
 
         with patch('question.models.Question.objects.get') as mock_get_question:
             with patch('cause.models.Causes.objects.create') as mock_create_cause:
@@ -97,6 +101,113 @@ class TestCausesService(TestCase):
                         **invalid_data
                     )
 
+    def test_bulk_create_inserts_row_in_two_queries(self):
+        question = Question.objects.create(question="Test question")
+        row = [
+            {'cause': f'Cause {column}', 'row': 1, 'column': column, 'mode': 'PRIBADI'}
+            for column in range(5)
+        ]
+
+        with CaptureQueriesContext(connection) as queries:
+            result = self.service.bulk_create(question_id=question.id, causes=row)
+
+        # One question fetch and one INSERT, besides the transaction savepoint
+        statements = [q['sql'].split()[0] for q in queries.captured_queries if 'SAVEPOINT' not in q['sql']]
+        self.assertEqual(statements, ['SELECT', 'INSERT'])
+
+        self.assertEqual([cause.column for cause in result], list(range(5)))
+        self.assertTrue(all(cause.question_id == question.id for cause in result))
+        self.assertEqual(Causes.objects.filter(question=question).count(), 5)
+
+    def test_bulk_create_question_not_found(self):
+        with self.assertRaises(NotFoundRequestException) as context:
+            self.service.bulk_create(question_id=self.valid_question_id, causes=[self.valid_cause_data])
+
+        self.assertEqual(str(context.exception), ErrorMsg.NOT_FOUND)
+        self.assertFalse(Causes.objects.exists())
+
+    def test_bulk_patch_edits_grid_in_two_queries(self):
+        question = Question.objects.create(question="Test question")
+        causes = [
+            Causes.objects.create(question=question, cause=f"Cause {column}", row=1, column=column, is_dirty=False)
+            for column in range(3)
+        ]
+        edits = [
+            {'id': causes[2].id, 'cause': "Edited 2"},
+            {'id': causes[0].id, 'cause': "Edited 0"},
+            {'id': causes[1].id, 'cause': "Cause 1"},
+        ]
+
+        with self.assertNumQueries(2):
+            result = self.service.bulk_patch(question_id=question.id, causes=edits)
+
+        self.assertEqual([cause.cause for cause in result], ["Edited 2", "Edited 0", "Cause 1"])
+        stored = {cause.id: cause for cause in Causes.objects.filter(question=question)}
+        self.assertEqual(stored[causes[0].id].cause, "Edited 0")
+        self.assertTrue(stored[causes[0].id].is_dirty)
+        self.assertFalse(stored[causes[1].id].is_dirty)
+
+    def test_bulk_patch_unknown_cause_changes_nothing(self):
+        question = Question.objects.create(question="Test question")
+        other_question = Question.objects.create(question="Other question")
+        cause = Causes.objects.create(question=question, cause="Cause", row=1, column=0)
+        foreign = Causes.objects.create(question=other_question, cause="Foreign", row=1, column=0)
+
+        with self.assertRaises(NotFoundRequestException) as context:
+            self.service.bulk_patch(question_id=question.id, causes=[
+                {'id': cause.id, 'cause': "Edited"},
+                {'id': foreign.id, 'cause': "Edited"},
+            ])
+
+        self.assertEqual(str(context.exception), ErrorMsg.CAUSE_NOT_FOUND)
+        cause.refresh_from_db()
+        self.assertEqual(cause.cause, "Cause")
+
+    def test_grid_version_follows_every_write(self):
+        question = Question.objects.create(question="Test question")
+        versions = [self.service.grid_version(question.id)]
+        cause = Causes.objects.create(question=question, cause="Cause", row=1, column=0)
+        Causes.objects.create(question=question, cause="Other", row=1, column=1)
+        versions.append(self.service.grid_version(question.id))
+
+        self.service.bulk_patch(question_id=question.id, causes=[{'id': cause.id, 'cause': "Edited"}])
+        versions.append(self.service.grid_version(question.id))
+
+        grid = CauseGrid.load(question.id)
+        cause = grid.get(0, 1)
+        cause.status = True
+        grid.mark_changed(cause)
+        grid.save()
+        versions.append(self.service.grid_version(question.id))
+
+        Causes.objects.filter(pk=cause.pk).delete()
+        versions.append(self.service.grid_version(question.id))
+
+        self.assertEqual(len(set(versions)), len(versions))
+        self.assertEqual(versions[0], "0-0")
+
+    def test_create_cause_in_taken_cell(self):
+        question = Question.objects.create(question="Test question")
+        Causes.objects.create(question=question, cause="Existing", row=1, column=1)
+
+        with self.assertRaises(CauseAlreadyExistsException) as context:
+            self.service.create(question_id=question.id, **self.valid_cause_data)
+
+        self.assertEqual(str(context.exception), ErrorMsg.CAUSE_ALREADY_EXISTS)
+
+    def test_bulk_create_with_taken_cell_creates_nothing(self):
+        question = Question.objects.create(question="Test question")
+        Causes.objects.create(question=question, cause="Existing", row=1, column=2)
+        row = [
+            {'cause': f'Cause {column}', 'row': 1, 'column': column, 'mode': 'PRIBADI'}
+            for column in range(3)
+        ]
+
+        with self.assertRaises(CauseAlreadyExistsException):
+            self.service.bulk_create(question_id=question.id, causes=row)
+
+        self.assertEqual(Causes.objects.filter(question=question).count(), 1)
+
     def test_get_cause_success(self):
         # Arrange
         mock_cause = Mock(spec=Causes)
@@ -109,6 +220,7 @@ class TestCausesService(TestCase):
         mock_cause.status = False
         mock_cause.root_status = False
         mock_cause.feedback = ''
+        mock_cause.similarity = 0.42
 
         with patch('cause.models.Causes.objects.get') as mock_get_cause:
             mock_get_cause.return_value = mock_cause
@@ -123,6 +235,7 @@ class TestCausesService(TestCase):
             self.assertIsInstance(result, CreateCauseDataClass)
             self.assertEqual(result.question_id, self.valid_question_id)
             self.assertEqual(result.id, self.valid_cause_id)
+            self.assertEqual(result.similarity, 0.42)
             mock_get_cause.assert_called_once_with(
                 pk=self.valid_cause_id, 
                 question_id=self.valid_question_id
@@ -161,6 +274,7 @@ class TestCausesService(TestCase):
         mock_cause1.status = False
         mock_cause1.root_status = False
         mock_cause1.feedback = ''
+        mock_cause1.similarity = 0.0
 
         mock_cause2 = Mock(spec=Causes)
         mock_cause2.id = cause_id2
@@ -172,6 +286,7 @@ class TestCausesService(TestCase):
         mock_cause2.status = False
         mock_cause2.root_status = False
         mock_cause2.feedback = ''
+        mock_cause2.similarity = 0.87
 
         mock_causes = [mock_cause1, mock_cause2]
         mock_question = Mock(spec=Question)
@@ -191,6 +306,7 @@ class TestCausesService(TestCase):
                 self.assertIsInstance(results[1], CreateCauseDataClass)
                 self.assertEqual(results[0].id, cause_id1)
                 self.assertEqual(results[1].id, cause_id2)
+                self.assertEqual(results[1].similarity, 0.87)
                 mock_filter_causes.assert_called_once_with(question_id=self.valid_question_id)
                 mock_get_question.assert_called_once_with(pk=self.valid_question_id)
 
@@ -240,6 +356,7 @@ class TestCausesService(TestCase):
         mock_cause.status = False
         mock_cause.root_status = False
         mock_cause.feedback = ''
+        mock_cause.similarity = 0.0
 
         with patch('cause.models.Causes.objects.get') as mock_get_cause:
             mock_get_cause.return_value = mock_cause
@@ -260,6 +377,31 @@ class TestCausesService(TestCase):
             )
             self.assertTrue(mock_cause.save.called)
 
+    def test_patch_cause_marks_changed_text_dirty(self):
+        question = Question.objects.create(question="Test question")
+        cause = Causes.objects.create(question=question, cause="Old text", row=1, column=0, is_dirty=False)
+
+        self.service.patch_cause(question_id=question.id, pk=cause.pk, cause="Old text")
+        cause.refresh_from_db()
+        self.assertFalse(cause.is_dirty)
+
+        self.service.patch_cause(question_id=question.id, pk=cause.pk, cause="New text")
+        cause.refresh_from_db()
+        self.assertTrue(cause.is_dirty)
+
+    @patch('cause.services.verdict_prefetcher')
+    def test_patch_cause_schedules_prefetch_for_new_text(self, mock_prefetcher):
+        question = Question.objects.create(question="Test question")
+        cause = Causes.objects.create(question=question, cause="Old text", row=1, column=0)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.patch_cause(question_id=question.id, pk=cause.pk, cause="Old text")
+        mock_prefetcher.schedule.assert_not_called()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.service.patch_cause(question_id=question.id, pk=cause.pk, cause="New text")
+        mock_prefetcher.schedule.assert_called_once_with(question.id, cause.pk)
+
     def test_patch_cause_not_found(self):
         # Arrange
         new_cause_text = "Updated Cause Text"
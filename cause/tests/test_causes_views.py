@@ -91,6 +91,49 @@ class TestCausesPostView(TestCase):
         # Assert
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+class TestCausesBulkPostView(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = '/api/v1/cause/bulk/'
+        self.question = Question.objects.create(question="Test question")
+        self.valid_payload = {
+            'question_id': str(self.question.id),
+            'causes': [
+                {'cause': f'Cause {column}', 'row': 1, 'column': column, 'mode': 'PRIBADI'}
+                for column in range(3)
+            ]
+        }
+
+    def test_bulk_create_causes_success(self):
+        response = self.client.post(self.url, data=self.valid_payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual([cause['cause'] for cause in response.data], ['Cause 0', 'Cause 1', 'Cause 2'])
+        self.assertEqual(Causes.objects.filter(question=self.question).count(), 3)
+
+    @patch('cause.services.CausesService.bulk_create')
+    def test_bulk_create_rejects_whole_batch_on_invalid_item(self, mock_bulk_create):
+        self.valid_payload['causes'][1]['cause'] = "<script>alert(1)</script>"
+
+        response = self.client.post(self.url, data=self.valid_payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertIn('causes', response.data)
+        mock_bulk_create.assert_not_called()
+
+    def test_bulk_create_empty_list(self):
+        response = self.client.post(self.url, data={'question_id': str(self.question.id), 'causes': []}, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_question_not_found(self):
+        self.valid_payload['question_id'] = str(uuid.uuid4())
+
+        response = self.client.post(self.url, data=self.valid_payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(Causes.objects.exists())
+
 class TestCausesGetView(TestCase):
     def setUp(self):
         self.client = APIClient()
@@ -310,4 +353,85 @@ class TestCausesPatchView(TestCase):
         )
 
         # Assert
-        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
\ No newline at end of file
+        self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+
+class TestCausesBulkPatchView(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.question = Question.objects.create(question="Test question")
+        self.url = f'/api/v1/cause/patch/{self.question.id}/'
+        self.causes = [
+            Causes.objects.create(question=self.question, cause=f"Cause {column}", row=1, column=column)
+            for column in range(2)
+        ]
+
+    def test_bulk_patch_success(self):
+        payload = [{'id': str(cause.id), 'cause': f"Edited {cause.column}"} for cause in self.causes]
+
+        response = self.client.patch(self.url, data=payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([cause['cause'] for cause in response.data], ["Edited 0", "Edited 1"])
+
+    @patch('cause.services.CausesService.bulk_patch')
+    def test_bulk_patch_invalid_item(self, mock_bulk_patch):
+        payload = [
+            {'id': str(self.causes[0].id), 'cause': "Edited"},
+            {'id': str(self.causes[1].id), 'cause': "x' OR '1'='1"},
+        ]
+
+        response = self.client.patch(self.url, data=payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        mock_bulk_patch.assert_not_called()
+
+    def test_bulk_patch_cause_not_found(self):
+        payload = [{'id': str(uuid.uuid4()), 'cause': "Edited"}]
+
+        response = self.client.patch(self.url, data=payload, format='json')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+class TestCausesGridView(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.question = Question.objects.create(question="Test question")
+        self.url = f'/api/v1/cause/grid/{self.question.id}/'
+        for column, row in [(1, 2), (0, 1), (1, 1)]:
+            Causes.objects.create(question=self.question, cause=f"Cause {column}{row}", row=row, column=column)
+
+    def test_grid_groups_causes_by_column_and_row(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['ETag'].startswith('"3-'))
+        self.assertEqual(
+            [(column['column'], [cause['cause'] for cause in column['causes']]) for column in response.data['columns']],
+            [(0, ["Cause 01"]), (1, ["Cause 11", "Cause 12"])]
+        )
+
+    def test_unchanged_grid_answers_304_with_one_query(self):
+        etag = self.client.get(self.url)['ETag']
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response['ETag'], etag)
+        self.assertFalse(response.content)
+
+    def test_edit_changes_the_etag(self):
+        etag = self.client.get(self.url)['ETag']
+        cause = Causes.objects.get(question=self.question, column=0, row=1)
+        self.client.patch(f'/api/v1/cause/patch/{self.question.id}/{cause.id}/', data={'cause': "Edited"}, format='json')
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['columns'][0]['causes'][0]['cause'], "Edited")
+
+    def test_grid_question_not_found(self):
+        response = self.client.get(f'/api/v1/cause/grid/{uuid.uuid4()}/')
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
@@ -1,19 +1,27 @@
 from django.urls import path
 
 from .views import (
+    CausesBulkPost,
     CausesGet,
     CausesPatch,
     CausesPost,
 )
 
 from validator.views import (
-    ValidateView
+    ValidateStreamView,
+    ValidateView,
+    ValidationJobView,
 )
 
 urlpatterns = [
     path('', CausesPost.as_view(), name="create_causes"),
+    path('bulk/', CausesBulkPost.as_view(), name="bulk_create_causes"),
+    path('grid/<uuid:question_id>/', CausesGet.as_view({ 'get': 'get_grid' }), name="get_causes_grid"),
     path('<uuid:question_id>/', CausesGet.as_view({ 'get': 'get_list' }), name="get_causes_list"),
     path('<uuid:question_id>/<uuid:pk>/', CausesGet.as_view({ 'get': 'get' }), name="get_causes"),
+    path('patch/<uuid:question_id>/', CausesPatch.as_view({'patch': 'bulk_patch'}), name="bulk_patch_causes"),
     path('patch/<uuid:question_id>/<uuid:pk>/', CausesPatch.as_view({'patch': 'patch_cause'}), name="patch_causes"),
     path('validate/<uuid:question_id>/', ValidateView.as_view(), name="validate_causes"),
+    path('validate/stream/<uuid:question_id>/', ValidateStreamView.as_view(), name="validate_causes_stream"),
+    path('validate/jobs/<uuid:job_id>/', ValidationJobView.as_view(), name="validation_job_status"),
 ]
\ No newline at end of file
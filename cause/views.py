@@ -2,11 +2,12 @@ from rest_framework.views import APIView
 from rest_framework.viewsets import ViewSet
 from rest_framework.response import Response
 from cause.services import CausesService
-from cause.serializers import BaseCauses, CausesRequest, CausesResponse
+from cause.serializers import BaseCauses, CausesBulkPatchItem, CausesBulkRequest, CausesGridResponse, CausesRequest, CausesResponse
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
 from rest_framework.decorators import permission_classes
 from rest_framework.permissions import AllowAny
+from django.utils.http import parse_etags, quote_etag
 
 @permission_classes([AllowAny])
 class CausesPost(APIView):
@@ -23,6 +24,21 @@ class CausesPost(APIView):
 
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+@permission_classes([AllowAny])
+class CausesBulkPost(APIView):
+    @extend_schema(
+        description='Request and Response data for creating several causes of a question at once, e.g. a whole row',
+        request=CausesBulkRequest,
+        responses=CausesResponse(many=True),
+    )
+    def post(self, request):
+        request_serializer = CausesBulkRequest(data=request.data)
+        request_serializer.is_valid(raise_exception=True)
+        causes = CausesService.bulk_create(self=CausesService, **request_serializer.validated_data)
+        response_serializer = CausesResponse(causes, many=True)
+
+        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+
 @permission_classes([AllowAny])
 class CausesGet(ViewSet):
     @extend_schema(
@@ -45,6 +61,24 @@ class CausesGet(ViewSet):
 
         return Response(serializer.data)
 
+    @extend_schema(
+        description='Causes of a question grouped by column and ordered by row. '
+                    'Send the returned ETag as If-None-Match to get 304 while nothing changed',
+        responses={200: CausesGridResponse, 304: None},
+    )
+    def get_grid(self, request, question_id):
+        etag = quote_etag(CausesService.grid_version(self=CausesService, question_id=question_id))
+        headers = {'ETag': etag, 'Cache-Control': 'no-cache'}
+
+        if_none_match = parse_etags(request.headers.get('If-None-Match', ''))
+        if etag in if_none_match or '*' in if_none_match:
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+        grid = CausesService.get_grid(self=CausesService, question_id=question_id)
+        serializer = CausesGridResponse(grid)
+
+        return Response(serializer.data, headers=headers)
+
 @permission_classes([AllowAny])
 class CausesPatch(ViewSet):
     @extend_schema(
@@ -58,4 +92,17 @@ class CausesPatch(ViewSet):
         cause = CausesService.patch_cause(self=CausesService, question_id=question_id, pk=pk, **request_serializer.validated_data)
         response_serializer = CausesResponse(cause)
 
+        return Response(response_serializer.data)
+
+    @extend_schema(
+        description='Request and Response data for updating several causes of a question in one request',
+        request=CausesBulkPatchItem(many=True),
+        responses=CausesResponse(many=True),
+    )
+    def bulk_patch(self, request, question_id):
+        request_serializer = CausesBulkPatchItem(data=request.data, many=True, allow_empty=False)
+        request_serializer.is_valid(raise_exception=True)
+        causes = CausesService.bulk_patch(self=CausesService, question_id=question_id, causes=request_serializer.validated_data)
+        response_serializer = CausesResponse(causes, many=True)
+
         return Response(response_serializer.data)
\ No newline at end of file
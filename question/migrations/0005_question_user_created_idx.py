@@ -0,0 +1,20 @@
+# Generated by Django 5.2.1 on 2026-10-17 22:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('question', '0004_alter_question_created_at'),
+        ('tag', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='question',
+            index=models.Index(fields=['user', '-created_at'], name='question_user_created_idx'),
+        ),
+    ]
@@ -9,6 +9,10 @@ class Question(models.Model):
     class Meta:
         app_label = 'question'
         db_table = 'question_question'
+        indexes = [
+            # History pages are a user's questions, newest first
+            models.Index(fields=['user', '-created_at'], name='question_user_created_idx'),
+        ]
         
     class ModeChoices(models.TextChoices):
         PRIBADI = "PRIBADI", "pribadi"
@@ -111,6 +111,8 @@ class QuestionService():
         questions = (
             Question.objects
             .filter(user_filter & clause & time)
+            .select_related('user')
+            .prefetch_related('tags')
             .order_by('-created_at')
             .distinct()
         )
@@ -124,7 +126,15 @@ class QuestionService():
         today_datetime = datetime.now(dt_timezone.utc) + timedelta(hours=7)
         last_week_datetime = today_datetime - timedelta(days=7)
         time = self._resolve_time_range(time_range.lower(), today_datetime, last_week_datetime)
-        questions = Question.objects.filter(user=user).filter(time).order_by('-created_at').distinct()
+        questions = (
+            Question.objects
+            .filter(user=user)
+            .filter(time)
+            .select_related('user')
+            .prefetch_related('tags')
+            .order_by('-created_at')
+            .distinct()
+        )
         return questions
     
     def get_field_values(self, user: CustomUser) -> FieldValuesDataClass:
@@ -133,7 +143,7 @@ class QuestionService():
         """
         is_admin = user.role == 'admin'
 
-        questions = Question.objects.all()
+        questions = Question.objects.select_related('user').prefetch_related('tags')
 
         values = {
             "judul": set(),
@@ -180,7 +190,14 @@ class QuestionService():
 
         # hanya ambil pertanyaan mode PENGAWASAN + klausa filter lainnya
         mode = Q(mode=Question.ModeChoices.PENGAWASAN)
-        questions = Question.objects.filter(mode & clause).order_by('-created_at').distinct()
+        questions = (
+            Question.objects
+            .filter(mode & clause)
+            .select_related('user')
+            .prefetch_related('tags')
+            .order_by('-created_at')
+            .distinct()
+        )
 
         return questions
 
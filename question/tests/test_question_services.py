@@ -4,6 +4,7 @@ from validator.constants import ErrorMsg
 from django.test import TestCase
 from unittest.mock import Mock, patch
 from question.models import Question 
+from question.serializers import QuestionResponse
 from question.services import QuestionService
 import uuid
 from django.core.exceptions import ObjectDoesNotExist
@@ -730,6 +731,38 @@ class TestQuestionService(TestCase):
 
         self.assertIn("adminuser", result.pengguna)
 
+    def test_history_pages_serialize_in_fixed_queries(self):
+        admin_user = CustomUser.objects.create(username="admin", email="admin@example.com", role="admin")
+        for index in range(5):
+            question = Question.objects.create(
+                title=f"Pengawasan {index}",
+                question=f"Pertanyaan {index}",
+                mode=Question.ModeChoices.PENGAWASAN,
+                user=self.user,
+            )
+            question.tags.add(self.tag, Tag.objects.create(name=f"tag{index}"))
+
+        listings = {
+            'get_all': lambda: self.service.get_all(user=self.user, time_range='last_week'),
+            'get_matched': lambda: self.service.get_matched(q_filter='semua', user=self.user, time_range='last_week', keyword='Pertanyaan'),
+            'get_privileged': lambda: self.service.get_privileged(q_filter='semua', user=admin_user, keyword=''),
+        }
+        for name, listing in listings.items():
+            with self.subTest(listing=name):
+                # One query for the questions and their users, one for the tags
+                with self.assertNumQueries(2):
+                    data = QuestionResponse(listing(), many=True).data
+                self.assertGreaterEqual(len(data), 5)
+                self.assertTrue(all(item['username'] == self.user.username for item in data))
+
+    def test_get_field_values_queries_do_not_grow_with_questions(self):
+        for index in range(5):
+            question = Question.objects.create(title=f"Judul {index}", question="Pertanyaan", user=self.user)
+            question.tags.add(self.tag)
+
+        with self.assertNumQueries(2):
+            self.service.get_field_values(self.user_admin)
+
     def test_get_privileged_defaults_to_semua_and_empty_keyword(self):
         admin = CustomUser.objects.create_user(username="adminuser", email='adminuser@gmail.com', role="admin", password="pass")
         with patch.object(self.service, '_resolve_filter_type') as mock_resolve:
@@ -1,4 +1,9 @@
-from django.test import TestCase
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from rest_framework.test import APIClient
 from rest_framework import status
@@ -756,6 +761,57 @@ class TestQuestionGetAll(TestCase):
             self.assertEqual(response.data['results'][0]['question'], question1.question)
             self.assertEqual(response.data['results'][1]['question'], question2.question)
 
+    def _create_history(self, count):
+        tag = Tag.objects.get_or_create(name="sejarah")[0]
+        for index in range(count):
+            question = Question.objects.create(
+                title=f"Question {index}",
+                question=f"Content {index}",
+                mode=Question.ModeChoices.PRIBADI,
+                user=self.user
+            )
+            question.tags.add(tag)
+
+    def test_page_cost_does_not_grow_with_history(self):
+        """Only the requested page is fetched and serialized"""
+        self._create_history(8)
+        with CaptureQueriesContext(connection) as small:
+            response = self.client.get(self.url, {'time_range': 'last_week', 'count': 3})
+        self.assertEqual(response.data['count'], 8)
+
+        self._create_history(40)
+        to_representation = QuestionResponse.to_representation
+        with CaptureQueriesContext(connection) as large, \
+                patch.object(QuestionResponse, 'to_representation', autospec=True, side_effect=to_representation) as serialized:
+            response = self.client.get(self.url, {'time_range': 'last_week', 'count': 3, 'p': 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(serialized.call_count, 3)
+        self.assertEqual(response.data['count'], 48)
+        self.assertEqual(len(response.data['results']), 3)
+        self.assertEqual(response.data['results'][0]['tags'], ["sejarah"])
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+class TestHistoryBenchmark(TestCase):
+    def test_reports_latency_per_history_size(self):
+        out = StringIO()
+
+        call_command('benchmark_history', '--sizes', '4', '--iterations', '2', '--page-size', '2', '--allow-writes', stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertIn('p50 ms', lines[0])
+        self.assertEqual(lines[1].split()[0], '4')
+        # Nothing is left behind
+        self.assertFalse(Question.objects.exists())
+        self.assertFalse(CustomUser.objects.filter(username__startswith='benchmark-').exists())
+
+    @override_settings(DEBUG=False)
+    def test_refuses_to_write_without_allow_writes(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_history', '--sizes', '4', stdout=StringIO())
+
+        self.assertFalse(CustomUser.objects.filter(username__startswith='benchmark-').exists())
+
 class TestQuestionGetFieldValues(TestCase):
     def setUp(self):
         self.client = APIClient()
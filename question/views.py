@@ -120,12 +120,12 @@ class QuestionGetMatched(APIView):
                                            time_range=time_range, 
                                            keyword=keyword)
 
-            serializer = QuestionResponse(questions, many=True)
-
+            # Slice the page in SQL and serialize only its rows
             paginator = self.pagination_class
-            page = paginator.paginate_queryset(serializer.data, request)
+            page = paginator.paginate_queryset(questions, request)
+            serializer = QuestionResponse(page, many=True)
 
-            return paginator.get_paginated_response(page)
+            return paginator.get_paginated_response(serializer.data)
 
         except Exception as e:
             return Response(
@@ -162,10 +162,10 @@ class QuestionGetAll(APIView):
         try:
             time_range = request.query_params.get('time_range')
             questions = self.service_class.get_all(user=request.user, time_range=time_range)
-            serializer = QuestionResponse(questions, many=True)
             paginator = self.pagination_class
-            page = paginator.paginate_queryset(serializer.data, request)
-            return paginator.get_paginated_response(page)
+            page = paginator.paginate_queryset(questions, request)
+            serializer = QuestionResponse(page, many=True)
+            return paginator.get_paginated_response(serializer.data)
         except Exception as e:
             return Response({'detail': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
@@ -248,12 +248,12 @@ class QuestionGetPrivileged(APIView):
                 keyword=keyword
             )
 
-            serializer = QuestionResponse(questions, many=True)
-
+            # Slice the page in SQL and serialize only its rows
             paginator = self.pagination_class
-            page = paginator.paginate_queryset(serializer.data, request)
+            page = paginator.paginate_queryset(questions, request)
+            serializer = QuestionResponse(page, many=True)
 
-            return paginator.get_paginated_response(page)
+            return paginator.get_paginated_response(serializer.data)
 
         except Exception as e:
             return Response(
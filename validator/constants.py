@@ -1,6 +1,8 @@
 class ErrorMsg:
     NOT_FOUND = "Analisis tidak ditemukan"
     CAUSE_NOT_FOUND = "Sebab tidak ditemukan"
+    CAUSE_ALREADY_EXISTS = "Sel ini sudah berisi sebab"
+    JOB_NOT_FOUND = "Proses validasi tidak ditemukan"
     FORBIDDEN_GET = "Pengguna tidak diizinkan untuk melihat analisis ini."
     FORBIDDEN_UPDATE = "Pengguna tidak diizinkan untuk mengubah analisis ini."
     FORBIDDEN_DELETE = "Pengguna tidak diizinkan untuk menghapus analisis ini."
@@ -14,6 +16,7 @@ class ErrorMsg:
     AI_SERVICE_ERROR = "Failed to call the AI service."
     EMPTY_KEYWORD = "Keyword tidak boleh kosong."
     RATE_LIMIT_EXCEEDED = "Jumlah request melebihi batas. Silahkan tunggu beberapa saat."
+    VALIDATION_IN_PROGRESS = "Analisis ini sedang divalidasi. Silahkan coba beberapa saat lagi."
     
 class FeedbackMsg:
     # Root Cause Messages
@@ -23,4 +26,7 @@ class FeedbackMsg:
     FALSE_ROW_1_NOT_CAUSE = "Sebab {column}1 bukan merupakan sebab dari pertanyaan"
     FALSE_ROW_N_NOT_CAUSE = "Sebab {column}{row} bukan merupakan sebab dari {column}{prev_row}"
     FALSE_ROW_N_POSITIVE_NEUTRAL = "Sebab {column}{row} merupakan sebab positif atau netral"
-    FALSE_ROW_N_SIMILAR_PREVIOUS = "Sebab {column}{row} mirip dengan sebab sebelumnya"
\ No newline at end of file
+    FALSE_ROW_N_SIMILAR_PREVIOUS = "Sebab {column}{row} mirip dengan sebab sebelumnya"
+
+    # Pending Messages
+    NOT_VALIDATED = "Sebab {column}{row} belum tervalidasi, coba lagi"
\ No newline at end of file
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Literal, Optional
+
+
+class CauseVerdictDataClass(BaseModel):
+    id: int
+    valid: bool
+    root: bool = False
+    category: Optional[Literal[1, 2, 3]] = None  # 1 Harta, 2 Tahta, 3 Cinta
+    feedback_type: Optional[Literal[1, 2, 3]] = None  # 1 not the cause, 2 positive/neutral, 3 similar to previous
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+from typing import Literal
+
+
+class BooleanVerdictDataClass(BaseModel):
+    verdict: bool
+
+
+class ChoiceVerdictDataClass(BaseModel):
+    verdict: Literal[1, 2, 3]
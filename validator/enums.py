@@ -5,6 +5,7 @@ class ValidationType(Enum):
     ROOT = 'root'
     FALSE = 'false'
     ROOT_TYPE = 'root_type'
+    BATCH = 'batch'
 
 class FilterType(Enum):
     SEMUA = 'semua'
@@ -25,6 +25,12 @@ class ForbiddenRequestException(APIException):
 class NotFoundRequestException(APIException):
     status_code = status.HTTP_404_NOT_FOUND
 
+class CauseAlreadyExistsException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+
+class ValidationInProgressException(APIException):
+    status_code = status.HTTP_409_CONFLICT
+
 class RateLimitExceededException(APIException):
     status_code = status.HTTP_429_TOO_MANY_REQUESTS
 
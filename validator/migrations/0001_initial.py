@@ -0,0 +1,34 @@
+# Generated by Django 5.2.1 on 2026-10-17 21:13
+
+import django.db.models.deletion
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('question', '0004_alter_question_created_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ValidationJob',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, primary_key=True, serialize=False)),
+                ('status', models.CharField(choices=[('PENDING', 'pending'), ('RUNNING', 'running'), ('SUCCEEDED', 'succeeded'), ('FAILED', 'failed')], default='PENDING', max_length=20)),
+                ('total', models.IntegerField(default=0)),
+                ('progress', models.IntegerField(default=0)),
+                ('error', models.TextField(blank=True, default='')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('question', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='validation_jobs', to='question.question')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['status', 'created_at'], name='validator_v_status_9ed347_idx')],
+            },
+        ),
+    ]
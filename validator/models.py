@@ -0,0 +1,25 @@
+from django.db import models
+import uuid
+from question.models import Question
+
+class ValidationJob(models.Model):
+    class StatusChoices(models.TextChoices):
+        PENDING = "PENDING", "pending"
+        RUNNING = "RUNNING", "running"
+        SUCCEEDED = "SUCCEEDED", "succeeded"
+        FAILED = "FAILED", "failed"
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4)
+    question = models.ForeignKey(Question, on_delete=models.CASCADE, related_name='validation_jobs')
+    status = models.CharField(max_length=20, choices=StatusChoices.choices, default=StatusChoices.PENDING)
+    total = models.IntegerField(default=0)  # causes waiting for validation when the job was queued
+    progress = models.IntegerField(default=0)  # causes decided so far
+    error = models.TextField(default='', blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['status', 'created_at']),
+        ]
@@ -0,0 +1,22 @@
+from rest_framework import serializers
+from cause.serializers import CausesResponse
+
+class ValidationJobResponse(serializers.Serializer):
+    class Meta:
+        ref_name = 'ValidationJobResponse'
+
+    id = serializers.UUIDField()
+    question_id = serializers.UUIDField()
+    status = serializers.CharField()
+    total = serializers.IntegerField()
+    progress = serializers.IntegerField()
+    error = serializers.CharField(allow_blank=True)
+    created_at = serializers.DateTimeField()
+    started_at = serializers.DateTimeField(allow_null=True)
+    finished_at = serializers.DateTimeField(allow_null=True)
+
+class ValidationJobStatusResponse(ValidationJobResponse):
+    class Meta:
+        ref_name = 'ValidationJobStatusResponse'
+
+    causes = CausesResponse(many=True, required=False)
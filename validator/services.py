@@ -1,120 +1,104 @@
+import hashlib
+import logging
 import uuid
+from datetime import timedelta
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from django.conf import settings
-from groq import Groq
-import requests
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models import F
+from django.utils import timezone
 from django.core.cache import cache
 from validator.constants import ErrorMsg, FeedbackMsg
 from validator.enums import ValidationType
 from question.models import Question
 from cause.models import Causes
-from validator.exceptions import AIServiceErrorException, RateLimitExceededException
-# from arize.otel import register
-from openinference.instrumentation.groq import GroqInstrumentor
+from validator.exceptions import NotFoundRequestException, ValidationInProgressException
+from validator.models import ValidationJob
+from validator.utils.cause_grid import CauseGrid
+from validator.utils.batch_verdicts import dump_batch_verdicts, parse_batch_verdicts
+from validator.utils.llm_backends import LLMBackend, LLMRouter, get_backend
+from validator.utils.prompts import PromptBuilder, TokenUsage, count_tokens, prompt_metrics
+from validator.utils.question_lock import QuestionLock
+from validator.utils.resilience import groq_resilience
+from validator.utils.rule_classifier import NOT_THE_CAUSE, SIMILAR_TO_PREVIOUS, rule_classifier
+from validator.utils.similarity import SimilarityIndex
+from validator.utils.telemetry import telemetry
+from validator.utils.verdict_cache import verdict_cache
+from validator.utils.verdict_parser import verdict_parser
 
-# tracer_provider = register(
-#     space_id = settings.ARIZE_SPACE_ID,
-#     api_key = settings.ARIZE_API_KEY,
-#     project_name = "MAAMS NG"
-# )
-# GroqInstrumentor().instrument(tracer_provider=tracer_provider)
+logger = logging.getLogger(__name__)
 
 class CausesService:
-    def api_call(self, system_message: str, user_prompt: str, validation_type: ValidationType, request=None) -> int:
-        client = Groq(api_key=settings.GROQ_API_KEY)
-        
-        try:
-            chat_completion = client.chat.completions.create(
-                messages=[
-                    {
-                        "role": "system",
-                        "content": system_message,
-                    },
-                    {
-                        "role": "user",
-                        "content": user_prompt
-                    }
-                ],
-                model="deepseek-r1-distill-llama-70b",
-                temperature=0.6,
-                top_p=0.95,
-                stream=False,
-                reasoning_format="hidden",
-                seed=42
-            )
-            
-            answer = chat_completion.choices[0].message.content
-        
-        except requests.exceptions.RequestException:
-            raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
-        
-        if validation_type in [ValidationType.NORMAL, ValidationType.ROOT]:
-            if answer.lower().__contains__('true'):
-                return 1
-            elif answer.lower().__contains__('false'):
-                return 0
-        else:
-            if answer.__contains__('1'):
-                return 1
-            elif answer.__contains__('2'):
-                return 2
-            elif answer.__contains__('3'):  
-                return 3
-
-        return 0
-    
+    def __init__(self, on_cause_decided=None, backend: LLMBackend | None = None):
+        # Chat model answering the prompts; Groq unless VALIDATOR['LLM_BACKEND'] says otherwise
+        self.backend = backend or get_backend()
+        # Optional callback invoked with each cause as soon as its verdict is decided
+        self.on_cause_decided = on_cause_decided
+        # In-memory index of the causes of the question being validated
+        self.grid = None
+        # MinHash index over the causes of self.grid, built on first use
+        self.similarity_index = None
+        self._similarity_grid = None
+        # Prompts sent and their estimated tokens for the current validation
+        self.prompts = PromptBuilder()
+        self.token_usage = TokenUsage()
+
+    def api_call(self, system_message: str, user_prompt: str, validation_type: ValidationType, request=None) -> int | None:
+        """Ask the LLM one verdict. Returns None when its answer cannot be read as a verdict."""
+        with telemetry.span('api_call', validation_type=validation_type.value, model=self.backend.model_for(validation_type)) as span:
+            # The prompts ask for a JSON verdict in this mode, so the answer can be parsed strictly
+            structured_output = self.prompts.structured_output()
+
+            # Identical prompts always get the same verdict (fixed model and seed), so reuse it
+            cache_key = verdict_cache.make_key(self.backend.model_for(validation_type), system_message, user_prompt, validation_type)
+            cached_verdict = verdict_cache.get(cache_key)
+            if cached_verdict is not None:
+                span.set(cache_hit=True, verdict=cached_verdict)
+                return cached_verdict
+
+            span.set(prompt_tokens=self._count_tokens(system_message, user_prompt))
+            answer = self._chat(system_message, user_prompt, validation_type, json_output=structured_output)
+            span.set(completion_tokens=count_tokens(answer))
+
+            verdict = verdict_parser.parse(answer, validation_type)
+            span.set(verdict='unparsed' if verdict is None else verdict)
+            if verdict is None:
+                return None
+
+            verdict_cache.set(cache_key, verdict)
+            return verdict
+
+    def _chat(self, system_message: str, user_prompt: str, validation_type: ValidationType, json_output: bool = False) -> str:
+        """
+        Send one system/user prompt pair to the LLM backend and return the raw answer.
+        With json_output the model is constrained to answer with a JSON object.
+        """
+        return self.backend.chat(system_message, user_prompt, validation_type, json_output=json_output)
+
+    def _count_tokens(self, system_message: str, user_prompt: str) -> int:
+        """Record and return the estimated tokens of a prompt that is actually sent to the backend"""
+        tokens = count_tokens(system_message) + count_tokens(user_prompt)
+        self.token_usage.add(tokens)
+        prompt_metrics.add(tokens)
+        return tokens
+
     def check_if_corruption_related(self, cause_text: str) -> bool:
         """Check if the cause text contains corruption-related terms"""
-        corruption_terms = [
-            'korupsi', 'suap', 'sogok', 'pungli', 'pungutan liar',
-            'penyalahgunaan wewenang', 'nepotisme', 'kolusi',
-            'gratifikasi', 'pemalsuan', 'penggelapan', 'penyelewengan',
-            'pemerasan', 'mark up', 'penyimpangan'
-        ]
+        return rule_classifier.is_corruption_related(cause_text)
 
-        cause_lower = cause_text.lower()
-        
-        for term in corruption_terms:
-            if term in cause_lower:
-                return True
-        
-        return False
-            
-    def retrieve_feedback(self, cause: Causes, problem: Question, prev_cause: None|Causes, request):
-        retrieve_feedback_user_prompt = ""
-        retrieve_feedback_system_message = (
-            "You are an AI model analyzing cause-and-effect relationships in a root cause analysis procedure. When evaluating causes, consider that: "
-            "1) Some causes may appear similar to causes in other columns as we get deeper in the analysis "
-            "2) Causes should be specific to their parent cause in the same column, not from other columns "
-            "3) As analysis progresses, causes often converge toward common root issues "
-            "4) Each column represents an independent causal chain that may eventually converge "
-            "5) The 'previous cause' refers to the immediate parent cause in the same column (e.g., A2 is the previous cause for A3)"
-            "Please respond only with numerical codes as specified in the user prompt."
-        )
-        
-        if prev_cause:
-            retrieve_feedback_user_prompt = (
-                f"'{cause.cause}' is the FALSE cause for '{prev_cause.cause}' (in column {'ABCDE'[cause.column]}, row {cause.row}, "
-                f"with previous cause in row {cause.row - 1}). "
-                "Now determine if it is false because it is NOT THE CAUSE, because it is a POSITIVE OR NEUTRAL cause, or because it is SIMILAR TO THE PREVIOUS cause. "
-                "Remember that 'previous cause' refers to the cause directly above in the same column, not from other columns. "
-                "Answer ONLY WITH '1' if it is NOT THE CAUSE,  "
-                "ONLY WITH '2' if it is POSITIVE OR NEUTRAL, or "
-                "ONLY WITH '3' if it is SIMILAR TO THE PREVIOUS cause."
-            )   
-        else:
-            retrieve_feedback_user_prompt = (
-                f"'{cause.cause}' is the FALSE cause for this question '{problem.question}' (in column {'ABCDE'[cause.column]}, first row). "
-                "Now determine if it is false because it is NOT THE CAUSE or because it is a POSITIVE OR NEUTRAL CAUSE. "
-                "Answer ONLY with '1' if it is NOT THE CAUSE, '2' if it is POSITIVE OR NEUTRAL."
-            )
-            retrieve_feedback_system_message = (
-                "You are an AI model analyzing the first level of causes in a root cause analysis. "
-                "You are asked to determine the relationship between problem and cause. "
-                "Please respond ONLY WITH '1' if the cause is NOT THE CAUSE of the question, ONLY WITH '2' if the cause is positive or neutral"
-            )
-        
-        feedback_type = self.api_call(system_message=retrieve_feedback_system_message, user_prompt=retrieve_feedback_user_prompt, validation_type=ValidationType.FALSE, request=request)
-            
+    def _rules_enabled(self) -> bool:
+        """Whether obvious verdicts are decided by rule_classifier instead of the LLM."""
+        return getattr(settings, 'VALIDATOR', {}).get('RULES', {}).get('ENABLED', True)
+
+    def retrieve_feedback(self, cause: Causes, problem: Question, prev_cause: None|Causes, request) -> bool:
+        """Set the feedback of an invalid cause. Returns False when the LLM answer could not be read."""
+        system_message, user_prompt = self.prompts.false_feedback(cause, problem, prev_cause)
+        feedback_type = self.api_call(system_message=system_message, user_prompt=user_prompt, validation_type=ValidationType.FALSE, request=request)
+        self._apply_false_feedback(cause, prev_cause, feedback_type)
+        return feedback_type is not None
+
+    def _apply_false_feedback(self, cause: Causes, prev_cause: None|Causes, feedback_type: int):
+        """Set the feedback message of an invalid cause from its feedback type."""
         if feedback_type == 1 and prev_cause:
             cause.feedback = FeedbackMsg.FALSE_ROW_N_NOT_CAUSE.format(column='ABCDE'[cause.column], row=cause.row, prev_row=cause.row-1)
         elif feedback_type == 1:
@@ -130,35 +114,123 @@ class CausesService:
     def validate(self, question_id: uuid, request):
         """
         Validate all unvalidated causes for a question.
-        Returns the list of validated causes.
+        Returns the list of validated causes. Only one run per question happens at a
+        time: a request arriving during a run waits for it and returns its result.
         """
+        lock = QuestionLock(question_id)
+        if not lock.acquire():
+            return self._await_running_validation(lock, question_id)
+
+        try:
+            return self._validate(question_id, request)
+        finally:
+            lock.release()
+
+    def _await_running_validation(self, lock: QuestionLock, question_id: uuid):
+        """Wait for the run holding the lock and return the causes it decided."""
+        wait_timeout = getattr(settings, 'VALIDATOR', {}).get('LOCK', {}).get('WAIT_TIMEOUT', 120)
+        if not lock.acquire(timeout=wait_timeout):
+            raise ValidationInProgressException(ErrorMsg.VALIDATION_IN_PROGRESS)
+        lock.release()
+
+        logger.info("Coalesced validation of question %s into the run in flight", question_id)
+        self.grid = CauseGrid.load(question_id)
+        return self.grid.causes()
+
+    def _validate(self, question_id: uuid, request):
+        # Load the whole grid once; every decision below is made in memory
+        self.grid = CauseGrid.load(question_id)
+        self.token_usage.clear()
+
         # Get all causes that need validation (all those with status=False)
-        unvalidated_causes = Causes.objects.filter(question_id=question_id, status=False)
+        unvalidated_causes = self.grid.pending()
         
         # If no causes need validation, return all causes for the question
-        if not unvalidated_causes.exists():
-            return Causes.objects.filter(question_id=question_id).order_by('column', 'row')
+        if not unvalidated_causes:
+            return self.grid.causes()
         
         problem = Question.objects.get(pk=question_id)
         
-        # First validate row 1 across all columns
-        self._validate_first_row_causes(unvalidated_causes, problem, request)
-        
-        # Then proceed column by column
-        self._validate_remaining_causes_by_column(unvalidated_causes, question_id, problem, request)
-        
-        # Create or ensure rows exist for active columns with valid previous rows
-        self._ensure_next_rows_exist(question_id)
+        try:
+            # First validate row 1 across all columns
+            self._validate_first_row_causes(unvalidated_causes, problem, request)
+            
+            # Then proceed column by column
+            self._validate_remaining_causes_by_column(unvalidated_causes, question_id, problem, request)
+            
+            # Create or ensure rows exist for active columns with valid previous rows
+            self._ensure_next_rows_exist(question_id)
+        finally:
+            # Persist every decided cause in one transaction, even if a later step failed
+            self.grid.save()
+            usage = self.token_usage.stats()
+            logger.info("Validated question %s with %d prompts, ~%d tokens sent", question_id, usage['prompts'], usage['tokens'])
         
         # Return all causes for the question, including newly validated ones
-        return Causes.objects.filter(question_id=question_id).order_by('column', 'row')
+        return self.grid.causes()
+
+    def _grid_for(self, question_id) -> CauseGrid:
+        """Return the cause grid of a question, loading it on first use."""
+        if self.grid is None or str(self.grid.question_id) != str(question_id):
+            self.grid = CauseGrid.load(question_id)
+        return self.grid
 
     def _validate_first_row_causes(self, unvalidated_causes, problem, request):
-        """Validate all causes in the first row across all columns."""
-        row1_causes = unvalidated_causes.filter(row=1).order_by('column')
+        """
+        Validate all causes in the first row across all columns.
+        Row 1 causes only depend on the question, so their LLM chains run
+        concurrently and the results are written back with the rest of the grid.
+        """
+        row1_causes = sorted(
+            (
+                cause for cause in unvalidated_causes
+                if cause.row == 1 and cause.cause and cause.cause.strip()  # Only validate non-empty causes
+            ),
+            key=lambda cause: cause.column
+        )
+
+        # Causes unchanged since their last verdict keep their stored feedback
+        changed_causes = []
         for cause in row1_causes:
-            if cause.cause and cause.cause.strip():  # Only validate non-empty causes
-                self._validate_single_cause(cause, problem, None, request)
+            if self._has_current_verdict(cause, problem.question):
+                self._cause_decided(cause)
+            else:
+                changed_causes.append(cause)
+        row1_causes = changed_causes
+        if not row1_causes:
+            return
+
+        if self._batch_mode_enabled():
+            batch_verdicts = self._request_batch_verdicts([(cause, problem.question) for cause in row1_causes], problem)
+            if batch_verdicts is not None:
+                for cause in row1_causes:
+                    self._apply_batch_verdict(cause, problem, None, batch_verdicts[cause.pk])
+                    self._grid_for(problem.pk).mark_changed(cause)
+                    self._cause_decided(cause)
+                return
+
+        max_workers = getattr(settings, 'VALIDATOR', {}).get('MAX_WORKERS', 5)
+        grid = self._grid_for(problem.pk)
+        error = None
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(row1_causes))) as executor:
+            futures = {
+                executor.submit(self._validate_single_cause, cause, problem, None, request, commit=False): cause
+                for cause in row1_causes
+            }
+            for future in as_completed(futures):
+                cause = futures[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    error = error or e
+                    continue
+                # Every finished chain is persisted even if another one failed
+                grid.mark_changed(cause)
+                self._cause_decided(cause)
+
+        if error:
+            raise error
 
     def _validate_remaining_causes_by_column(self, unvalidated_causes, question_id, problem, request):
         """Validate causes in rows > 1, proceeding column by column."""
@@ -172,19 +244,22 @@ class CausesService:
 
     def _column_has_root_cause(self, question_id, column):
         """Check if the specified column has a root cause."""
-        return Causes.objects.filter(
-            question_id=question_id,
-            column=column,
-            root_status=True
-        ).exists()
+        return self._grid_for(question_id).has_root(column)
 
     def _process_column_causes(self, unvalidated_causes, column, problem, request):
         """Process all unvalidated causes in a specific column (rows > 1)."""
-        column_causes = unvalidated_causes.filter(
-            question_id=problem.pk,
-            column=column,
-            row__gt=1  # Exclude row 1 as it's already validated
-        ).order_by('row')
+        column_causes = sorted(
+            (
+                cause for cause in unvalidated_causes
+                if cause.column == column and cause.row > 1  # Exclude row 1 as it's already validated
+            ),
+            key=lambda cause: cause.row
+        )
+        grid = self._grid_for(problem.pk)
+
+        batch_verdicts = None
+        if self._batch_mode_enabled() and column_causes:
+            batch_verdicts = self._request_column_batch_verdicts(column_causes, problem)
         
         for cause in column_causes:
             # Skip empty causes
@@ -193,65 +268,144 @@ class CausesService:
             
             prev_cause = self._get_previous_cause(cause, problem)
             
-            if prev_cause:
-                self._validate_single_cause(cause, problem, prev_cause, request)
+            if prev_cause and self._has_current_verdict(cause, prev_cause.cause):
+                # Unchanged since its last verdict, so the stored feedback still applies
+                self._cause_decided(cause)
+                continue
+            elif prev_cause and batch_verdicts and cause.pk in batch_verdicts:
+                self._apply_batch_verdict(cause, problem, prev_cause, batch_verdicts[cause.pk])
+            elif prev_cause:
+                self._validate_single_cause(cause, problem, prev_cause, request, commit=False)
             else:
                 cause.feedback = f"Perlu validasi sebab di baris {cause.row-1} kolom {'ABCDE'[cause.column]} terlebih dahulu."
-                cause.save()
+                cause.fingerprint = ""  # No verdict was decided for this text
+
+            grid.mark_changed(cause)
+            self._cause_decided(cause)
             
             # If root cause found, stop validating more causes in this column
             if cause.root_status:
                 break
     
+    def _cause_decided(self, cause):
+        """Report a decided cause to the on_cause_decided callback, if any."""
+        if self.on_cause_decided:
+            self.on_cause_decided(cause)
+
+    def _fingerprint(self, cause_text: str, parent_text: str) -> str:
+        """Hash the texts a verdict depends on: the cause and its parent (the problem for row 1)."""
+        digest = hashlib.sha256()
+        for part in (cause_text, parent_text):
+            digest.update(str(part or '').encode('utf-8'))
+            digest.update(b'\x00')
+        return digest.hexdigest()
+
+    def _has_current_verdict(self, cause: Causes, parent_text: str) -> bool:
+        """Whether the stored verdict of a cause still holds for its current and parent texts."""
+        return not cause.is_dirty and cause.fingerprint == self._fingerprint(cause.cause, parent_text)
+
+    def _record_verdict(self, cause: Causes, parent_text: str):
+        """Remember which texts the cause was just decided on."""
+        cause.fingerprint = self._fingerprint(cause.cause, parent_text)
+        cause.is_dirty = False
+
+    def _batch_mode_enabled(self) -> bool:
+        """Whether pending causes are validated with one structured prompt per batch."""
+        return getattr(settings, 'VALIDATOR', {}).get('BATCH_MODE', False)
+
+    def _request_column_batch_verdicts(self, column_causes, problem):
+        """
+        Request batch verdicts for the pending causes of a column, paired with the cause above each one.
+        Only causes whose parent is already valid are included; the rest wait for the per-cause path.
+        """
+        grid = self._grid_for(problem.pk)
+        items = []
+        for cause in column_causes:
+            parent = grid.previous_valid(cause)
+            if cause.cause and cause.cause.strip() and parent and not self._has_current_verdict(cause, parent.cause):
+                items.append((cause, parent.cause))
+        if not items:
+            return None
+
+        return self._request_batch_verdicts(items, problem)
+
+    def _request_batch_verdicts(self, items, problem):
+        """
+        Ask for the verdicts of several causes with a single structured prompt.
+        items is a list of (cause, parent_text) pairs. Returns the verdicts keyed by
+        cause pk, or None when the answer cannot be used so callers fall back to the
+        per-cause path.
+        """
+        system_message, user_prompt = self.prompts.batch(items, problem)
+
+        model = self.backend.model_for(ValidationType.BATCH)
+        with telemetry.span('batch_call', validation_type=ValidationType.BATCH.value, model=model, causes=len(items)) as span:
+            cache_key = verdict_cache.make_key(model, system_message, user_prompt, ValidationType.BATCH)
+            answer = verdict_cache.get(cache_key)
+            span.set(cache_hit=answer is not None)
+            if answer is None:
+                span.set(prompt_tokens=self._count_tokens(system_message, user_prompt))
+                answer = self._chat(system_message, user_prompt, ValidationType.BATCH)
+                span.set(completion_tokens=count_tokens(answer))
+
+        verdicts = parse_batch_verdicts(answer, range(len(items)))
+        if verdicts is None:
+            return None
+
+        verdict_cache.set(cache_key, dump_batch_verdicts(verdicts))
+        return {items[index][0].pk: verdict for index, verdict in verdicts.items()}
+
+    def _apply_batch_verdict(self, cause, problem, prev_cause, verdict):
+        """Apply a batch verdict with the same rules as the per-cause chain."""
+        self._record_verdict(cause, prev_cause.cause if prev_cause else problem.question)
+        self._score_similarity(cause, problem, prev_cause)
+        if verdict.valid:
+            cause.status = True
+            cause.feedback = ""
+
+            if self.check_if_corruption_related(cause.cause) or (verdict.root and not self._skip_root_check(cause, problem)):
+                cause.root_status = True
+                self._apply_root_feedback(cause, verdict.category)
+            else:
+                cause.root_status = False
+        else:
+            cause.status = False
+            cause.root_status = False
+            feedback_type = verdict.feedback_type
+            if prev_cause is None and feedback_type == SIMILAR_TO_PREVIOUS:
+                # Row 1 has no previous cause to be similar to
+                feedback_type = NOT_THE_CAUSE
+            self._apply_false_feedback(cause, prev_cause, feedback_type)
+
     def _ensure_next_rows_exist(self, question_id):
         """
         Ensure that for each column with a valid row but no root cause,
         the next row exists for data entry.
         """
+        grid = self._grid_for(question_id)
+
         # For each active column, find the maximum valid row
         for column in range(5):  # Columns A-E (0-4)
             # Skip if the column has a root cause already
-            has_root = Causes.objects.filter(
-                question_id=question_id,
-                column=column,
-                root_status=True
-            ).exists()
-            
-            if has_root:
+            if grid.has_root(column):
                 continue
             
             # Get all valid rows for this column
-            valid_rows = Causes.objects.filter(
-                question_id=question_id,
-                column=column,
-                status=True
-            ).values_list('row', flat=True)
-            
-            if not valid_rows.exists():
+            valid_rows = grid.valid_rows(column)
+            if not valid_rows:
                 continue
                 
             max_valid_row = max(valid_rows)
             
-            # Check if next row exists
-            next_row_exists = Causes.objects.filter(
-                question_id=question_id,
-                column=column,
-                row=max_valid_row + 1
-            ).exists()
-            
             # If column has valid rows but no root cause yet, and next row doesn't exist,
             # create a placeholder for the next row
-            if not next_row_exists:
+            if grid.get(column, max_valid_row + 1) is None:
                 # Get a cause from the max valid row to use its properties
-                max_row_cause = Causes.objects.get(
-                    question_id=question_id,
-                    column=column,
-                    row=max_valid_row
-                )
+                max_row_cause = grid.get(column, max_valid_row)
                 
                 # Create a placeholder cause for the next row
                 # Ensure we create empty causes with NO feedback and NOT marked as root
-                Causes.objects.create(
+                grid.add(Causes(
                     question_id=question_id,
                     column=column,
                     row=max_valid_row + 1,
@@ -260,7 +414,7 @@ class CausesService:
                     status=False,
                     root_status=False,  # Explicitly NOT a root cause
                     feedback=""  # No feedback to avoid confusion
-                )
+                ))
     
     def _get_previous_cause(self, cause, problem):
         """Get the valid cause from the previous row in the same column."""
@@ -269,27 +423,16 @@ class CausesService:
             if cause.row <= 1:
                 return None
                 
-            # Get specifically the valid cause from the previous row in the same column
-            prev_cause = Causes.objects.filter(
-                question_id=problem.pk,
-                column=cause.column,
-                row=cause.row-1,
-                status=True  # Only get validated causes
-            ).first()  # Get the first matching cause if there are multiple
-            
-            if prev_cause:
-                # Check that the previous cause actually has content
-                if prev_cause.cause and prev_cause.cause.strip() != "":
-                    return prev_cause
-                else:
-                    return None
-            else:
-                return None
+            # Get specifically the valid, non-empty cause from the previous row in the same column
+            return self._grid_for(problem.pk).previous_valid(cause)
         except Exception:
             return None
     
-    def _validate_single_cause(self, cause, problem, prev_cause, request):
-        """Helper method to validate a single cause"""
+    def _validate_single_cause(self, cause, problem, prev_cause, request, commit=True):
+        """
+        Helper method to validate a single cause.
+        When commit is False the verdict is only applied in memory and the caller persists it.
+        """
         # Skip if already validated with a positive status
         if cause.status and cause.feedback == "":
             return
@@ -298,40 +441,32 @@ class CausesService:
         if not cause.cause or cause.cause.strip() == "":
             return
         
-        user_prompt = ""
-        system_message = (
-            "You are an AI model analyzing cause-and-effect relationships in a systematic root cause analysis. "
-            "The analysis follows a column-based approach where each column represents an independent causal chain. "
-            "IMPORTANT PROCEDURAL RULES: "
-            "1) For the first row in each column, the cause must directly relate to the original problem question. "
-            "2) For subsequent rows in the same column, each cause must directly relate to the cause immediately above it (previous row, same column). "
-            "3) The 'previous cause' ALWAYS refers to the cause in the directly preceding row of the same column, not from other columns. "
-            "4) Causal chains may converge as analysis deepens, resulting in similar causes across different columns. "
-            "Please evaluate whether the given cause is valid for its specific position in the analysis."
-        )
-        
-        if cause.row == 1:
-            user_prompt = (
-                f"Is '{cause.cause}' the cause of this question: '{problem.question}'? "
-                f"Note: This is the first row of column {'ABCDE'[cause.column]}. "
-                "The cause should be a direct response to the main problem. "
-                "Answer only with True/False"
-            )
-        else:
+        if cause.row > 1:
             # Ensure we have a valid previous cause before proceeding
             if not prev_cause or not prev_cause.cause or prev_cause.cause.strip() == "":
                 cause.status = False
                 cause.feedback = f"Perlu validasi sebab di baris {cause.row-1} kolom {'ABCDE'[cause.column]} terlebih dahulu."
-                cause.save()
+                cause.fingerprint = ""  # No verdict was decided for this text
+                if commit:
+                    cause.save()
                 return
                 
-            user_prompt = (
-                f"Is '{cause.cause}' the cause of '{prev_cause.cause}'? "
-                f"Note: This is row {cause.row} of column {'ABCDE'[cause.column]}, and the previous cause is from row {cause.row - 1} of the same column. "
-                "The cause should be a direct explanation of its immediate parent cause in the same column. "
-                "Answer only with True/False"
-            )
-        
+        parent_text = problem.question if cause.row == 1 else prev_cause.cause
+        feedback_type = self._obvious_feedback(cause, parent_text, problem, prev_cause)
+        if feedback_type is not None:
+            # Restating the problem or the cause above: neither the validity nor the feedback call is needed
+            rule_classifier.record_saved(ValidationType.NORMAL)
+            rule_classifier.record_saved(ValidationType.FALSE)
+            cause.status = False
+            cause.root_status = False
+            self._apply_false_feedback(cause, prev_cause, feedback_type)
+            self._record_verdict(cause, parent_text)
+            if commit:
+                cause.save()
+            return
+
+        system_message, user_prompt = self.prompts.cause_validity(cause, problem, prev_cause)
+
         # Make the API call to validate this cause
         validation_result = self.api_call(
             system_message=system_message, 
@@ -340,107 +475,136 @@ class CausesService:
             request=request
         )
                 
-        if validation_result == 1:
+        if validation_result is None:
+            # The answer could not be read, so the cause stays pending for the next run
+            cause.status = False
+            cause.root_status = False
+            cause.feedback = FeedbackMsg.NOT_VALIDATED.format(column='ABCDE'[cause.column], row=cause.row)
+            decided = False
+        elif validation_result == 1:
             # Cause is valid
             cause.status = True
             cause.feedback = ""
             
             # Special check: If this cause mentions corruption and it's a valid cause, it's likely a root cause
             if self.check_if_corruption_related(cause.cause):
+                if not self._skip_root_check(cause, problem):
+                    rule_classifier.record_saved(ValidationType.ROOT)
                 cause.root_status = True
-                self.categorize_corruption(cause)
+                decided = self.categorize_corruption(cause, commit=False)
             else:
                 # Otherwise, check normally if it's a root cause
-                self.check_root_cause(cause=cause, problem=problem, request=request)
+                decided = self.check_root_cause(cause=cause, problem=problem, request=request)
         else:
             # Cause is not valid - provide feedback
             cause.status = False  # Ensure status is explicitly marked as false
             cause.root_status = False  # Ensure invalid causes are NOT marked as root causes
-            self.retrieve_feedback(cause=cause, problem=problem, prev_cause=prev_cause, request=request)
+            decided = self.retrieve_feedback(cause=cause, problem=problem, prev_cause=prev_cause, request=request)
+
+        if decided:
+            self._record_verdict(cause, parent_text)
+        else:
+            cause.fingerprint = ""  # No verdict was decided for this text
         
         # Save the updated cause
-        cause.save()
+        if commit:
+            cause.save()
     
-    def check_root_cause(self, cause: Causes, problem: Question, request):
-        """Check if a valid cause is a root cause."""
+    def _obvious_feedback(self, cause: Causes, parent_text: str, problem: Question, prev_cause: None|Causes) -> int | None:
+        """Feedback type of a cause that is invalid without asking the LLM, or None."""
+        parent_score = self._score_similarity(cause, problem, prev_cause)
+        if not self._rules_enabled():
+            return None
+
+        feedback_type = rule_classifier.obvious_invalid(cause.cause, parent_text, problem.question, first_row=cause.row == 1)
+        if feedback_type is None and prev_cause and parent_score >= self._similarity_threshold():
+            # Near-identical to the cause above it
+            feedback_type = SIMILAR_TO_PREVIOUS
+        return feedback_type
+
+    def _score_similarity(self, cause: Causes, problem: Question, prev_cause: None|Causes) -> float:
+        """
+        Store on the cause its highest similarity to the parent cause or to a cause in
+        another column, and return the similarity to the parent.
+        """
+        index = self._similarity_for(problem.pk)
+        parent_score = index.similarity(cause.cause, prev_cause.cause) if prev_cause else 0.0
+        _, sibling_score = index.most_similar(cause, other_columns_only=True)
+        cause.similarity = round(max(parent_score, sibling_score), 2)
+        return parent_score
+
+    def _similarity_for(self, question_id) -> SimilarityIndex:
+        """Return the similarity index of the question's grid, building it on first use."""
+        grid = self._grid_for(question_id)
+        if self._similarity_grid is not grid:
+            self.similarity_index = SimilarityIndex.from_causes(grid.causes())
+            self._similarity_grid = grid
+        return self.similarity_index
+
+    def _similarity_threshold(self) -> float:
+        return getattr(settings, 'VALIDATOR', {}).get('SIMILARITY', {}).get('THRESHOLD', 0.8)
+
+    def check_root_cause(self, cause: Causes, problem: Question, request) -> bool:
+        """Check if a valid cause is a root cause. Returns False when the LLM answer could not be read."""
         # For empty causes or new cells without user input, skip root cause check
         if not cause.cause or cause.cause.strip() == "":
             cause.root_status = False
-            return
+            return True
             
+        if self._skip_root_check(cause, problem):
+            cause.root_status = False
+            return True
+        
+        system_message, user_prompt = self.prompts.root_check(cause, problem)
+
+        root_result = self.api_call(system_message=system_message, user_prompt=user_prompt, validation_type=ValidationType.ROOT, request=request)
+        if root_result == 1:
+            cause.root_status = True
+            # The caller persists the cause once its whole chain has been decided
+            return self.categorize_corruption(cause, commit=False)
+
+        cause.root_status = False
+        return root_result is not None
+    
+    def _skip_root_check(self, cause: Causes, problem: Question) -> bool:
+        """Whether a valid cause is too early in its column to be a root cause."""
         # Add additional check to prevent auto-marking cells as root causes in new columns
         # For rows > 1 in columns C-E, don't automatically check for root cause in initial cells
         if cause.column >= 2 and cause.row > 1:
-            # Check how many causes exist in this column
-            column_causes_count = Causes.objects.filter(
-                question_id=problem.pk,
-                column=cause.column,
-                status=True
-            ).count()
+            # Check how many other causes are already valid in this column
+            column_causes_count = self._grid_for(problem.pk).valid_count(cause.column, exclude=cause)
             
             # For newly activated columns with just 1-2 validated causes, skip root check
             # This prevents premature root cause detection in new columns
-            if column_causes_count <= 2:
-                cause.root_status = False
-                return
-        
-        root_check_user_prompt = (
-            f"Is the cause '{cause.cause}' the fundamental reason behind the problem '{problem.question}'? "
-            f"This cause is from column {'ABCDE'[cause.column]}, row {cause.row}. "
-            "Answer only with True or False."
-        )
-        root_check_system_message = (
-            "You are an AI model. You are asked to determine whether the given cause is a root cause of the given problem. "
-            "A root cause is the fundamental underlying reason that, if addressed, would prevent the problem's recurrence. "
-            "In a cause-and-effect chain analysis, a root cause is the deepest level where effective intervention can occur. "
-            "Not all direct causes are root causes. To identify a root cause, consider: "
-            "1) Is this cause something that can be directly addressed? "
-            "2) If this cause were eliminated, would it prevent the problem from recurring? "
-            "3) Is this the most fundamental level of the issue in this causal chain? "
-            "4) For this analysis, root causes often relate to corruption in terms of wealth, power, or love. "
-            "5) If a cause mentions corruption explicitly, it's very likely to be a root cause. "
-            "Respond only with True if this is indeed a root cause, or False if this is an intermediate cause that has deeper underlying causes."
-        )
-        
-        if self.api_call(system_message=root_check_system_message, user_prompt=root_check_user_prompt, validation_type=ValidationType.ROOT, request=request) == 1:
-            cause.root_status = True
-            self.categorize_corruption(cause)
-        else:
-            cause.root_status = False
-    
-    def categorize_corruption(self, cause: Causes):
-        """Helper method to categorize corruption type"""
+            return column_causes_count <= 2
+
+        return False
+
+    def categorize_corruption(self, cause: Causes, commit: bool = True) -> bool:
+        """Helper method to categorize corruption type. Returns False when the LLM answer could not be read."""
         # Added validation to prevent categorizing empty causes
         if not cause.cause or cause.cause.strip() == "":
             cause.root_status = False
             cause.feedback = ""
-            cause.save()
-            return
+            if commit:
+                cause.save()
+            return True
         
-        korupsi_check_user_prompt = (
-            f"Please categorize the root cause '{cause.cause}' into one of the following corruption categories: "
-            "'Harta' (corruption of wealth/money/resources), 'Tahta' (corruption of power/authority/position), or 'Cinta' (corruption of love/relationships/desires). "
-            "IMPORTANT: You MUST choose one of these three categories, even if the fit isn't perfect. "
-            "The root causes should ultimately fall into one of these categories as per the analysis framework. "
-            "Examples: "
-            "- Bribery, embezzlement, or financial misconduct = Harta (1) "
-            "- Abuse of authority, nepotism, or power-seeking = Tahta (2) "
-            "- Personal relationships affecting decisions, favoritism based on personal bonds = Cinta (3) "
-            "Answer ONLY with '1' for Harta, '2' for Tahta, or '3' for Cinta."
-        )
+        korupsi_category = rule_classifier.corruption_category(cause.cause) if self._rules_enabled() else None
+        if korupsi_category is not None:
+            # The cause names the category outright
+            rule_classifier.record_saved(ValidationType.ROOT_TYPE)
+        else:
+            system_message, user_prompt = self.prompts.corruption_category(cause)
+            korupsi_category = self.api_call(system_message=system_message, user_prompt=user_prompt, validation_type=ValidationType.ROOT_TYPE, request=None)
+        self._apply_root_feedback(cause, korupsi_category)
 
-        korupsi_check_system_message = (
-            "You are an AI model. Your task is to categorize the root cause into one of three corruption categories: "
-            "'Harta' for corruption of wealth, 'Tahta' for corruption of power, or 'Cinta' for corruption of love. "
-            "This is the final step in the root cause analysis framework, where all root causes must be classified "
-            "into one of these three fundamental corruption types. "
-            "You must choose one of these categories, even if the fit seems partial. "
-            "Think broadly about what drives the root cause - is it ultimately about wealth/resources, power/authority, or personal relationships/desires? "
-            "Answer ONLY with '1' for Harta, '2' for Tahta, or '3' for Cinta."
-        )
-        
-        korupsi_category = self.api_call(system_message=korupsi_check_system_message, user_prompt=korupsi_check_user_prompt, validation_type=ValidationType.ROOT_TYPE, request=None)
+        if commit:
+            cause.save()
+        return korupsi_category is not None
 
+    def _apply_root_feedback(self, cause: Causes, korupsi_category: int):
+        """Set the feedback message of a root cause from its corruption category."""
         if korupsi_category == 1:
             cause.feedback = f"{FeedbackMsg.ROOT_FOUND.format(column='ABCDE'[cause.column])} Korupsi Harta."
         elif korupsi_category == 2:
@@ -450,5 +614,128 @@ class CausesService:
         else:
             # Default to Harta if unclear
             cause.feedback = f"{FeedbackMsg.ROOT_FOUND.format(column='ABCDE'[cause.column])} Korupsi Harta."
-        
-        cause.save()
+
+
+class ValidationJobService:
+    def enqueue(self, question_id: uuid) -> ValidationJob:
+        """
+        Queue a validation run for a question.
+        A job that has not started yet already covers the latest grid, so it is reused.
+        """
+        try:
+            question = Question.objects.get(pk=question_id)
+        except ObjectDoesNotExist:
+            raise NotFoundRequestException(ErrorMsg.NOT_FOUND)
+
+        pending_job = ValidationJob.objects.filter(
+            question=question,
+            status=ValidationJob.StatusChoices.PENDING
+        ).order_by('created_at').first()
+        if pending_job:
+            return pending_job
+
+        total = Causes.objects.filter(question=question, status=False).exclude(cause='').count()
+        return ValidationJob.objects.create(question=question, total=total)
+
+    def get(self, job_id: uuid) -> ValidationJob:
+        try:
+            return ValidationJob.objects.get(pk=job_id)
+        except ObjectDoesNotExist:
+            raise NotFoundRequestException(ErrorMsg.JOB_NOT_FOUND)
+
+    def claim_next(self) -> ValidationJob | None:
+        """
+        Move the oldest pending job to RUNNING and return it.
+        The conditional update makes the claim atomic, so concurrent workers never run the same job.
+        """
+        pending_ids = ValidationJob.objects.filter(
+            status=ValidationJob.StatusChoices.PENDING
+        ).order_by('created_at').values_list('id', flat=True)[:10]
+
+        for job_id in pending_ids:
+            claimed = ValidationJob.objects.filter(
+                pk=job_id,
+                status=ValidationJob.StatusChoices.PENDING
+            ).update(status=ValidationJob.StatusChoices.RUNNING, started_at=timezone.now())
+            if claimed:
+                return ValidationJob.objects.get(pk=job_id)
+
+        return None
+
+    def run(self, job: ValidationJob):
+        """Validate the job's question, recording progress as causes are decided."""
+        service = CausesService(
+            on_cause_decided=lambda cause: ValidationJob.objects.filter(pk=job.pk).update(progress=F('progress') + 1)
+        )
+
+        try:
+            service.validate(question_id=job.question_id, request=None)
+        except Exception as e:
+            ValidationJob.objects.filter(pk=job.pk).update(
+                status=ValidationJob.StatusChoices.FAILED,
+                error=str(e),
+                finished_at=timezone.now()
+            )
+        else:
+            ValidationJob.objects.filter(pk=job.pk).update(
+                status=ValidationJob.StatusChoices.SUCCEEDED,
+                finished_at=timezone.now()
+            )
+
+        job.refresh_from_db()
+
+    def requeue_stale(self, older_than_seconds: int) -> int:
+        """Put RUNNING jobs whose worker died back in the queue."""
+        threshold = timezone.now() - timedelta(seconds=older_than_seconds)
+        return ValidationJob.objects.filter(
+            status=ValidationJob.StatusChoices.RUNNING,
+            started_at__lt=threshold
+        ).update(status=ValidationJob.StatusChoices.PENDING, started_at=None, progress=0)
+
+
+class MetricsService:
+    """Collects the validator's process-wide counters as Prometheus text."""
+
+    CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+    def render(self) -> str:
+        return telemetry.render_prometheus(self._families())
+
+    def _families(self):
+        cache_stats = verdict_cache.stats()
+        parser_stats = verdict_parser.stats()
+        resilience_stats = groq_resilience.stats()
+        circuit = resilience_stats.pop('circuit')
+        saved = rule_classifier.stats()
+        saved.pop('total')
+        prompts = prompt_metrics.stats()
+
+        return [
+            ('validator_verdict_cache_total', 'counter', 'Verdict cache lookups by result', [
+                ({'result': result}, cache_stats[result]) for result in ('hits', 'local_hits', 'misses')
+            ]),
+            ('validator_verdict_cache_local_size', 'gauge', 'Entries in the in-process verdict cache', [
+                ({}, cache_stats['local_size'])
+            ]),
+            ('validator_verdict_parse_total', 'counter', 'LLM answers by how their verdict was parsed', [
+                ({'outcome': outcome}, parser_stats[outcome]) for outcome in ('structured', 'fallback', 'failed')
+            ]),
+            ('validator_groq_calls_total', 'counter', 'Groq call outcomes, including retries', [
+                ({'event': event}, count) for event, count in sorted(resilience_stats.items())
+            ]),
+            ('validator_groq_circuit_state', 'gauge', 'Current state of the Groq circuit breaker', [
+                ({'state': state}, int(circuit['state'] == state)) for state in ('closed', 'open', 'half_open')
+            ]),
+            ('validator_backend_calls_total', 'counter', 'Calls made to each LLM backend', [
+                ({'backend': backend}, count) for backend, count in sorted(LLMBackend.call_counts().items())
+            ]),
+            ('validator_router_events_total', 'counter', 'LLM router hedges and fallbacks', [
+                ({'validation_type': validation_type, 'event': event}, count)
+                for validation_type, events in sorted(LLMRouter.stats().items())
+                for event, count in sorted(events.items())
+            ]),
+            ('validator_llm_calls_saved_total', 'counter', 'LLM calls made unnecessary by local rules', [
+                ({'validation_type': validation_type}, count) for validation_type, count in sorted(saved.items())
+            ]),
+            ('validator_prompts_sent_total', 'counter', 'Prompts sent to the model', [({}, prompts['prompts'])]),
+        ]
@@ -0,0 +1,57 @@
+import json
+from django.test import TestCase
+from validator.utils.batch_verdicts import dump_batch_verdicts, parse_batch_verdicts
+
+class ParseBatchVerdictsTest(TestCase):
+    def setUp(self):
+        self.answer = json.dumps([
+            {"id": 0, "valid": True, "root": True, "category": 2, "feedback_type": None},
+            {"id": 1, "valid": False, "root": False, "category": None, "feedback_type": 3},
+        ])
+
+    def test_parse_valid_answer(self):
+        verdicts = parse_batch_verdicts(self.answer, [0, 1])
+
+        self.assertTrue(verdicts[0].valid)
+        self.assertTrue(verdicts[0].root)
+        self.assertEqual(verdicts[0].category, 2)
+        self.assertFalse(verdicts[1].valid)
+        self.assertEqual(verdicts[1].feedback_type, 3)
+
+    def test_parse_answer_wrapped_in_prose(self):
+        answer = f"Here are the verdicts:\n```json\n{self.answer}\n```"
+
+        self.assertIsNotNone(parse_batch_verdicts(answer, [0, 1]))
+
+    def test_parse_optional_fields_default(self):
+        verdicts = parse_batch_verdicts('[{"id": 0, "valid": true}]', [0])
+
+        self.assertFalse(verdicts[0].root)
+        self.assertIsNone(verdicts[0].category)
+
+    def test_parse_rejects_missing_cause(self):
+        self.assertIsNone(parse_batch_verdicts(self.answer, [0, 1, 2]))
+
+    def test_parse_rejects_unexpected_cause(self):
+        self.assertIsNone(parse_batch_verdicts(self.answer, [0]))
+
+    def test_parse_rejects_duplicate_ids(self):
+        answer = '[{"id": 0, "valid": true}, {"id": 0, "valid": false}]'
+
+        self.assertIsNone(parse_batch_verdicts(answer, [0]))
+
+    def test_parse_rejects_schema_violation(self):
+        answer = '[{"id": 0, "valid": true, "category": 7}]'
+
+        self.assertIsNone(parse_batch_verdicts(answer, [0]))
+
+    def test_parse_rejects_non_json(self):
+        self.assertIsNone(parse_batch_verdicts("True", [0]))
+        self.assertIsNone(parse_batch_verdicts("[not json]", [0]))
+        self.assertIsNone(parse_batch_verdicts("", [0]))
+        self.assertIsNone(parse_batch_verdicts(None, [0]))
+
+    def test_dump_round_trip(self):
+        verdicts = parse_batch_verdicts(self.answer, [0, 1])
+
+        self.assertEqual(parse_batch_verdicts(dump_batch_verdicts(verdicts), [0, 1]), verdicts)
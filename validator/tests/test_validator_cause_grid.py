@@ -0,0 +1,87 @@
+from django.test import TestCase
+from cause.models import Causes
+from question.models import Question
+from validator.utils.cause_grid import CauseGrid
+
+
+class CauseGridTest(TestCase):
+    def setUp(self):
+        self.question = Question.objects.create(question="Test question")
+        self.a1 = Causes.objects.create(question=self.question, cause="Cause A1", row=1, column=0, status=True)
+        self.a2 = Causes.objects.create(question=self.question, cause="Cause A2", row=2, column=0, status=False)
+        self.b1 = Causes.objects.create(question=self.question, cause="", row=1, column=1, status=True)
+        self.b2 = Causes.objects.create(question=self.question, cause="Cause B2", row=2, column=1, status=True, root_status=True)
+
+    def test_load_uses_one_query(self):
+        with self.assertNumQueries(1):
+            grid = CauseGrid.load(self.question.id)
+
+        self.assertEqual(grid.causes(), [self.a1, self.a2, self.b1, self.b2])
+
+    def test_pending_is_snapshot_at_load(self):
+        grid = CauseGrid.load(self.question.id)
+        pending = grid.pending()
+        pending[0].status = True
+
+        self.assertEqual(grid.pending(), [self.a2])
+
+    def test_previous_valid(self):
+        grid = CauseGrid.load(self.question.id)
+
+        self.assertEqual(grid.previous_valid(grid.get(0, 2)), self.a1)
+        self.assertIsNone(grid.previous_valid(grid.get(0, 1)))
+        # The cause above is valid but empty
+        self.assertIsNone(grid.previous_valid(grid.get(1, 2)))
+
+    def test_column_lookups(self):
+        grid = CauseGrid.load(self.question.id)
+
+        self.assertFalse(grid.has_root(0))
+        self.assertTrue(grid.has_root(1))
+        self.assertEqual(grid.valid_rows(0), [1])
+        self.assertEqual(grid.valid_count(1), 2)
+        self.assertEqual(grid.valid_count(1, exclude=self.b2), 1)
+
+    def test_save_persists_changed_and_created_causes(self):
+        grid = CauseGrid.load(self.question.id)
+        cause = grid.get(0, 2)
+        cause.status = True
+        grid.mark_changed(cause)
+        grid.add(Causes(question=self.question, cause="", row=3, column=0))
+
+        with self.assertNumQueries(5):  # Savepoint, bulk update, bulk create, release, reload of created cells
+            grid.save()
+
+        self.a2.refresh_from_db()
+        self.assertTrue(self.a2.status)
+        self.assertTrue(Causes.objects.filter(question=self.question, row=3, column=0).exists())
+
+    def test_save_keeps_verdicts_when_placeholder_cell_was_filled(self):
+        grid = CauseGrid.load(self.question.id)
+        cause = grid.get(0, 2)
+        cause.status = True
+        grid.mark_changed(cause)
+        placeholder = Causes(question=self.question, cause="", row=3, column=0)
+        grid.add(placeholder)
+        # Another request creates the same cell before the grid is saved
+        Causes.objects.create(question=self.question, cause="Cause A3", row=3, column=0)
+
+        grid.save()
+
+        # The grid now holds the stored cause instead of the placeholder
+        self.assertEqual(grid.get(0, 3).cause, "Cause A3")
+        self.assertIn("Cause A3", [cell.cause for cell in grid.causes()])
+        self.assertNotIn(placeholder.pk, [cell.pk for cell in grid.causes()])
+
+        self.a2.refresh_from_db()
+        self.assertTrue(self.a2.status)
+        self.assertEqual(
+            list(Causes.objects.filter(question=self.question, row=3, column=0).values_list('cause', flat=True)),
+            ["Cause A3"]
+        )
+
+    def test_save_without_changes_runs_no_query(self):
+        grid = CauseGrid.load(self.question.id)
+
+        with self.assertNumQueries(0):
+            grid.save()
@@ -1,4 +1,5 @@
 from django.test import TestCase
+from cause.models import Causes
 from validator.constants import FeedbackMsg
 
 
@@ -26,4 +27,10 @@ class FeedbackMsgTest(TestCase):
         self.assertEqual(
             FeedbackMsg.FALSE_ROW_N_SIMILAR_PREVIOUS.format(column=column, row=row),
             f"Sebab {column}{row} mirip dengan sebab sebelumnya"
-        ) 
\ No newline at end of file
+        ) 
+
+    def test_not_validated_fits_feedback_field(self):
+        max_length = Causes._meta.get_field('feedback').max_length
+
+        for column in 'ABCDE':
+            self.assertLessEqual(len(FeedbackMsg.NOT_VALIDATED.format(column=column, row=99)), max_length)
@@ -7,4 +7,5 @@ class ValidationTypeTest(TestCase):
         self.assertEqual(ValidationType.NORMAL.value, 'normal')
         self.assertEqual(ValidationType.FALSE.value, 'false')
         self.assertEqual(ValidationType.ROOT.value, 'root')
-        self.assertEqual(ValidationType.ROOT_TYPE.value, 'root_type') 
\ No newline at end of file
+        self.assertEqual(ValidationType.ROOT_TYPE.value, 'root_type')
+        self.assertEqual(ValidationType.BATCH.value, 'batch') 
\ No newline at end of file
@@ -0,0 +1,73 @@
+import threading
+from django.test import TestCase, override_settings
+from unittest.mock import patch, Mock
+from validator.utils.groq_client import GroqClientRegistry
+
+class GroqClientRegistryTest(TestCase):
+    def setUp(self):
+        self.registry = GroqClientRegistry()
+
+    def tearDown(self):
+        self.registry.close()
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_get_reuses_client(self, mock_groq):
+        mock_groq.return_value = Mock()
+
+        first = self.registry.get("key")
+        second = self.registry.get("key")
+
+        self.assertIs(first, second)
+        mock_groq.assert_called_once()
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_get_separate_client_per_key(self, mock_groq):
+        mock_groq.side_effect = lambda **kwargs: Mock()
+
+        self.assertIsNot(self.registry.get("key-1"), self.registry.get("key-2"))
+        self.assertEqual(mock_groq.call_count, 2)
+
+    @override_settings(GROQ_API_KEY="settings-key")
+    @patch('validator.utils.groq_client.Groq')
+    def test_get_defaults_to_settings_key(self, mock_groq):
+        self.registry.get()
+
+        self.assertEqual(mock_groq.call_args.kwargs['api_key'], "settings-key")
+
+    @override_settings(VALIDATOR={'GROQ_CLIENT': {'MAX_CONNECTIONS': 3, 'MAX_KEEPALIVE_CONNECTIONS': 2, 'TIMEOUT': 7.0, 'CONNECT_TIMEOUT': 1.0}})
+    @patch('validator.utils.groq_client.DefaultHttpxClient')
+    @patch('validator.utils.groq_client.Groq')
+    def test_client_uses_configured_pool(self, mock_groq, mock_http_client):
+        self.registry.get("key")
+
+        http_kwargs = mock_http_client.call_args.kwargs
+        self.assertEqual(http_kwargs['limits'].max_connections, 3)
+        self.assertEqual(http_kwargs['limits'].max_keepalive_connections, 2)
+        self.assertEqual(http_kwargs['timeout'].read, 7.0)
+        self.assertEqual(http_kwargs['timeout'].connect, 1.0)
+        self.assertIs(mock_groq.call_args.kwargs['http_client'], mock_http_client.return_value)
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_get_is_thread_safe(self, mock_groq):
+        mock_groq.side_effect = lambda **kwargs: Mock()
+        clients = []
+
+        threads = [threading.Thread(target=lambda: clients.append(self.registry.get("key"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(mock_groq.call_count, 1)
+        self.assertTrue(all(client is clients[0] for client in clients))
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_close_closes_clients_and_resets(self, mock_groq):
+        first_client, second_client = Mock(), Mock()
+        mock_groq.side_effect = [first_client, second_client]
+
+        self.registry.get("key")
+        self.registry.close()
+
+        first_client.close.assert_called_once()
+        self.assertIs(self.registry.get("key"), second_client)
@@ -0,0 +1,170 @@
+import uuid
+from datetime import timedelta
+from io import StringIO
+from django.core.management import call_command
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from unittest.mock import patch
+from rest_framework import status
+from rest_framework.test import APIClient
+from cause.models import Causes
+from question.models import Question
+from validator.constants import ErrorMsg
+from validator.exceptions import AIServiceErrorException, NotFoundRequestException
+from validator.models import ValidationJob
+from validator.services import CausesService, ValidationJobService
+
+
+class ValidationJobServiceTest(TestCase):
+    def setUp(self):
+        self.service = ValidationJobService()
+        self.question = Question.objects.create(question="Test question")
+        Causes.objects.create(question=self.question, cause="Cause A1", row=1, column=0, status=False)
+        Causes.objects.create(question=self.question, cause="Cause B1", row=1, column=1, status=True)
+        Causes.objects.create(question=self.question, cause="", row=2, column=1, status=False)
+
+    def test_enqueue_counts_pending_causes(self):
+        job = self.service.enqueue(question_id=self.question.id)
+
+        self.assertEqual(job.status, ValidationJob.StatusChoices.PENDING)
+        self.assertEqual(job.total, 1)
+        self.assertEqual(job.progress, 0)
+
+    def test_enqueue_reuses_pending_job(self):
+        first = self.service.enqueue(question_id=self.question.id)
+        second = self.service.enqueue(question_id=self.question.id)
+
+        self.assertEqual(first.pk, second.pk)
+        self.assertEqual(ValidationJob.objects.count(), 1)
+
+    def test_enqueue_new_job_while_running(self):
+        first = self.service.enqueue(question_id=self.question.id)
+        self.service.claim_next()
+
+        second = self.service.enqueue(question_id=self.question.id)
+
+        self.assertNotEqual(first.pk, second.pk)
+
+    def test_enqueue_question_not_found(self):
+        with self.assertRaises(NotFoundRequestException):
+            self.service.enqueue(question_id=uuid.uuid4())
+
+    def test_get_not_found(self):
+        with self.assertRaises(NotFoundRequestException) as context:
+            self.service.get(job_id=uuid.uuid4())
+
+        self.assertEqual(str(context.exception), ErrorMsg.JOB_NOT_FOUND)
+
+    def test_claim_next_takes_oldest_pending_job(self):
+        other_question = Question.objects.create(question="Other question")
+        first = self.service.enqueue(question_id=self.question.id)
+        self.service.enqueue(question_id=other_question.id)
+
+        claimed = self.service.claim_next()
+
+        self.assertEqual(claimed.pk, first.pk)
+        self.assertEqual(claimed.status, ValidationJob.StatusChoices.RUNNING)
+        self.assertIsNotNone(claimed.started_at)
+
+    def test_claim_next_empty_queue(self):
+        self.assertIsNone(self.service.claim_next())
+
+    def test_claim_next_never_claims_twice(self):
+        self.service.enqueue(question_id=self.question.id)
+
+        self.assertIsNotNone(self.service.claim_next())
+        self.assertIsNone(self.service.claim_next())
+
+    @patch.object(CausesService, 'validate', autospec=True)
+    def test_run_success_records_progress(self, mock_validate):
+        def validate(causes_service, question_id, request):
+            for cause in Causes.objects.filter(question_id=question_id):
+                causes_service.on_cause_decided(cause)
+
+        mock_validate.side_effect = validate
+        self.service.enqueue(question_id=self.question.id)
+        job = self.service.claim_next()
+
+        self.service.run(job)
+
+        self.assertEqual(job.status, ValidationJob.StatusChoices.SUCCEEDED)
+        self.assertEqual(job.progress, 3)
+        self.assertIsNotNone(job.finished_at)
+
+    @patch.object(CausesService, 'validate')
+    def test_run_failure_records_error(self, mock_validate):
+        mock_validate.side_effect = AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+        self.service.enqueue(question_id=self.question.id)
+        job = self.service.claim_next()
+
+        self.service.run(job)
+
+        self.assertEqual(job.status, ValidationJob.StatusChoices.FAILED)
+        self.assertEqual(job.error, ErrorMsg.AI_SERVICE_ERROR)
+
+    def test_requeue_stale(self):
+        self.service.enqueue(question_id=self.question.id)
+        job = self.service.claim_next()
+        ValidationJob.objects.filter(pk=job.pk).update(started_at=timezone.now() - timedelta(hours=1))
+
+        self.assertEqual(self.service.requeue_stale(older_than_seconds=60), 1)
+        job.refresh_from_db()
+        self.assertEqual(job.status, ValidationJob.StatusChoices.PENDING)
+
+
+class ValidationJobViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.question = Question.objects.create(question="Test question")
+        self.cause = Causes.objects.create(question=self.question, cause="Cause A1", row=1, column=0, status=False)
+
+    @override_settings(VALIDATOR={'ASYNC_JOBS': True})
+    @patch.object(CausesService, 'validate')
+    def test_validate_enqueues_job(self, mock_validate):
+        response = self.client.patch(reverse('validate_causes', kwargs={'question_id': self.question.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_202_ACCEPTED)
+        self.assertEqual(response.data['status'], ValidationJob.StatusChoices.PENDING)
+        self.assertTrue(ValidationJob.objects.filter(pk=response.data['id']).exists())
+        mock_validate.assert_not_called()
+
+    def test_job_status_pending(self):
+        job = ValidationJobService().enqueue(question_id=self.question.id)
+
+        response = self.client.get(reverse('validation_job_status', kwargs={'job_id': job.id}))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['status'], ValidationJob.StatusChoices.PENDING)
+        self.assertEqual(response.data['total'], 1)
+        self.assertNotIn('causes', response.data)
+
+    def test_job_status_succeeded_includes_causes(self):
+        job = ValidationJobService().enqueue(question_id=self.question.id)
+        ValidationJob.objects.filter(pk=job.pk).update(status=ValidationJob.StatusChoices.SUCCEEDED)
+
+        response = self.client.get(reverse('validation_job_status', kwargs={'job_id': job.id}))
+
+        self.assertEqual(len(response.data['causes']), 1)
+        self.assertEqual(response.data['causes'][0]['id'], str(self.cause.id))
+
+    def test_job_status_not_found(self):
+        response = self.client.get(reverse('validation_job_status', kwargs={'job_id': uuid.uuid4()}))
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+
+class RunValidationWorkerCommandTest(TransactionTestCase):
+    def setUp(self):
+        self.question = Question.objects.create(question="Test question")
+        Causes.objects.create(question=self.question, cause="Cause A1", row=1, column=0, status=False)
+
+    @patch.object(CausesService, 'validate')
+    def test_burst_processes_queue(self, mock_validate):
+        job = ValidationJobService().enqueue(question_id=self.question.id)
+
+        call_command('run_validation_worker', '--burst', '--workers', '2', stdout=StringIO())
+
+        job.refresh_from_db()
+        self.assertEqual(job.status, ValidationJob.StatusChoices.SUCCEEDED)
+        mock_validate.assert_called_once_with(question_id=self.question.id, request=None)
@@ -0,0 +1,228 @@
+import json
+import threading
+from io import StringIO
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase, override_settings
+from unittest.mock import patch
+from cause.models import Causes
+from question.models import Question
+from validator.enums import ValidationType
+from validator.exceptions import AIServiceErrorException
+from validator.services import CausesService
+from validator.utils.batch_verdicts import parse_batch_verdicts
+from validator.utils.llm_backends import GroqBackend, LLMBackend, LLMRouter, LocalBackend, get_backend
+from validator.utils.verdict_cache import verdict_cache
+
+
+class LocalBackendTest(TestCase):
+    def setUp(self):
+        self.backend = LocalBackend({'ROOT_ROW': 3})
+
+    def test_default_verdicts(self):
+        self.assertEqual(self.backend.chat("", "Is 'A' the cause of 'B'?", ValidationType.NORMAL), 'true')
+        self.assertEqual(self.backend.chat("", "column A, row 2.", ValidationType.ROOT), 'false')
+        self.assertEqual(self.backend.chat("", "column A, row 3.", ValidationType.ROOT), 'true')
+        self.assertEqual(self.backend.chat("", "Why?", ValidationType.FALSE), '1')
+
+    def test_json_output(self):
+        answer = self.backend.chat("", "Is 'A' the cause of 'B'?", ValidationType.NORMAL, json_output=True)
+
+        self.assertEqual(json.loads(answer), {"verdict": True})
+
+    def test_rules_override_defaults(self):
+        backend = LocalBackend({'RULES': [{'PATTERN': r"'bad cause'", 'ANSWER': 'false'}]})
+
+        self.assertEqual(backend.chat("", "Is 'bad cause' the cause of 'B'?", ValidationType.NORMAL), 'false')
+        self.assertEqual(backend.chat("", "Is 'good cause' the cause of 'B'?", ValidationType.NORMAL), 'true')
+
+    def test_error_rate(self):
+        backend = LocalBackend({'ERROR_RATE': 1.0})
+
+        with self.assertRaises(AIServiceErrorException):
+            backend.chat("", "prompt", ValidationType.NORMAL)
+
+    @patch('validator.utils.llm_backends.time.sleep')
+    def test_latency_is_seeded(self, mock_sleep):
+        config = {'LATENCY': {'DISTRIBUTION': 'lognormal', 'MEAN': 0.2, 'SIGMA': 0.5}, 'SEED': 7}
+        first, second = LocalBackend(config), LocalBackend(config)
+
+        for backend in (first, second):
+            for _ in range(3):
+                backend.chat("", "prompt", ValidationType.NORMAL)
+
+        delays = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertEqual(delays[:3], delays[3:])
+        self.assertTrue(all(delay > 0 for delay in delays))
+
+    def test_batch_answer_matches_batch_schema(self):
+        payload = [
+            {"id": 0, "cell": "A1", "cause": "A", "parent": "Problem"},
+            {"id": 1, "cell": "A3", "cause": "B", "parent": "A"},
+        ]
+        prompt = f"Problem: 'P'. Causes: {json.dumps(payload)}. For every cause return an object"
+
+        verdicts = parse_batch_verdicts(self.backend.chat("", prompt, ValidationType.BATCH), [0, 1])
+
+        self.assertFalse(verdicts[0].root)
+        self.assertTrue(verdicts[1].root)
+
+    def test_calls_are_counted(self):
+        before = LLMBackend.call_counts().get(LocalBackend.name, 0)
+
+        self.backend.chat("", "prompt", ValidationType.NORMAL)
+
+        self.assertEqual(LLMBackend.call_counts()[LocalBackend.name], before + 1)
+
+
+class GetBackendTest(TestCase):
+    def test_defaults_to_groq(self):
+        self.assertIsInstance(get_backend(), GroqBackend)
+
+    @override_settings(VALIDATOR={'LLM_BACKEND': 'local'})
+    def test_selected_by_settings(self):
+        self.assertIsInstance(get_backend(), LocalBackend)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            get_backend('unknown')
+
+
+class GroqBackendTest(TestCase):
+    @patch('validator.utils.llm_backends.groq_clients')
+    def test_reasoning_format_only_for_reasoning_models(self, mock_clients):
+        create = mock_clients.get.return_value.chat.completions.create
+        create.return_value.choices = [type('Choice', (), {'message': type('Message', (), {'content': 'true'})})]
+        backend = GroqBackend()
+
+        backend.chat("", "prompt", ValidationType.NORMAL)
+        self.assertEqual(create.call_args.kwargs['reasoning_format'], "hidden")
+
+        backend.chat("", "prompt", ValidationType.NORMAL, model="llama-3.1-8b-instant")
+        self.assertEqual(create.call_args.kwargs['model'], "llama-3.1-8b-instant")
+        self.assertNotIn('reasoning_format', create.call_args.kwargs)
+
+
+class FakeBackend(LLMBackend):
+    """Answers with the model name; models listed in fail raise, models listed in block wait for release"""
+
+    name = 'fake'
+    model = 'big'
+
+    def __init__(self, fail=(), block=()):
+        self.fail = set(fail)
+        self.block = set(block)
+        self.release = threading.Event()
+        self.models = []
+
+    def _complete(self, system_message, user_prompt, validation_type, json_output, model):
+        self.models.append(model)
+        if model in self.block:
+            self.release.wait(5)
+        if model in self.fail:
+            raise AIServiceErrorException("failed")
+        return model
+
+
+class LLMRouterTest(TestCase):
+    def setUp(self):
+        LLMRouter.reset_stats()
+
+    def tearDown(self):
+        LLMRouter.reset_stats()
+
+    def _router(self, backend, route):
+        return LLMRouter({'ROUTES': {'normal': route}}, backend=backend)
+
+    def test_routes_by_validation_type(self):
+        backend = FakeBackend()
+        router = self._router(backend, {'MODELS': ['small', 'big']})
+
+        self.assertEqual(router.chat("", "prompt", ValidationType.NORMAL), 'small')
+        # Types without a route use the backend default
+        self.assertEqual(router.chat("", "prompt", ValidationType.FALSE), 'big')
+        self.assertEqual(router.model_for(ValidationType.NORMAL), 'small|big')
+
+    def test_falls_back_to_next_model(self):
+        backend = FakeBackend(fail=['small'])
+        router = self._router(backend, {'MODELS': ['small', 'big']})
+
+        self.assertEqual(router.chat("", "prompt", ValidationType.NORMAL), 'big')
+        self.assertEqual(LLMRouter.stats()['normal']['fallbacks'], 1)
+
+    def test_raises_when_every_model_fails(self):
+        router = self._router(FakeBackend(fail=['small', 'big']), {'MODELS': ['small', 'big']})
+
+        with self.assertRaises(AIServiceErrorException):
+            router.chat("", "prompt", ValidationType.NORMAL)
+        self.assertEqual(LLMRouter.stats()['normal']['failures'], 1)
+
+    def test_hedges_slow_request(self):
+        backend = FakeBackend(block=['small'])
+        router = self._router(backend, {'MODELS': ['small', 'big'], 'HEDGE_AFTER': 0.01})
+
+        try:
+            self.assertEqual(router.chat("", "prompt", ValidationType.NORMAL), 'big')
+        finally:
+            backend.release.set()
+        stats = LLMRouter.stats()['normal']
+        self.assertEqual(stats['hedged'], 1)
+        self.assertEqual(stats['hedge_wins'], 1)
+
+    def test_fast_answer_is_not_hedged(self):
+        backend = FakeBackend()
+        router = self._router(backend, {'MODELS': ['small'], 'HEDGE_AFTER': 5})
+
+        self.assertEqual(router.chat("", "prompt", ValidationType.NORMAL), 'small')
+        self.assertEqual(backend.models, ['small'])
+        self.assertEqual(LLMRouter.stats(), {})
+
+    def test_hedge_failure_falls_back(self):
+        backend = FakeBackend(fail=['small'])
+        router = self._router(backend, {'MODELS': ['small', 'big'], 'HEDGE_AFTER': 5})
+
+        self.assertEqual(router.chat("", "prompt", ValidationType.NORMAL), 'big')
+        self.assertEqual(LLMRouter.stats()['normal'], {'fallbacks': 1})
+
+    @override_settings(VALIDATOR={'LLM_BACKEND': 'router', 'LLM_ROUTER': {'BACKEND': 'local'}})
+    def test_selected_by_settings(self):
+        router = get_backend()
+
+        self.assertIsInstance(router, LLMRouter)
+        self.assertIsInstance(router.backend, LocalBackend)
+
+
+class LocalBackendValidationTest(TestCase):
+    def setUp(self):
+        verdict_cache.clear()
+        self.question = Question.objects.create(question="Test question")
+        for row in range(1, 4):
+            Causes.objects.create(question=self.question, cause=f"Cause A{row}", row=row, column=0)
+
+    def test_validate_without_groq(self):
+        service = CausesService(backend=LocalBackend({'ROOT_ROW': 3}))
+
+        causes = service.validate(self.question.id, request=None)
+
+        self.assertTrue(all(cause.status for cause in causes if cause.column == 0))
+        self.assertTrue(Causes.objects.get(question=self.question, row=3).root_status)
+
+
+class BenchmarkValidatorCommandTest(TestCase):
+    def test_reports_percentiles_per_grid(self):
+        out = StringIO()
+
+        call_command('benchmark_validator', '--rows', '2', '--iterations', '2', '--latency', '0', '--allow-writes', stdout=out)
+
+        lines = out.getvalue().splitlines()
+        self.assertIn('p99 ms', lines[0])
+        self.assertTrue(lines[1].split()[0] == '5x2')
+        # Nothing is left behind
+        self.assertFalse(Question.objects.filter(title="Benchmark").exists())
+
+    @override_settings(DEBUG=False)
+    def test_refuses_to_write_without_allow_writes(self):
+        with self.assertRaises(CommandError):
+            call_command('benchmark_validator', '--rows', '2', '--iterations', '1', stdout=StringIO())
+
+        self.assertFalse(Question.objects.exists())
@@ -0,0 +1,92 @@
+import threading
+from django.test import TestCase, TransactionTestCase, override_settings
+from unittest.mock import patch
+from cause.models import Causes
+from question.models import Question
+from validator.services import CausesService
+from validator.utils.llm_backends import LLMBackend, LocalBackend
+from validator.utils.prefetch import VerdictPrefetcher
+from validator.utils.verdict_cache import verdict_cache
+
+LOCAL_VALIDATOR = {'LLM_BACKEND': 'local', 'LOCAL_LLM': {'ROOT_ROW': 3}}
+
+
+class VerdictPrefetcherRunTest(TestCase):
+    def setUp(self):
+        verdict_cache.clear()
+        self.prefetcher = VerdictPrefetcher()
+        self.question = Question.objects.create(question="Mengapa jalan desa rusak?")
+        self.cause = Causes.objects.create(question=self.question, cause="Anggaran perbaikan tidak cukup", row=1, column=0)
+
+    def _backend_calls(self):
+        return LLMBackend.call_counts().get(LocalBackend.name, 0)
+
+    @override_settings(VALIDATOR=LOCAL_VALIDATOR)
+    def test_validation_after_prefetch_hits_the_cache(self):
+        before = self._backend_calls()
+        self.prefetcher.run(self.question.id, self.cause.id)
+        # One NORMAL and one ROOT verdict
+        self.assertEqual(self._backend_calls() - before, 2)
+
+        before = self._backend_calls()
+        causes = CausesService().validate(self.question.id, request=None)
+
+        self.assertEqual(self._backend_calls(), before)
+        self.assertTrue(causes[0].status)
+        self.assertEqual(self.prefetcher.stats()['completed'], 1)
+
+    @override_settings(VALIDATOR=LOCAL_VALIDATOR)
+    def test_skips_cause_without_valid_parent(self):
+        orphan = Causes.objects.create(question=self.question, cause="Dana dipotong", row=2, column=0)
+        before = self._backend_calls()
+
+        self.prefetcher.run(self.question.id, orphan.id)
+
+        self.assertEqual(self._backend_calls(), before)
+        self.assertEqual(self.prefetcher.stats()['skipped'], 1)
+
+
+class VerdictPrefetcherScheduleTest(TransactionTestCase):
+    def setUp(self):
+        self.prefetcher = VerdictPrefetcher()
+
+    def test_disabled_by_default(self):
+        with patch.object(self.prefetcher, '_submit') as mock_submit:
+            self.prefetcher.schedule('question', 'cause')
+
+        self.assertEqual(self.prefetcher.stats()['scheduled'], 0)
+        mock_submit.assert_not_called()
+
+    @override_settings(VALIDATOR={'PREFETCH': {'ENABLED': True, 'DEBOUNCE': 0.05}})
+    def test_edits_within_debounce_collapse(self):
+        ran = threading.Event()
+        runs = []
+
+        def run(question_id, cause_id):
+            runs.append(cause_id)
+            ran.set()
+
+        with patch.object(self.prefetcher, 'run', side_effect=run):
+            for _ in range(3):
+                self.prefetcher.schedule('question', 'cause')
+            self.assertTrue(ran.wait(2))
+            # Leave time for any extra run to show up
+            threading.Event().wait(0.1)
+
+        self.assertEqual(runs, ['cause'])
+        self.assertEqual(self.prefetcher.stats()['scheduled'], 3)
+
+    @override_settings(VALIDATOR={'PREFETCH': {'ENABLED': True, 'DEBOUNCE': 0.05}})
+    def test_failures_are_counted_not_raised(self):
+        done = threading.Event()
+
+        def run(question_id, cause_id):
+            done.set()
+            raise RuntimeError("model down")
+
+        with patch.object(self.prefetcher, 'run', side_effect=run), self.assertLogs('validator.utils.prefetch', 'WARNING'):
+            self.prefetcher.schedule('question', 'cause')
+            self.assertTrue(done.wait(2))
+            threading.Event().wait(0.1)
+
+        self.assertEqual(self.prefetcher.stats()['failed'], 1)
@@ -0,0 +1,93 @@
+from types import SimpleNamespace
+from django.test import SimpleTestCase, override_settings
+from validator.enums import ValidationType
+from validator.utils.prompts import ANALYSIS_CONTEXT, PromptBuilder, TokenUsage, count_tokens, normalize_text
+
+
+class PromptHelpersTest(SimpleTestCase):
+    def test_count_tokens(self):
+        self.assertEqual(count_tokens(""), 0)
+        # "korupsi" is two four-character chunks, "?" is punctuation
+        self.assertEqual(count_tokens("Ada korupsi?"), 4)
+
+    def test_normalize_collapses_whitespace(self):
+        self.assertEqual(normalize_text("  Dana \n\n bansos\tdikorupsi  ", 100), "Dana bansos dikorupsi")
+
+    def test_normalize_truncates_at_word_boundary(self):
+        text = normalize_text("satu dua tiga empat lima", 3)
+        self.assertEqual(text, "satu dua tiga…")
+        self.assertLessEqual(count_tokens(text.rstrip("…")), 3)
+
+    def test_token_usage(self):
+        usage = TokenUsage()
+        usage.add(10)
+        usage.add(5)
+        self.assertEqual(usage.stats(), {'prompts': 2, 'tokens': 15})
+        usage.clear()
+        self.assertEqual(usage.stats(), {'prompts': 0, 'tokens': 0})
+
+
+class PromptBuilderTest(SimpleTestCase):
+    def setUp(self):
+        self.builder = PromptBuilder()
+        self.problem = SimpleNamespace(question="Mengapa jalan desa rusak?")
+        self.parent = SimpleNamespace(cause="Anggaran perbaikan tidak cukup", column=0, row=1)
+        self.cause = SimpleNamespace(cause="Dana dipotong oleh pejabat", column=0, row=2)
+
+    def test_system_deduplicates_blocks(self):
+        system_message = self.builder.system(ANALYSIS_CONTEXT, ANALYSIS_CONTEXT, "Extra.")
+        self.assertEqual(system_message.count(ANALYSIS_CONTEXT), 1)
+        self.assertTrue(system_message.endswith("Extra."))
+
+    def test_cause_validity_uses_parent_by_row(self):
+        _, first_row = self.builder.cause_validity(self.parent, self.problem, None)
+        self.assertIn(self.problem.question, first_row)
+
+        _, next_row = self.builder.cause_validity(self.cause, self.problem, self.parent)
+        self.assertIn(self.parent.cause, next_row)
+        self.assertNotIn(self.problem.question, next_row)
+
+    def test_root_check_names_row(self):
+        _, user_prompt = self.builder.root_check(self.cause, self.problem)
+        self.assertIn("column A, row 2", user_prompt)
+
+    def test_batch_keeps_payload_format(self):
+        _, user_prompt = self.builder.batch([(self.parent, self.problem.question), (self.cause, self.parent.cause)], self.problem)
+        self.assertIn('"cell": "A2"', user_prompt)
+        self.assertIn("]. For every cause", user_prompt)
+
+    def test_each_prompt_has_one_answer_instruction(self):
+        prompts = {
+            'cause_validity': self.builder.cause_validity(self.cause, self.problem, self.parent),
+            'false_feedback': self.builder.false_feedback(self.cause, self.problem, self.parent),
+            'false_feedback_row_1': self.builder.false_feedback(self.parent, self.problem, None),
+            'root_check': self.builder.root_check(self.cause, self.problem),
+            'corruption_category': self.builder.corruption_category(self.cause),
+        }
+        for name, (system_message, user_prompt) in prompts.items():
+            with self.subTest(prompt=name):
+                text = f"{system_message} {user_prompt}"
+                self.assertEqual(text.count('Respond ONLY with a JSON object'), 1)
+                self.assertNotIn('Answer only', text)
+                self.assertNotIn('Answer ONLY', text)
+
+        _, row_1 = prompts['false_feedback_row_1']
+        self.assertTrue(row_1.endswith('where N is 1 or 2.'))
+
+    @override_settings(VALIDATOR={'STRUCTURED_OUTPUT': False})
+    def test_free_text_mode_asks_for_plain_answers(self):
+        _, user_prompt = self.builder.cause_validity(self.parent, self.problem, None)
+        self.assertTrue(user_prompt.endswith('Answer only with True or False.'))
+        self.assertNotIn('JSON', user_prompt)
+
+        _, user_prompt = self.builder.corruption_category(self.cause)
+        self.assertTrue(user_prompt.endswith('Answer ONLY with 1, 2 or 3.'))
+
+    @override_settings(VALIDATOR={'PROMPT': {'CAUSE_MAX_TOKENS': 5}})
+    def test_long_cause_is_truncated(self):
+        builder = PromptBuilder()
+        long_cause = SimpleNamespace(cause="kata " * 500, column=0, row=1)
+        _, user_prompt = builder.corruption_category(long_cause)
+        self.assertIn("kata kata kata kata kata…", user_prompt)
+        # The answer line is a fixed cost on top of the truncated text
+        self.assertLess(count_tokens(user_prompt) - count_tokens(builder.answer_format(ValidationType.ROOT_TYPE)), 40)
@@ -0,0 +1,106 @@
+import threading
+import uuid
+from django.core.cache import cache
+from django.test import TestCase, TransactionTestCase, override_settings
+from unittest.mock import patch
+from cause.models import Causes
+from question.models import Question
+from validator.exceptions import ValidationInProgressException
+from validator.services import CausesService
+from validator.utils.question_lock import QuestionLock
+
+
+class QuestionLockTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.question_id = uuid.uuid4()
+
+    def test_sqlite_uses_cache_lock(self):
+        self.assertEqual(QuestionLock(self.question_id).strategy, QuestionLock.CACHE)
+
+    def test_lock_is_exclusive_per_question(self):
+        first, second = QuestionLock(self.question_id), QuestionLock(self.question_id)
+
+        self.assertTrue(first.acquire())
+        self.assertFalse(second.acquire())
+        # Other questions are not affected
+        self.assertTrue(QuestionLock(uuid.uuid4()).acquire())
+
+        first.release()
+        self.assertTrue(second.acquire())
+
+    def test_acquire_polls_until_timeout(self):
+        now = [0.0]
+        sleeps = []
+
+        def sleep(seconds):
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        QuestionLock(self.question_id).acquire()
+        waiting = QuestionLock(self.question_id, clock=lambda: now[0], sleep=sleep)
+
+        self.assertFalse(waiting.acquire(timeout=1))
+        self.assertEqual(len(sleeps), 5)
+
+    def test_release_keeps_lock_taken_over_after_expiry(self):
+        first = QuestionLock(self.question_id)
+        first.acquire()
+        # The lock expired and another run took it
+        cache.set(first._cache_key(), 'other-run')
+
+        first.release()
+
+        self.assertEqual(cache.get(first._cache_key()), 'other-run')
+
+    def test_advisory_key_is_stable_signed_64_bit(self):
+        key = QuestionLock(self.question_id)._advisory_key()
+
+        self.assertEqual(key, QuestionLock(self.question_id)._advisory_key())
+        self.assertTrue(-2 ** 63 <= key < 2 ** 63)
+
+
+class CoalescedValidationTest(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        self.question = Question.objects.create(question="Test question")
+        self.cause = Causes.objects.create(question=self.question, cause="Cause A1", row=1, column=0)
+
+    @override_settings(VALIDATOR={'LOCK': {'WAIT_TIMEOUT': 5, 'POLL_INTERVAL': 0.01}})
+    @patch.object(CausesService, '_validate')
+    def test_concurrent_request_returns_running_result(self, mock_validate):
+        running = QuestionLock(self.question.id)
+        running.acquire()
+
+        def finish_run():
+            Causes.objects.filter(pk=self.cause.pk).update(status=True)
+            running.release()
+
+        timer = threading.Timer(0.05, finish_run)
+        timer.start()
+        try:
+            causes = CausesService().validate(self.question.id, request=None)
+        finally:
+            timer.join()
+
+        mock_validate.assert_not_called()
+        self.assertTrue(causes[0].status)
+
+    @override_settings(VALIDATOR={'LOCK': {'WAIT_TIMEOUT': 0.05, 'POLL_INTERVAL': 0.01}})
+    @patch.object(CausesService, '_validate')
+    def test_gives_up_when_running_validation_takes_too_long(self, mock_validate):
+        running = QuestionLock(self.question.id)
+        running.acquire()
+        try:
+            with self.assertRaises(ValidationInProgressException):
+                CausesService().validate(self.question.id, request=None)
+        finally:
+            running.release()
+
+        mock_validate.assert_not_called()
+
+    @patch.object(CausesService, '_validate', return_value=[])
+    def test_lock_is_released_after_run(self, mock_validate):
+        CausesService().validate(self.question.id, request=None)
+
+        self.assertTrue(QuestionLock(self.question.id).acquire())
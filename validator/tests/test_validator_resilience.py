@@ -0,0 +1,160 @@
+import groq
+import httpx
+from django.test import SimpleTestCase, override_settings
+from unittest.mock import Mock
+from validator.exceptions import AIServiceErrorException
+from validator.utils.resilience import CircuitBreaker, ResilientCaller
+
+REQUEST = httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions')
+
+
+def status_error(error_class, status_code, headers=None):
+    response = httpx.Response(status_code, headers=headers or {}, request=REQUEST)
+    return error_class("error", response=response, body=None)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+RESILIENCE = {'DEADLINE': 30.0, 'MAX_RETRIES': 2, 'BACKOFF_BASE': 0.5, 'BACKOFF_MAX': 8.0}
+
+
+@override_settings(VALIDATOR={'GROQ_RESILIENCE': RESILIENCE})
+class ResilientCallerTest(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0, clock=self.clock)
+        self.caller = ResilientCaller(breaker=self.breaker, sleep=self.clock.sleep, clock=self.clock)
+
+    def test_success_passes_attempt_timeout(self):
+        func = Mock(return_value="answer")
+
+        self.assertEqual(self.caller.call(func), "answer")
+        func.assert_called_once_with(20.0)
+        self.assertEqual(self.caller.stats()['successes'], 1)
+
+    def test_retries_transient_errors(self):
+        func = Mock(side_effect=[groq.APITimeoutError(request=REQUEST), status_error(groq.InternalServerError, 503), "answer"])
+
+        self.assertEqual(self.caller.call(func), "answer")
+
+        stats = self.caller.stats()
+        self.assertEqual(stats['retries'], 2)
+        self.assertEqual(stats['timeouts'], 1)
+        self.assertEqual(stats['circuit']['state'], CircuitBreaker.CLOSED)
+
+    def test_backoff_is_jittered_and_capped(self):
+        func = Mock(side_effect=[groq.APIConnectionError(request=REQUEST)] * 2 + ["answer"])
+
+        self.caller.call(func)
+
+        # Full jitter keeps the two waits within 0.5s and 1s
+        self.assertLessEqual(self.clock.now, 1.5)
+
+    def test_honors_retry_after(self):
+        func = Mock(side_effect=[status_error(groq.RateLimitError, 429, {'retry-after': '7'}), "answer"])
+
+        self.caller.call(func)
+
+        self.assertEqual(self.clock.now, 7.0)
+
+    def test_retry_after_beyond_deadline_fails_fast(self):
+        func = Mock(side_effect=[status_error(groq.RateLimitError, 429, {'retry-after': '120'})])
+
+        with self.assertRaises(AIServiceErrorException):
+            self.caller.call(func)
+
+        self.assertEqual(self.clock.now, 0.0)
+        func.assert_called_once()
+
+    def test_gives_up_after_max_retries(self):
+        func = Mock(side_effect=groq.APIConnectionError(request=REQUEST))
+
+        with self.assertRaises(AIServiceErrorException):
+            self.caller.call(func)
+
+        self.assertEqual(func.call_count, 3)
+        self.assertEqual(self.caller.stats()['failures'], 1)
+
+    def test_client_errors_are_not_retried(self):
+        func = Mock(side_effect=status_error(groq.BadRequestError, 400))
+
+        with self.assertRaises(AIServiceErrorException):
+            self.caller.call(func)
+
+        func.assert_called_once()
+        self.assertEqual(self.breaker.stats()['consecutive_failures'], 0)
+
+    def test_client_error_on_half_open_trial_closes_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0, clock=self.clock)
+        caller = ResilientCaller(breaker=breaker, sleep=self.clock.sleep, clock=self.clock)
+        with override_settings(VALIDATOR={'GROQ_RESILIENCE': dict(RESILIENCE, MAX_RETRIES=0)}):
+            with self.assertRaises(AIServiceErrorException):
+                caller.call(Mock(side_effect=groq.APIConnectionError(request=REQUEST)))
+            self.assertEqual(breaker.state, CircuitBreaker.OPEN)
+
+            self.clock.now += 10.0
+            with self.assertRaises(AIServiceErrorException):
+                caller.call(Mock(side_effect=status_error(groq.BadRequestError, 400)))
+
+            # The trial call was answered, so later calls go through again
+            self.assertEqual(breaker.state, CircuitBreaker.CLOSED)
+            self.assertEqual(caller.call(Mock(return_value="answer")), "answer")
+
+    def test_open_circuit_fails_fast(self):
+        for _ in range(5):
+            self.breaker.record_failure()
+        func = Mock(return_value="answer")
+
+        with self.assertRaises(AIServiceErrorException):
+            self.caller.call(func)
+
+        func.assert_not_called()
+        self.assertEqual(self.caller.stats()['circuit']['rejected'], 1)
+
+
+class CircuitBreakerTest(SimpleTestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0, clock=self.clock)
+
+    def test_opens_after_consecutive_failures(self):
+        self.breaker.record_failure()
+        self.breaker.record_success()
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+
+        self.breaker.record_failure()
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertFalse(self.breaker.allow())
+
+    def test_half_open_trial_closes_on_success(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10.0
+
+        self.assertTrue(self.breaker.allow())
+        self.assertFalse(self.breaker.allow())  # Only one trial call at a time
+        self.breaker.record_success()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.CLOSED)
+        self.assertEqual(self.breaker.stats()['half_opened'], 1)
+
+    def test_half_open_trial_reopens_on_failure(self):
+        self.breaker.record_failure()
+        self.breaker.record_failure()
+        self.clock.now = 10.0
+        self.breaker.allow()
+
+        self.breaker.record_failure()
+
+        self.assertEqual(self.breaker.state, CircuitBreaker.OPEN)
+        self.assertEqual(self.breaker.stats()['opened'], 2)
@@ -0,0 +1,47 @@
+from django.test import SimpleTestCase
+from validator.enums import ValidationType
+from validator.utils.rule_classifier import RuleClassifier
+
+
+class RuleClassifierTest(SimpleTestCase):
+    def setUp(self):
+        self.classifier = RuleClassifier()
+
+    def test_corruption_related(self):
+        self.assertTrue(self.classifier.is_corruption_related("Dana desa DIKORUPSI kepala desa"))
+        self.assertTrue(self.classifier.is_corruption_related("Ada pungutan liar di loket"))
+        self.assertFalse(self.classifier.is_corruption_related("Kurangnya pelatihan karyawan"))
+        self.assertFalse(self.classifier.is_corruption_related(None))
+
+    def test_corruption_category(self):
+        self.assertEqual(self.classifier.corruption_category("Pejabat menerima gratifikasi"), 1)
+        self.assertEqual(self.classifier.corruption_category("Nepotisme dalam rekrutmen"), 2)
+        self.assertEqual(self.classifier.corruption_category("Pilih kasih karena hubungan pribadi"), 3)
+
+    def test_corruption_category_left_to_llm(self):
+        # No category term, or terms from more than one category
+        self.assertIsNone(self.classifier.corruption_category("Korupsi anggaran proyek"))
+        self.assertIsNone(self.classifier.corruption_category("Suap untuk kolusi tender"))
+
+    def test_obvious_invalid(self):
+        question = "Mengapa jalan desa rusak?"
+        self.assertEqual(self.classifier.obvious_invalid("mengapa jalan desa rusak", question, question, first_row=True), 1)
+        self.assertEqual(self.classifier.obvious_invalid("Dana kurang!", "dana kurang", question, first_row=False), 3)
+        self.assertIsNone(self.classifier.obvious_invalid("Dana dipotong", "Dana kurang", question, first_row=False))
+        self.assertIsNone(self.classifier.obvious_invalid("  ", "Dana kurang", question, first_row=False))
+
+    def test_configurable_terms(self):
+        classifier = RuleClassifier({'CORRUPTION_TERMS': ['upeti'], 'CATEGORY_TERMS': {2: ['upeti']}})
+
+        self.assertTrue(classifier.is_corruption_related("Setoran upeti ke atasan"))
+        self.assertFalse(classifier.is_corruption_related("Ada suap"))
+        self.assertEqual(classifier.corruption_category("Setoran upeti"), 2)
+
+    def test_saved_calls(self):
+        self.classifier.record_saved(ValidationType.NORMAL)
+        self.classifier.record_saved(ValidationType.FALSE)
+        self.classifier.record_saved(ValidationType.ROOT_TYPE)
+
+        self.assertEqual(self.classifier.stats(), {'normal': 1, 'false': 1, 'root_type': 1, 'total': 3})
+        self.classifier.clear()
+        self.assertEqual(self.classifier.stats(), {'total': 0})
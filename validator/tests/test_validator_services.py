@@ -1,5 +1,10 @@
+import json
 import uuid
-from django.test import TestCase, TransactionTestCase
+import groq
+import httpx
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from unittest.mock import patch, Mock, call, ANY
 from requests.exceptions import RequestException
 from validator.constants import FeedbackMsg, ErrorMsg
@@ -8,11 +13,20 @@ from validator.exceptions import AIServiceErrorException
 from cause.models import Causes
 from question.models import Question
 from validator.services import CausesService
+from cause.services import CausesService as CauseEditService
+from validator.utils.groq_client import groq_clients
+from validator.utils.resilience import groq_resilience
+from validator.utils.verdict_cache import verdict_cache
+from django.core.cache import cache
 
 class CausesServiceTest(TransactionTestCase):
     def setUp(self):
         """Set up test data before each test method"""
         self.service = CausesService()
+        cache.clear()
+        verdict_cache.clear()
+        groq_clients.close()
+        groq_resilience.reset()
         self.question_id = uuid.uuid4()
         self.question = Question.objects.create(
             id=self.question_id,
@@ -55,14 +69,19 @@ class CausesServiceTest(TransactionTestCase):
         self.mock_request.user = Mock(is_authenticated=True)
         self.mock_request.user.id = "test-user-123"
         
+    def _replace_cause(self, **fields):
+        """Create a cause, replacing the one setUp put in the same cell"""
+        Causes.objects.filter(question_id=fields['question_id'], column=fields['column'], row=fields['row']).delete()
+        return Causes.objects.create(**fields)
+
     def tearDown(self):
         """Clean up after each test method"""
         # Using try-except to handle any cleanup issues
         Causes.objects.all().delete()
         Question.objects.all().delete()
 
-    @patch('validator.services.Groq')
-
+    @override_settings(VALIDATOR={'STRUCTURED_OUTPUT': False})
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_normal_validation_true(self, mock_groq):
         """Test API call with normal validation returning true"""
         # Configure mock
@@ -101,10 +120,98 @@ class CausesServiceTest(TransactionTestCase):
             top_p=0.95,
             stream=False,
             reasoning_format="hidden",
-            seed=42
+            seed=42,
+            timeout=ANY
+        )
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_api_call_structured_output(self, mock_groq):
+        """Test single verdicts are requested and parsed as JSON objects"""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content='{"verdict": false}'))])
+        mock_groq.return_value = mock_client
+
+        result = self.service.api_call(
+            system_message="Test system message",
+            user_prompt="Is this cause valid? Answer only with True/False",
+            validation_type=ValidationType.NORMAL,
+            request=self.mock_request
+        )
+
+        self.assertEqual(result, 0)
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        self.assertEqual(kwargs['response_format'], {"type": "json_object"})
+        # The answer format is part of the prompts, not appended to them
+        self.assertEqual(kwargs['messages'][0]['content'], "Test system message")
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_api_call_retries_without_json_mode_when_json_validation_fails(self, mock_groq):
+        """Test a json_validate_failed 400 falls back to a free-text answer"""
+        response = httpx.Response(400, request=httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions'))
+        json_failed = groq.BadRequestError(
+            "Failed to generate JSON", response=response,
+            body={'error': {'code': 'json_validate_failed', 'failed_generation': 'True'}}
         )
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = [json_failed, Mock(choices=[Mock(message=Mock(content='True'))])]
+        mock_groq.return_value = mock_client
+
+        result = self.service.api_call(
+            system_message="Test system message",
+            user_prompt="Is this cause valid?",
+            validation_type=ValidationType.NORMAL,
+            request=self.mock_request
+        )
+
+        self.assertEqual(result, 1)
+        first, second = mock_client.chat.completions.create.call_args_list
+        self.assertEqual(first.kwargs['response_format'], {"type": "json_object"})
+        self.assertNotIn('response_format', second.kwargs)
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_api_call_other_bad_requests_still_fail(self, mock_groq):
+        """Test only json_validate_failed is retried without JSON mode"""
+        response = httpx.Response(400, request=httpx.Request('POST', 'https://api.groq.com/openai/v1/chat/completions'))
+        mock_client = Mock()
+        mock_client.chat.completions.create.side_effect = groq.BadRequestError(
+            "Bad request", response=response, body={'error': {'code': 'model_not_found'}}
+        )
+        mock_groq.return_value = mock_client
 
-    @patch('validator.services.Groq')
+        with self.assertRaises(AIServiceErrorException):
+            self.service.api_call("Test system message", "Is this cause valid?", ValidationType.NORMAL)
+
+        mock_client.chat.completions.create.assert_called_once()
+
+    @patch.object(CausesService, '_chat', return_value='{"verdict": true}')
+    def test_api_call_counts_tokens_only_when_sent(self, mock_chat):
+        """Test cache hits do not add to the tokens sent for a validation"""
+        for _ in range(2):
+            self.service.api_call(
+                system_message="Test system message",
+                user_prompt="Is this cause valid?",
+                validation_type=ValidationType.NORMAL,
+                request=self.mock_request
+            )
+
+        mock_chat.assert_called_once()
+        usage = self.service.token_usage.stats()
+        self.assertEqual(usage['prompts'], 1)
+        self.assertGreater(usage['tokens'], 0)
+
+    @override_settings(VALIDATOR={'PROMPT': {'CAUSE_MAX_TOKENS': 10}})
+    @patch.object(CausesService, 'api_call', return_value=0)
+    def test_validate_truncates_long_cause_text(self, mock_api_call):
+        """Test user text is held to the configured token budget in prompts"""
+        Causes.objects.filter(pk=self.test_causes[0].pk).update(cause="sebab " * 300)
+
+        CausesService().validate(question_id=self.question_id, request=self.mock_request)
+
+        user_prompt = mock_api_call.call_args_list[0].kwargs['user_prompt']
+        self.assertIn("sebab…", user_prompt)
+        self.assertLess(len(user_prompt), 300)
+
+    @patch('validator.utils.groq_client.Groq')
 
     def test_api_call_normal_validation_false(self, mock_groq):
         """Test API call with normal validation returning false"""
@@ -129,7 +236,7 @@ class CausesServiceTest(TransactionTestCase):
         # Verify
         self.assertEqual(result, 0)
 
-    @patch('validator.services.Groq')
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_root_validation_true(self, mock_groq):
         """Test API call with root validation returning true"""
         # Configure mock
@@ -153,7 +260,7 @@ class CausesServiceTest(TransactionTestCase):
         # Verify
         self.assertEqual(result, 1)
 
-    @patch('validator.services.Groq')
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_false_validation_type_1(self, mock_groq):
         """Test API call with false validation returning type 1"""
         # Configure mock
@@ -177,7 +284,7 @@ class CausesServiceTest(TransactionTestCase):
         # Verify
         self.assertEqual(result, 1)
 
-    @patch('validator.services.Groq')
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_root_type_validation(self, mock_groq):
         """Test API call with root type validation"""
         # Configure mock
@@ -201,7 +308,8 @@ class CausesServiceTest(TransactionTestCase):
         # Verify
         self.assertEqual(result, 2)
 
-    @patch('validator.services.Groq')
+    @override_settings(VALIDATOR={'GROQ_RESILIENCE': {'MAX_RETRIES': 0}})
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_request_exception(self, mock_groq):
         """Test API call handling request exception"""
         # Configure mock
@@ -223,7 +331,7 @@ class CausesServiceTest(TransactionTestCase):
         
         self.assertEqual(str(context.exception), ErrorMsg.AI_SERVICE_ERROR)
 
-    @patch('validator.services.Groq')
+    @patch('validator.utils.groq_client.Groq')
     def test_api_call_unexpected_response(self, mock_groq):
         """Test API call handling unexpected response"""
         # Configure mock
@@ -245,9 +353,45 @@ class CausesServiceTest(TransactionTestCase):
         )
         
         # Verify
-        self.assertEqual(result, 0)  # Default value for unexpected responses
+        self.assertIsNone(result)  # No verdict for unexpected responses
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_api_call_reuses_cached_verdict(self, mock_groq):
+        """Test identical prompts are answered from the verdict cache"""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content='true'))])
+        mock_groq.return_value = mock_client
+
+        for _ in range(3):
+            result = self.service.api_call(
+                system_message="Test system message",
+                user_prompt="Is this cause valid? Answer only with True/False",
+                validation_type=ValidationType.NORMAL,
+                request=self.mock_request
+            )
+            self.assertEqual(result, 1)
+
+        mock_client.chat.completions.create.assert_called_once()
+        self.assertEqual(verdict_cache.stats()['hits'], 2)
+
+    @patch('validator.utils.groq_client.Groq')
+    def test_api_call_does_not_cache_unexpected_response(self, mock_groq):
+        """Test unrecognized answers are retried instead of cached"""
+        mock_client = Mock()
+        mock_client.chat.completions.create.return_value = Mock(choices=[Mock(message=Mock(content='unexpected'))])
+        mock_groq.return_value = mock_client
+
+        for _ in range(2):
+            self.service.api_call(
+                system_message="Test system message",
+                user_prompt="Is this cause valid? Answer only with True/False",
+                validation_type=ValidationType.NORMAL,
+                request=self.mock_request
+            )
 
-    @patch('validator.services.Groq')
+        self.assertEqual(mock_client.chat.completions.create.call_count, 2)
+
+    @patch('validator.utils.groq_client.Groq')
     def test_check_if_corruption_related_true(self, mock_groq):
         """Test detection of corruption-related causes - positive case"""
         # Test various corruption terms
@@ -275,7 +419,7 @@ class CausesServiceTest(TransactionTestCase):
             result = self.service.check_if_corruption_related(cause_text)
             self.assertTrue(result, f"Should detect corruption in: '{cause_text}'")
 
-    @patch('validator.services.Groq')
+    @patch('validator.utils.groq_client.Groq')
     def test_check_if_corruption_related_false(self, mock_groq):
         """Test detection of corruption-related causes - negative case"""
         # Test non-corruption cases
@@ -463,7 +607,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 1  # Valid cause
         
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Valid first cause",
             row=1,
@@ -490,7 +634,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 0  # Invalid cause
         
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Invalid first cause",
             row=1,
@@ -518,7 +662,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 1  # Valid cause
         
         # Test data
-        prev_cause = Causes.objects.create(
+        prev_cause = self._replace_cause(
             question_id=self.question_id,
             cause="Valid previous cause",
             row=1,
@@ -526,7 +670,7 @@ class CausesServiceTest(TransactionTestCase):
             status=True
         )
         
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Valid next cause",
             row=2,
@@ -552,7 +696,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 0  # Invalid cause
         
         # Test data
-        prev_cause = Causes.objects.create(
+        prev_cause = self._replace_cause(
             question_id=self.question_id,
             cause="Valid previous cause",
             row=1,
@@ -560,7 +704,7 @@ class CausesServiceTest(TransactionTestCase):
             status=True
         )
         
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Invalid next cause",
             row=2,
@@ -588,7 +732,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 1  # Valid cause
         
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Terjadi korupsi dana proyek",  # Contains corruption term
             row=1,
@@ -604,14 +748,14 @@ class CausesServiceTest(TransactionTestCase):
         cause.refresh_from_db()
         self.assertTrue(cause.status)
         self.assertTrue(cause.root_status)
-        mock_categorize.assert_called_once_with(cause)
+        mock_categorize.assert_called_once_with(cause, commit=False)
         # check_root_cause shouldn't be called for corruption-related causes
         mock_api_call.assert_called_once()
 
     def test_validate_single_cause_empty_cause(self):
         """Test validating an empty cause - should be skipped"""
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="",  # Empty cause
             row=1,
@@ -629,7 +773,7 @@ class CausesServiceTest(TransactionTestCase):
     def test_validate_single_cause_missing_previous(self):
         """Test validating a cause when previous cause is missing"""
         # Test data for row > 1 without previous cause data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Test cause without previous",
             row=2,
@@ -657,7 +801,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_api_call.return_value = 0  # Not a root cause
         
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="This is not a root cause",
             row=2,
@@ -673,6 +817,7 @@ class CausesServiceTest(TransactionTestCase):
         self.assertFalse(cause.root_status)
         mock_api_call.assert_called_once()
 
+    @override_settings(VALIDATOR={'RULES': {'ENABLED': False}})
     @patch.object(CausesService, 'api_call')
     def test_categorize_corruption_harta(self, mock_api_call):
         """Test categorizing corruption as Harta"""
@@ -697,6 +842,7 @@ class CausesServiceTest(TransactionTestCase):
         self.assertTrue(f"{FeedbackMsg.ROOT_FOUND.format(column='A')} Korupsi Harta." in cause.feedback)
         mock_api_call.assert_called_once()
 
+    @override_settings(VALIDATOR={'RULES': {'ENABLED': False}})
     @patch.object(CausesService, 'api_call')
     def test_categorize_corruption_tahta(self, mock_api_call):
         """Test categorizing corruption as Tahta"""
@@ -721,6 +867,7 @@ class CausesServiceTest(TransactionTestCase):
         self.assertTrue(f"{FeedbackMsg.ROOT_FOUND.format(column='B')} Korupsi Tahta." in cause.feedback)
         mock_api_call.assert_called_once()
 
+    @override_settings(VALIDATOR={'RULES': {'ENABLED': False}})
     @patch.object(CausesService, 'api_call')
     def test_categorize_corruption_cinta(self, mock_api_call):
         """Test categorizing corruption as Cinta"""
@@ -745,11 +892,80 @@ class CausesServiceTest(TransactionTestCase):
         self.assertTrue(f"{FeedbackMsg.ROOT_FOUND.format(column='C')} Korupsi Cinta." in cause.feedback)
         mock_api_call.assert_called_once()
 
+    @patch.object(CausesService, 'api_call')
+    def test_categorize_corruption_by_rule(self, mock_api_call):
+        """Test a cause naming its category is categorized without the LLM"""
+        cause = Causes.objects.create(
+            question_id=self.question_id,
+            cause="Pejabat menerima suap dari kontraktor",
+            row=3,
+            column=0,
+            status=True,
+            root_status=True
+        )
+
+        self.service.categorize_corruption(cause)
+
+        cause.refresh_from_db()
+        self.assertIn("Korupsi Harta.", cause.feedback)
+        mock_api_call.assert_not_called()
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_single_cause_repeating_previous_cause(self, mock_api_call):
+        """Test a cause repeating the cause above it is rejected without the LLM"""
+        prev_cause = Causes(question_id=self.question_id, cause="Anggaran tidak cukup", row=1, column=0, status=True)
+        cause = self._replace_cause(
+            question_id=self.question_id,
+            cause="  anggaran TIDAK cukup. ",
+            row=2,
+            column=0,
+            status=False
+        )
+
+        self.service._validate_single_cause(cause, self.question, prev_cause, self.mock_request)
+
+        cause.refresh_from_db()
+        self.assertFalse(cause.status)
+        self.assertEqual(cause.feedback, FeedbackMsg.FALSE_ROW_N_SIMILAR_PREVIOUS.format(column='A', row=2))
+        mock_api_call.assert_not_called()
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_single_cause_near_duplicate_of_previous_cause(self, mock_api_call):
+        """Test a near-identical rewording of the cause above it is rejected without the LLM"""
+        prev_cause = Causes(question_id=self.question_id, cause="Dana desa dipotong oleh kepala desa", row=1, column=0, status=True)
+        cause = self._replace_cause(
+            question_id=self.question_id,
+            cause="Dana desa dipotong oleh kepala desa itu",
+            row=2,
+            column=0,
+            status=False
+        )
+
+        self.service._validate_single_cause(cause, self.question, prev_cause, self.mock_request)
+
+        cause.refresh_from_db()
+        self.assertFalse(cause.status)
+        self.assertEqual(cause.feedback, FeedbackMsg.FALSE_ROW_N_SIMILAR_PREVIOUS.format(column='A', row=2))
+        self.assertGreaterEqual(cause.similarity, 0.8)
+        mock_api_call.assert_not_called()
+
+    @patch.object(CausesService, 'api_call', return_value=1)
+    def test_validate_reports_similarity_to_other_columns(self, mock_api_call):
+        """Test the similarity to a cause in another column is stored and returned, not rejected"""
+        Causes.objects.filter(pk=self.test_causes[1].pk).update(cause="First cause in column A")
+
+        causes = CausesService().validate(question_id=self.question_id, request=self.mock_request)
+
+        by_pk = {cause.pk: cause for cause in causes}
+        self.assertTrue(by_pk[self.test_causes[1].pk].status)
+        self.assertEqual(by_pk[self.test_causes[1].pk].similarity, 1.0)
+        self.assertEqual(Causes.objects.get(pk=self.test_causes[0].pk).similarity, 1.0)
+
     # Test untuk fungsi _get_previous_cause
     def test_get_previous_cause_valid(self):
         """Test getting a valid previous cause"""
         # Set up test data
-        prev_cause = Causes.objects.create(
+        prev_cause = self._replace_cause(
             question_id=self.question_id,
             cause="Valid previous cause",
             row=1,
@@ -757,7 +973,7 @@ class CausesServiceTest(TransactionTestCase):
             status=True  # Valid cause
         )
         
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Current cause",
             row=2,
@@ -774,7 +990,7 @@ class CausesServiceTest(TransactionTestCase):
     def test_get_previous_cause_row_1(self):
         """Test getting previous cause for row 1 (should return None)"""
         # Set up test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="First row cause",
             row=1,
@@ -791,7 +1007,7 @@ class CausesServiceTest(TransactionTestCase):
     def test_get_previous_cause_invalid_previous(self):
         """Test getting previous cause when previous is invalid"""
         # Set up test data with an invalid previous cause
-        Causes.objects.create(
+        self._replace_cause(
             question_id=self.question_id,
             cause="Invalid previous cause",
             row=1,
@@ -799,7 +1015,7 @@ class CausesServiceTest(TransactionTestCase):
             status=False  # Invalid cause
         )
         
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Current cause",
             row=2,
@@ -816,7 +1032,7 @@ class CausesServiceTest(TransactionTestCase):
     def test_get_previous_cause_empty_previous(self):
         """Test getting previous cause when previous is empty"""
         # Set up test data with an empty previous cause
-        Causes.objects.create(
+        self._replace_cause(
             question_id=self.question_id,
             cause="",  # Empty cause
             row=1,
@@ -824,7 +1040,7 @@ class CausesServiceTest(TransactionTestCase):
             status=True  # Valid but empty
         )
         
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="Current cause",
             row=2,
@@ -882,12 +1098,12 @@ class CausesServiceTest(TransactionTestCase):
                     # Verify - don't refresh from DB, use the object directly
                     self.assertTrue(cause.root_status)
                     mock_api_call.assert_called_once()
-                    mock_categorize.assert_called_once_with(cause)
+                    mock_categorize.assert_called_once_with(cause, commit=False)
     
     def test_check_root_cause_skip_empty(self):
         """Test root cause check skips empty causes"""
         # Test data
-        cause = Causes.objects.create(
+        cause = self._replace_cause(
             question_id=self.question_id,
             cause="",  # Empty cause
             row=2,
@@ -984,7 +1200,7 @@ class CausesServiceTest(TransactionTestCase):
     def test_ensure_next_rows_exist_with_root(self):
         """Test _ensure_next_rows_exist when column already has a root cause"""
         # Set up a column with a root cause
-        Causes.objects.create(
+        self._replace_cause(
             question_id=self.question_id,
             cause="Root cause",
             row=3,
@@ -994,7 +1210,7 @@ class CausesServiceTest(TransactionTestCase):
         )
         
         # Add more causes to ensure we have valid rows
-        Causes.objects.create(
+        self._replace_cause(
             question_id=self.question_id,
             cause="Valid cause 1",
             row=1,
@@ -1002,7 +1218,7 @@ class CausesServiceTest(TransactionTestCase):
             status=True
         )
         
-        Causes.objects.create(
+        self._replace_cause(
             question_id=self.question_id,
             cause="Valid cause 2",
             row=2,
@@ -1022,6 +1238,7 @@ class CausesServiceTest(TransactionTestCase):
         
         # Execute
         self.service._ensure_next_rows_exist(self.question_id)
+        self.service.grid.save()
         
         # Count causes after
         causes_count_after = Causes.objects.filter(question_id=self.question_id).count()
@@ -1048,6 +1265,7 @@ class CausesServiceTest(TransactionTestCase):
         
         # Execute
         self.service._ensure_next_rows_exist(self.question_id)
+        self.service.grid.save()
         
         # Count causes after
         causes_count_after = Causes.objects.filter(question_id=self.question_id).count()
@@ -1076,6 +1294,7 @@ class CausesServiceTest(TransactionTestCase):
         
         # Execute
         self.service._ensure_next_rows_exist(self.question_id)
+        self.service.grid.save()
         
         # Count causes after
         causes_count_after = Causes.objects.filter(question_id=self.question_id).count()
@@ -1126,6 +1345,7 @@ class CausesServiceTest(TransactionTestCase):
         
         # Execute
         self.service._ensure_next_rows_exist(self.question_id)
+        self.service.grid.save()
         
         # Count causes after
         causes_count_after = Causes.objects.filter(question_id=self.question_id).count()
@@ -1190,19 +1410,58 @@ class CausesServiceTest(TransactionTestCase):
             )
         
         # Get the unvalidated causes
-        unvalidated_causes = Causes.objects.filter(question_id=self.question_id, status=False)
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
         problem = Question.objects.get(pk=self.question_id)
         
         # Execute the method directly
         with patch.object(Causes, 'save'):
             self.service._validate_first_row_causes(unvalidated_causes, problem, self.mock_request)
         
-        # Verify row 1 causes were validated
+        # Verify row 1 causes were validated (concurrently, so in any order)
         calls = []
         for cause in row1_causes:
-            calls.append(call(cause, problem, None, self.mock_request))
+            calls.append(call(cause, problem, None, self.mock_request, commit=False))
             
-        mock_validate_single_cause.assert_has_calls(calls, any_order=False)
+        mock_validate_single_cause.assert_has_calls(calls, any_order=True)
+        self.assertEqual(mock_validate_single_cause.call_count, 3)
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_first_row_causes_writes_back_in_one_batch(self, mock_api_call):
+        """Test row 1 verdicts are persisted with one bulk update when the grid is saved"""
+        # NORMAL -> valid, ROOT -> not a root cause
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 1 if validation_type == ValidationType.NORMAL else 0
+
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
+        problem = Question.objects.get(pk=self.question_id)
+
+        with patch.object(Causes, 'save') as mock_save:
+            with patch.object(Causes.objects, 'bulk_update', wraps=Causes.objects.bulk_update) as mock_bulk_update:
+                self.service._validate_first_row_causes(unvalidated_causes, problem, self.mock_request)
+                self.service.grid.save()
+
+        mock_save.assert_not_called()
+        mock_bulk_update.assert_called_once()
+        for cause in Causes.objects.filter(question_id=self.question_id, row=1):
+            self.assertTrue(cause.status)
+            self.assertFalse(cause.root_status)
+        # Row 2 causes are left for the column pass
+        self.assertFalse(Causes.objects.get(question_id=self.question_id, row=2).status)
+
+    @patch.object(CausesService, '_validate_single_cause')
+    def test_validate_first_row_causes_persists_finished_chains_on_error(self, mock_validate_single_cause):
+        """Test a failing row 1 chain does not discard the other verdicts"""
+        def side_effect(cause, *args, **kwargs):
+            if cause.column == 1:
+                raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+            cause.status = True
+
+        mock_validate_single_cause.side_effect = side_effect
+
+        with self.assertRaises(AIServiceErrorException):
+            self.service.validate(self.question_id, self.mock_request)
+
+        self.assertTrue(Causes.objects.get(question_id=self.question_id, row=1, column=0).status)
+        self.assertFalse(Causes.objects.get(question_id=self.question_id, row=1, column=1).status)
     
     @patch.object(CausesService, '_validate_single_cause')
     @patch.object(CausesService, '_get_previous_cause')
@@ -1233,14 +1492,14 @@ class CausesServiceTest(TransactionTestCase):
         mock_get_previous.return_value = col_a_row_1  # Return valid previous cause
         
         # Get unvalidated causes
-        unvalidated_causes = Causes.objects.filter(question_id=self.question_id, status=False)
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
         problem = Question.objects.get(pk=self.question_id)
         
         # Execute directly
         self.service._process_column_causes(unvalidated_causes, 0, problem, self.mock_request)
         
         # Verify column A row 2 was validated with correct previous cause
-        mock_validate_single_cause.assert_called_with(col_a_row_2, problem, col_a_row_1, self.mock_request)
+        mock_validate_single_cause.assert_called_with(col_a_row_2, problem, col_a_row_1, self.mock_request, commit=False)
     
     def test_column_has_root_cause(self):
         """Test _column_has_root_cause correctly checks for root causes"""
@@ -1271,8 +1530,8 @@ class CausesServiceTest(TransactionTestCase):
             root_status=True
         )
         
-        # Check that column now has root cause
-        result = self.service._column_has_root_cause(self.question_id, 0)
+        # Check that column now has root cause (on a freshly loaded grid)
+        result = CausesService()._column_has_root_cause(self.question_id, 0)
         self.assertTrue(result)
     
     @patch.object(CausesService, '_validate_single_cause')
@@ -1313,7 +1572,7 @@ class CausesServiceTest(TransactionTestCase):
         mock_get_previous.return_value = row1_cause
         
         # Get unvalidated causes
-        unvalidated_causes = Causes.objects.filter(question_id=self.question_id, status=False)
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
         problem = Question.objects.get(pk=self.question_id)
         
         # Execute
@@ -1324,7 +1583,7 @@ class CausesServiceTest(TransactionTestCase):
             self.assertNotEqual(call_args[0][0], empty_cause)
         
         # Verify non-empty cause was validated
-        mock_validate_single_cause.assert_called_with(non_empty_cause, problem, row1_cause, self.mock_request)
+        mock_validate_single_cause.assert_called_with(non_empty_cause, problem, row1_cause, self.mock_request, commit=False)
     
     @patch.object(CausesService, '_validate_single_cause')
     @patch.object(CausesService, '_get_previous_cause')
@@ -1347,19 +1606,15 @@ class CausesServiceTest(TransactionTestCase):
         mock_get_previous.return_value = None
         
         # Get unvalidated causes
-        unvalidated_causes = Causes.objects.filter(question_id=self.question_id, status=False)
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
         problem = Question.objects.get(pk=self.question_id)
         
-        # Execute with a patched save method to capture the feedback
-        with patch.object(Causes, 'save') as mock_save:
-            def side_effect():
-                cause.feedback = f"Perlu validasi sebab di baris {cause.row-1} kolom {'ABCDE'[cause.column]} terlebih dahulu."
-            
-            mock_save.side_effect = side_effect
-            self.service._process_column_causes(unvalidated_causes, 0, problem, self.mock_request)
-            
-            self.assertEqual(cause.feedback, "Perlu validasi sebab di baris 1 kolom A terlebih dahulu.")
-            mock_save.assert_called()
+        # Execute, then persist the grid to capture the feedback
+        self.service._process_column_causes(unvalidated_causes, 0, problem, self.mock_request)
+        self.service.grid.save()
+        
+        cause.refresh_from_db()
+        self.assertEqual(cause.feedback, "Perlu validasi sebab di baris 1 kolom A terlebih dahulu.")
         
         # Verify validation was not attempted
         mock_validate_single_cause.assert_not_called()
@@ -1400,14 +1655,14 @@ class CausesServiceTest(TransactionTestCase):
         mock_get_previous.return_value = row1_cause
         
         # Mock validate_single_cause to mark cause_a2 as root
-        def side_effect_validator(cause, *args):
+        def side_effect_validator(cause, *args, **kwargs):
             if cause == cause_a2:
                 cause.root_status = True
                 
         mock_validate_single_cause.side_effect = side_effect_validator
         
         # Get unvalidated causes
-        unvalidated_causes = Causes.objects.filter(question_id=self.question_id, status=False)
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
         problem = Question.objects.get(pk=self.question_id)
         
         # Execute
@@ -1455,3 +1710,235 @@ class CausesServiceTest(TransactionTestCase):
         # Verify the correct columns were checked for root causes
         mock_has_root.assert_any_call(question_id, 0)  # For column 1 check
         mock_has_root.assert_any_call(question_id, 1)  # For column 2 check
+
+    @override_settings(VALIDATOR={'BATCH_MODE': True})
+    @patch.object(CausesService, 'api_call')
+    @patch.object(CausesService, '_chat')
+    def test_validate_first_row_causes_batch_mode(self, mock_chat, mock_api_call):
+        """Test batch mode decides every row 1 cause with a single prompt"""
+        mock_chat.return_value = json.dumps([
+            {"id": 0, "valid": True, "root": True, "category": 2},
+            {"id": 1, "valid": False, "feedback_type": 1},
+        ])
+
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
+        self.service._validate_first_row_causes(unvalidated_causes, self.question, self.mock_request)
+        self.service.grid.save()
+
+        mock_chat.assert_called_once()
+        mock_api_call.assert_not_called()
+
+        cause_a1 = Causes.objects.get(question_id=self.question_id, row=1, column=0)
+        self.assertTrue(cause_a1.status)
+        self.assertTrue(cause_a1.root_status)
+        self.assertEqual(cause_a1.feedback, f"{FeedbackMsg.ROOT_FOUND.format(column='A')} Korupsi Tahta.")
+
+        cause_b1 = Causes.objects.get(question_id=self.question_id, row=1, column=1)
+        self.assertFalse(cause_b1.status)
+        self.assertFalse(cause_b1.root_status)
+        self.assertEqual(cause_b1.feedback, FeedbackMsg.FALSE_ROW_1_NOT_CAUSE.format(column='B'))
+
+    @override_settings(VALIDATOR={'BATCH_MODE': True})
+    @patch.object(CausesService, 'api_call')
+    @patch.object(CausesService, '_chat')
+    def test_validate_first_row_causes_batch_mode_fallback(self, mock_chat, mock_api_call):
+        """Test batch mode falls back to the per-cause path when the answer cannot be parsed"""
+        mock_chat.return_value = "I cannot answer in JSON"
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 1 if validation_type == ValidationType.NORMAL else 0
+
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
+        self.service._validate_first_row_causes(unvalidated_causes, self.question, self.mock_request)
+        self.service.grid.save()
+
+        mock_chat.assert_called_once()
+        # One NORMAL and one ROOT call for each of the two row 1 causes
+        self.assertEqual(mock_api_call.call_count, 4)
+        for cause in Causes.objects.filter(question_id=self.question_id, row=1):
+            self.assertTrue(cause.status)
+
+    @override_settings(VALIDATOR={'BATCH_MODE': True})
+    @patch.object(CausesService, 'api_call')
+    @patch.object(CausesService, '_chat')
+    def test_process_column_causes_batch_mode(self, mock_chat, mock_api_call):
+        """Test batch mode validates the causes below valid parents with a single prompt"""
+        Causes.objects.filter(question_id=self.question_id).delete()
+        Causes.objects.create(question_id=self.question_id, cause="Valid cause A1", row=1, column=0, status=True)
+        Causes.objects.create(question_id=self.question_id, cause="Pending cause A2", row=2, column=0, status=False)
+        Causes.objects.create(question_id=self.question_id, cause="Budget approvals skipped review", row=3, column=0, status=False)
+
+        mock_chat.return_value = json.dumps([{"id": 0, "valid": True, "root": False}])
+        # A3 is checked on its own once A2 is known to be valid
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 3 if validation_type == ValidationType.FALSE else 0
+
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
+        self.service._process_column_causes(unvalidated_causes, 0, self.question, self.mock_request)
+        self.service.grid.save()
+
+        mock_chat.assert_called_once()
+        self.assertIn("Valid cause A1", mock_chat.call_args[0][1])
+        self.assertNotIn("Budget approvals skipped review", mock_chat.call_args[0][1])
+        self.assertIn("Pending cause A2", mock_api_call.call_args.kwargs['user_prompt'])
+
+        cause_a2 = Causes.objects.get(question_id=self.question_id, row=2, column=0)
+        self.assertTrue(cause_a2.status)
+        self.assertFalse(cause_a2.root_status)
+
+        cause_a3 = Causes.objects.get(question_id=self.question_id, row=3, column=0)
+        self.assertFalse(cause_a3.status)
+        self.assertEqual(cause_a3.feedback, FeedbackMsg.FALSE_ROW_N_SIMILAR_PREVIOUS.format(column='A', row=3))
+
+    @override_settings(VALIDATOR={'BATCH_MODE': True})
+    @patch.object(CausesService, 'api_call')
+    @patch.object(CausesService, '_chat')
+    def test_process_column_causes_batch_mode_skips_causes_below_invalid_parent(self, mock_chat, mock_api_call):
+        """Test a cause whose parent is not valid yet is left out of the batch prompt"""
+        Causes.objects.filter(question_id=self.question_id).delete()
+        Causes.objects.create(question_id=self.question_id, cause="Valid cause A1", row=1, column=0, status=True)
+        Causes.objects.create(question_id=self.question_id, cause="Pending cause A2", row=2, column=0, status=False)
+        Causes.objects.create(question_id=self.question_id, cause="Pending cause A3", row=3, column=0, status=False)
+
+        # A2 is invalid, so A3 is never sent to the LLM
+        mock_chat.return_value = json.dumps([{"id": 0, "valid": False, "feedback_type": 2}])
+
+        unvalidated_causes = self.service._grid_for(self.question_id).pending()
+        self.service._process_column_causes(unvalidated_causes, 0, self.question, self.mock_request)
+        self.service.grid.save()
+
+        mock_chat.assert_called_once()
+        self.assertNotIn("Pending cause A3", mock_chat.call_args[0][1])
+        mock_api_call.assert_not_called()
+
+        cause_a3 = Causes.objects.get(question_id=self.question_id, row=3, column=0)
+        self.assertFalse(cause_a3.status)
+        self.assertEqual(cause_a3.feedback, "Perlu validasi sebab di baris 2 kolom A terlebih dahulu.")
+
+    @patch.object(CausesService, '_chat')
+    def test_apply_batch_verdict_row_1_similar_feedback_is_not_the_cause(self, mock_chat):
+        """Test row 1 has no previous cause, so a 'similar to previous' verdict means it is not the cause"""
+        cause = Causes.objects.get(question_id=self.question_id, row=1, column=0)
+        verdict = Mock(valid=False, feedback_type=3)
+
+        self.service._apply_batch_verdict(cause, self.question, None, verdict)
+
+        self.assertFalse(cause.status)
+        self.assertEqual(cause.feedback, FeedbackMsg.FALSE_ROW_1_NOT_CAUSE.format(column='A'))
+        mock_chat.assert_not_called()
+
+    @override_settings(VALIDATOR={'BATCH_MODE': True})
+    @patch.object(CausesService, 'categorize_corruption')
+    @patch.object(CausesService, '_chat')
+    def test_apply_batch_verdict_corruption_keyword_is_root(self, mock_chat, mock_categorize):
+        """Test a valid corruption-related cause is a root cause even if the batch says otherwise"""
+        cause = Causes.objects.get(question_id=self.question_id, row=1, column=0)
+        cause.cause = "Terjadi korupsi dana proyek"
+        verdict = Mock(valid=True, root=False, category=1)
+
+        self.service._apply_batch_verdict(cause, self.question, None, verdict)
+
+        self.assertTrue(cause.status)
+        self.assertTrue(cause.root_status)
+        self.assertEqual(cause.feedback, f"{FeedbackMsg.ROOT_FOUND.format(column='A')} Korupsi Harta.")
+        mock_chat.assert_not_called()
+        mock_categorize.assert_not_called()
+
+    @patch.object(CausesService, '_validate_single_cause')
+    def test_validate_reports_each_decided_cause(self, mock_validate_single_cause):
+        """Test on_cause_decided is called for every cause as soon as it is decided"""
+        decided = []
+        service = CausesService(on_cause_decided=decided.append)
+
+        service.validate(self.question_id, self.mock_request)
+
+        self.assertCountEqual(
+            [(cause.row, cause.column) for cause in decided],
+            [(1, 0), (1, 1), (2, 0)]
+        )
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_query_count_is_independent_of_grid_size(self, mock_api_call):
+        """Test validate loads and persists the grid with a fixed number of queries"""
+        # NORMAL -> valid, ROOT -> not a root cause
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 1 if validation_type == ValidationType.NORMAL else 0
+
+        def count_queries(rows):
+            question = Question.objects.create(question=f"Question with {rows} rows")
+            for column in range(5):
+                for row in range(1, rows + 1):
+                    Causes.objects.create(question=question, cause=f"Cause {column}{row}", row=row, column=column, status=False)
+
+            with CaptureQueriesContext(connection) as context:
+                CausesService().validate(question.id, self.mock_request)
+            return len(context.captured_queries)
+
+        small, large = count_queries(rows=1), count_queries(rows=8)
+
+        self.assertEqual(small, large)
+        self.assertLessEqual(large, 7)  # Including the reload of the created placeholder cells
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_skips_causes_unchanged_since_last_verdict(self, mock_api_call):
+        """Test a second validate only spends LLM calls on edited causes"""
+        # Every cause is invalid with feedback type 2
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 2 if validation_type == ValidationType.FALSE else 0
+        self.service.validate(self.question_id, self.mock_request)
+        first_feedback = Causes.objects.get(question_id=self.question_id, row=1, column=0).feedback
+        mock_api_call.reset_mock()
+
+        CausesService().validate(self.question_id, self.mock_request)
+
+        mock_api_call.assert_not_called()
+        self.assertEqual(Causes.objects.get(question_id=self.question_id, row=1, column=0).feedback, first_feedback)
+
+        # Editing one cause marks it dirty, so only that cause is checked again
+        edited = Causes.objects.get(question_id=self.question_id, row=1, column=1)
+        CauseEditService().patch_cause(question_id=self.question_id, pk=edited.pk, cause="Edited cause in column B")
+
+        CausesService().validate(self.question_id, self.mock_request)
+
+        validated_prompts = [kwargs['user_prompt'] for _, kwargs in mock_api_call.call_args_list]
+        self.assertTrue(validated_prompts)
+        self.assertTrue(all("Edited cause in column B" in prompt for prompt in validated_prompts))
+
+    @patch.object(CausesService, '_chat', return_value="I am not sure")
+    def test_validate_rechecks_causes_whose_answer_was_unreadable(self, mock_chat):
+        """Test an unreadable LLM answer is not stored as a verdict"""
+        self.service.validate(self.question_id, self.mock_request)
+
+        cause = Causes.objects.get(question_id=self.question_id, row=1, column=0)
+        self.assertFalse(cause.status)
+        self.assertEqual(cause.fingerprint, "")
+        self.assertEqual(cause.feedback, FeedbackMsg.NOT_VALIDATED.format(column='A', row=1))
+        mock_chat.reset_mock()
+
+        CausesService().validate(self.question_id, self.mock_request)
+
+        self.assertTrue(mock_chat.called)
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_keeps_cause_pending_when_feedback_is_unreadable(self, mock_api_call):
+        """Test an invalid cause is checked again when its feedback type could not be read"""
+        mock_api_call.side_effect = lambda validation_type, **kwargs: None if validation_type == ValidationType.FALSE else 0
+        self.service.validate(self.question_id, self.mock_request)
+        mock_api_call.reset_mock()
+
+        CausesService().validate(self.question_id, self.mock_request)
+
+        self.assertTrue(mock_api_call.called)
+
+    @patch.object(CausesService, 'api_call')
+    def test_validate_rechecks_cause_when_parent_text_changes(self, mock_api_call):
+        """Test a cause is validated again when the cause above it changed"""
+        Causes.objects.filter(question_id=self.question_id).delete()
+        parent = Causes.objects.create(question_id=self.question_id, cause="Parent cause", row=1, column=0, status=True)
+        child = Causes.objects.create(question_id=self.question_id, cause="Child cause", row=2, column=0, status=False)
+        mock_api_call.side_effect = lambda validation_type, **kwargs: 2 if validation_type == ValidationType.FALSE else 0
+
+        self.service.validate(self.question_id, self.mock_request)
+        Causes.objects.filter(pk=parent.pk).update(cause="Another parent cause")
+        mock_api_call.reset_mock()
+
+        CausesService().validate(self.question_id, self.mock_request)
+
+        self.assertIn("Another parent cause", mock_api_call.call_args_list[0].kwargs['user_prompt'])
+        child.refresh_from_db()
+        self.assertFalse(child.is_dirty)
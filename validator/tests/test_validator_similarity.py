@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+from django.test import SimpleTestCase
+from validator.utils.similarity import SimilarityIndex
+
+
+def make_cause(pk, text, column=0):
+    return SimpleNamespace(pk=pk, cause=text, column=column)
+
+
+class SimilarityIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.index = SimilarityIndex(num_perm=64, shingle_size=4)
+
+    def test_identical_after_normalization(self):
+        self.assertEqual(self.index.similarity("Anggaran tidak cukup", "  anggaran TIDAK cukup!"), 1.0)
+
+    def test_near_duplicate_scores_higher_than_rewording(self):
+        text = "Dana desa dipotong oleh kepala desa"
+        near = self.index.similarity(text, "Dana desa dipotong kepala desa")
+        other = self.index.similarity(text, "Kurangnya pelatihan karyawan")
+
+        self.assertGreater(near, 0.7)
+        self.assertLess(other, 0.1)
+
+    def test_empty_text(self):
+        self.assertEqual(self.index.similarity("", "Dana desa"), 0.0)
+
+    def test_signatures_are_deterministic(self):
+        other = SimilarityIndex(num_perm=64, shingle_size=4)
+        self.assertEqual(self.index.signature("Dana desa"), other.signature("Dana desa"))
+
+    def test_most_similar_in_other_columns(self):
+        cause = make_cause(1, "Pengawasan proyek lemah", column=0)
+        index = SimilarityIndex.from_causes([
+            cause,
+            make_cause(2, "Pengawasan proyek lemah sekali", column=0),
+            make_cause(3, "Pengawasan proyek lemah.", column=1),
+            make_cause(4, "", column=2),
+        ])
+
+        match, score = index.most_similar(cause, other_columns_only=True)
+        self.assertEqual(match.pk, 3)
+        self.assertEqual(score, 1.0)
+
+        match, _ = index.most_similar(make_cause(5, "Harga material naik"), other_columns_only=True)
+        self.assertIsNone(match)
@@ -0,0 +1,69 @@
+from django.test import SimpleTestCase
+from validator.utils.telemetry import Telemetry
+
+
+class TelemetryTest(SimpleTestCase):
+    def setUp(self):
+        self.telemetry = Telemetry(recent_size=2)
+
+    def test_span_records_attributes_and_duration(self):
+        with self.telemetry.span('api_call', validation_type='normal') as span:
+            span.set(prompt_tokens=120, completion_tokens=4, verdict=1)
+
+        recent = self.telemetry.recent()[0]
+        self.assertEqual(recent['name'], 'api_call')
+        self.assertEqual(recent['prompt_tokens'], 120)
+        self.assertGreaterEqual(recent['duration'], 0)
+        self.assertIsNone(recent['error'])
+
+    def test_span_records_errors(self):
+        with self.assertRaises(ValueError):
+            with self.telemetry.span('api_call', validation_type='root'):
+                raise ValueError("boom")
+
+        self.assertEqual(self.telemetry.recent()[0]['error'], 'ValueError')
+        self.assertIn(
+            'validator_llm_errors_total{span="api_call",validation_type="root",error="ValueError"} 1',
+            self.telemetry.render_prometheus()
+        )
+
+    def test_prometheus_aggregates(self):
+        for cache_hit in (False, False, True):
+            with self.telemetry.span('api_call', validation_type='normal') as span:
+                span.set(cache_hit=cache_hit, prompt_tokens=0 if cache_hit else 100, verdict=1)
+
+        text = self.telemetry.render_prometheus()
+
+        self.assertIn('validator_llm_calls_total{span="api_call",validation_type="normal",cache_hit="false"} 2', text)
+        self.assertIn('validator_llm_calls_total{span="api_call",validation_type="normal",cache_hit="true"} 1', text)
+        self.assertIn('validator_prompt_tokens_total{validation_type="normal"} 200', text)
+        self.assertIn('validator_verdicts_total{validation_type="normal",verdict="1"} 3', text)
+        # Cache hits are left out of the latency histogram
+        self.assertIn('validator_llm_call_duration_seconds_bucket{span="api_call",validation_type="normal",le="+Inf"} 2', text)
+        self.assertIn('validator_llm_call_duration_seconds_count{span="api_call",validation_type="normal"} 2', text)
+
+    def test_extra_families_and_label_escaping(self):
+        text = self.telemetry.render_prometheus([('custom_metric', 'gauge', 'Help', [({'label': 'a"b'}, 3)])])
+
+        self.assertIn('# TYPE custom_metric gauge', text)
+        self.assertIn('custom_metric{label="a\\"b"} 3', text)
+
+    def test_exporters_receive_spans(self):
+        received = []
+        broken = lambda span: 1 / 0
+        self.telemetry.add_exporter(broken)
+        self.telemetry.add_exporter(received.append)
+
+        with self.assertLogs('validator.utils.telemetry', level='ERROR'):
+            with self.telemetry.span('api_call'):
+                pass
+
+        self.assertEqual([span.name for span in received], ['api_call'])
+        self.telemetry.remove_exporter(received.append)
+
+    def test_recent_is_bounded(self):
+        for index in range(3):
+            with self.telemetry.span(f'span-{index}'):
+                pass
+
+        self.assertEqual([span['name'] for span in self.telemetry.recent()], ['span-1', 'span-2'])
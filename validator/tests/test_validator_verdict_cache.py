@@ -0,0 +1,95 @@
+from django.test import TestCase
+from django.core.cache import cache
+from unittest.mock import patch
+from validator.enums import ValidationType
+from validator.utils.verdict_cache import VerdictCache
+
+class VerdictCacheTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.verdict_cache = VerdictCache(ttl=60, local_maxsize=2)
+
+    def tearDown(self):
+        cache.clear()
+
+    def _key(self, prompt="Is 'A' the cause of 'B'?", validation_type=ValidationType.NORMAL):
+        return self.verdict_cache.make_key("model", "system", prompt, validation_type)
+
+    def test_make_key_is_deterministic(self):
+        self.assertEqual(self._key(), self._key())
+        self.assertTrue(self._key().startswith("verdict:"))
+
+    def test_make_key_depends_on_every_part(self):
+        base = self._key()
+        self.assertNotEqual(base, self._key(prompt="Is 'C' the cause of 'B'?"))
+        self.assertNotEqual(base, self._key(validation_type=ValidationType.ROOT))
+        self.assertNotEqual(base, self.verdict_cache.make_key("other-model", "system", "Is 'A' the cause of 'B'?", ValidationType.NORMAL))
+
+    def test_make_key_field_boundaries(self):
+        first = self.verdict_cache.make_key("model", "ab", "c", ValidationType.NORMAL)
+        second = self.verdict_cache.make_key("model", "a", "bc", ValidationType.NORMAL)
+        self.assertNotEqual(first, second)
+
+    def test_get_miss(self):
+        self.assertIsNone(self.verdict_cache.get(self._key()))
+        self.assertEqual(self.verdict_cache.stats()['misses'], 1)
+
+    def test_set_then_get_local_hit(self):
+        key = self._key()
+        self.verdict_cache.set(key, 0)
+
+        self.assertEqual(self.verdict_cache.get(key), 0)
+        stats = self.verdict_cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['local_hits'], 1)
+
+    def test_get_falls_back_to_django_cache(self):
+        key = self._key()
+        cache.set(key, 2, 60)
+
+        self.assertEqual(self.verdict_cache.get(key), 2)
+        stats = self.verdict_cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['local_hits'], 0)
+
+        # Promoted into the local tier
+        self.assertEqual(self.verdict_cache.get(key), 2)
+        self.assertEqual(self.verdict_cache.stats()['local_hits'], 1)
+
+    def test_local_tier_evicts_least_recently_used(self):
+        first, second, third = self._key("1"), self._key("2"), self._key("3")
+        self.verdict_cache.set(first, 1)
+        self.verdict_cache.set(second, 1)
+        self.verdict_cache.get(first)
+        self.verdict_cache.set(third, 1)
+
+        cache.clear()
+        self.assertEqual(self.verdict_cache.get(first), 1)
+        self.assertEqual(self.verdict_cache.get(third), 1)
+        self.assertIsNone(self.verdict_cache.get(second))
+        self.assertEqual(self.verdict_cache.stats()['local_size'], 2)
+
+    def test_local_entry_expires(self):
+        key = self._key()
+        with patch('validator.utils.verdict_cache.time.monotonic', return_value=0):
+            self.verdict_cache.set(key, 1)
+        cache.clear()
+
+        with patch('validator.utils.verdict_cache.time.monotonic', return_value=61):
+            self.assertIsNone(self.verdict_cache.get(key))
+
+    def test_disabled_cache(self):
+        self.verdict_cache.enabled = False
+        key = self._key()
+        self.verdict_cache.set(key, 1)
+
+        self.assertIsNone(self.verdict_cache.get(key))
+        self.assertIsNone(cache.get(key))
+
+    def test_clear_resets_stats(self):
+        key = self._key()
+        self.verdict_cache.set(key, 1)
+        self.verdict_cache.get(key)
+        self.verdict_cache.clear()
+
+        self.assertEqual(self.verdict_cache.stats(), {'hits': 0, 'local_hits': 0, 'misses': 0, 'local_size': 0})
@@ -0,0 +1,50 @@
+from django.test import SimpleTestCase
+from validator.enums import ValidationType
+from validator.utils.verdict_parser import VerdictParser
+
+
+class VerdictParserTest(SimpleTestCase):
+    def setUp(self):
+        self.parser = VerdictParser()
+
+    def test_parse_structured_boolean(self):
+        self.assertEqual(self.parser.parse('{"verdict": true}', ValidationType.NORMAL), 1)
+        self.assertEqual(self.parser.parse('```json\n{"verdict": false}\n```', ValidationType.ROOT), 0)
+        self.assertEqual(self.parser.stats()['structured'], 2)
+
+    def test_parse_structured_choice(self):
+        self.assertEqual(self.parser.parse('{"verdict": 3}', ValidationType.ROOT_TYPE), 3)
+        self.assertEqual(self.parser.parse('{"verdict": 2}', ValidationType.FALSE), 2)
+
+    def test_out_of_range_choice_falls_back(self):
+        # 4 is not a valid category, so the strict parse fails and no standalone 1-3 remains
+        self.assertIsNone(self.parser.parse('{"verdict": 4}', ValidationType.ROOT_TYPE))
+
+    def test_fallback_uses_first_boolean_word(self):
+        # Substring matching read this as True because "true" was checked first
+        self.assertEqual(self.parser.parse('False, it is not true that ...', ValidationType.NORMAL), 0)
+        self.assertIsNone(self.parser.parse('untrue', ValidationType.NORMAL))
+        self.assertEqual(self.parser.stats()['fallback'], 1)
+
+    def test_fallback_uses_standalone_digit(self):
+        self.assertEqual(self.parser.parse('Kategori: 2 (Tahta)', ValidationType.ROOT_TYPE), 2)
+        self.assertIsNone(self.parser.parse('Tahun 2023', ValidationType.ROOT_TYPE))
+
+    def test_failure_rates(self):
+        self.parser.parse('{"verdict": true}', ValidationType.NORMAL)
+        self.parser.parse('True', ValidationType.NORMAL)
+        self.parser.parse('maybe', ValidationType.NORMAL)
+        self.parser.parse(None, ValidationType.NORMAL)
+
+        stats = self.parser.stats()
+        self.assertEqual(stats['total'], 4)
+        self.assertEqual(stats['failed'], 2)
+        self.assertEqual(stats['failure_rate'], 0.5)
+        self.assertEqual(stats['structured_failure_rate'], 0.75)
+
+    def test_clear(self):
+        self.parser.parse('maybe', ValidationType.NORMAL)
+        self.parser.clear()
+
+        self.assertEqual(self.parser.stats()['total'], 0)
+        self.assertEqual(self.parser.stats()['failure_rate'], 0.0)
@@ -1,9 +1,16 @@
+import json
 import uuid
-from django.test import TestCase
+from django.test import TestCase, override_settings
+from django.urls import reverse
 from unittest.mock import patch, Mock
 from rest_framework import status
+from rest_framework.test import APIClient
 from cause.models import Causes
 from question.models import Question
+from validator.constants import ErrorMsg
+from validator.enums import ValidationType
+from validator.exceptions import AIServiceErrorException
+from validator.services import CausesService
 from validator.views import ValidateView
 
 
@@ -31,4 +38,86 @@ class ValidateViewTest(TestCase):
         
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data), 1)
-        self.assertEqual(response.data[0]['cause'], "Test cause") 
\ No newline at end of file
+        self.assertEqual(response.data[0]['cause'], "Test cause") 
+
+
+class ValidateStreamViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.question_id = uuid.uuid4()
+        self.question = Question.objects.create(
+            id=self.question_id,
+            question="Test question"
+        )
+        self.cause = Causes.objects.create(
+            question_id=self.question_id,
+            cause="Test cause",
+            row=1,
+            column=0,
+            status=False
+        )
+        self.url = reverse('validate_causes_stream', kwargs={'question_id': self.question_id})
+
+    def _read_events(self, response):
+        content = b''.join(response.streaming_content).decode()
+        return [json.loads(line) for line in content.splitlines()]
+
+    @patch.object(CausesService, 'validate', autospec=True)
+    def test_stream_emits_each_cause_then_done(self, mock_validate):
+        def validate(service, question_id, request):
+            self.cause.status = True
+            service.on_cause_decided(self.cause)
+            return [self.cause]
+
+        mock_validate.side_effect = validate
+
+        response = self.client.patch(self.url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response['Content-Type'], 'application/x-ndjson')
+
+        events = self._read_events(response)
+        self.assertEqual([event['type'] for event in events], ['cause', 'done'])
+        self.assertEqual(events[0]['cause']['id'], str(self.cause.id))
+        self.assertTrue(events[0]['cause']['status'])
+        self.assertEqual(len(events[1]['causes']), 1)
+        self.assertEqual(events[1]['usage'], {'prompts': 0, 'tokens': 0})
+
+    @patch.object(CausesService, 'validate', autospec=True)
+    def test_stream_reports_error(self, mock_validate):
+        mock_validate.side_effect = AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+
+        response = self.client.patch(self.url)
+        events = self._read_events(response)
+
+        self.assertEqual(events, [{'type': 'error', 'detail': ErrorMsg.AI_SERVICE_ERROR}])
+
+
+class MetricsViewTest(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.url = reverse('metrics')
+
+    @override_settings(VALIDATOR={'METRICS_TOKEN': 'secret'})
+    def test_metrics_are_prometheus_text(self):
+        with patch.object(CausesService, '_chat', return_value='{"verdict": true}'):
+            CausesService().api_call("System", "Prompt for metrics view", ValidationType.NORMAL)
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer secret')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('# TYPE validator_llm_calls_total counter', body)
+        self.assertIn('validator_llm_calls_total{span="api_call",validation_type="normal",cache_hit="false"}', body)
+        self.assertIn('validator_groq_circuit_state{state="closed"} 1', body)
+
+    @override_settings(VALIDATOR={'METRICS_TOKEN': 'secret'})
+    def test_metrics_token(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_401_UNAUTHORIZED)
+
+        response = self.client.get(self.url, HTTP_AUTHORIZATION='Bearer secret')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    @override_settings(VALIDATOR={})
+    def test_metrics_hidden_without_token(self):
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_404_NOT_FOUND)
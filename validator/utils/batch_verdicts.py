@@ -0,0 +1,35 @@
+import json
+from typing import Dict, Iterable, Optional
+from pydantic import TypeAdapter, ValidationError
+from validator.dataclasses.cause_verdict import CauseVerdictDataClass
+
+_verdict_list_adapter = TypeAdapter(list[CauseVerdictDataClass])
+
+def parse_batch_verdicts(answer: str, expected_ids: Iterable[int]) -> Optional[Dict[int, CauseVerdictDataClass]]:
+    """
+    Parse the JSON array returned by a batched validation prompt.
+    Returns the verdicts keyed by cause id, or None when the answer does not
+    match the schema or does not cover exactly the causes that were sent.
+    """
+    if not answer:
+        return None
+
+    # Models sometimes wrap the array in prose or a code fence
+    start, end = answer.find('['), answer.rfind(']')
+    if start == -1 or end < start:
+        return None
+
+    try:
+        verdicts = _verdict_list_adapter.validate_json(answer[start:end + 1])
+    except (ValidationError, ValueError):
+        return None
+
+    by_id = {verdict.id: verdict for verdict in verdicts}
+    if len(by_id) != len(verdicts) or set(by_id) != set(expected_ids):
+        return None
+
+    return by_id
+
+def dump_batch_verdicts(verdicts: Dict[int, CauseVerdictDataClass]) -> str:
+    """Serialize parsed verdicts so they can be cached and parsed again"""
+    return json.dumps([verdict.model_dump() for verdict in verdicts.values()])
@@ -0,0 +1,118 @@
+from collections import defaultdict
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from cause.models import Causes
+
+class CauseGrid:
+    """
+    In-memory (column, row) index over every cause of a question.
+    The validator decides everything against this index and persists the
+    changed and created causes at the end, so a validation run costs a
+    fixed number of queries regardless of the grid size.
+    """
+
+    UPDATE_FIELDS = ['status', 'root_status', 'feedback', 'fingerprint', 'is_dirty', 'similarity', 'updated_at']
+
+    def __init__(self, question_id, causes):
+        self.question_id = question_id
+        self._cells = defaultdict(list)
+        for cause in causes:
+            self._cells[(cause.column, cause.row)].append(cause)
+
+        # Causes that still needed validation when the grid was loaded
+        self._pending_ids = {cause.pk for cause in self.causes() if not cause.status}
+        self._changed = {}
+        self._created = []
+
+    @classmethod
+    def load(cls, question_id):
+        return cls(question_id, Causes.objects.filter(question_id=question_id).order_by('column', 'row'))
+
+    def causes(self):
+        """All causes ordered by column then row"""
+        return [cause for key in sorted(self._cells) for cause in self._cells[key]]
+
+    def pending(self):
+        """Causes that were unvalidated when the grid was loaded"""
+        return [cause for cause in self.causes() if cause.pk in self._pending_ids]
+
+    def get(self, column, row):
+        """Return the cause in a cell, preferring a validated one if the cell is duplicated"""
+        cells = self._cells.get((column, row))
+        if not cells:
+            return None
+        return next((cause for cause in cells if cause.status), cells[0])
+
+    def previous_valid(self, cause):
+        """Return the validated, non-empty cause directly above the given one"""
+        if cause.row <= 1:
+            return None
+
+        prev_cause = next((c for c in self._cells.get((cause.column, cause.row - 1), []) if c.status), None)
+        if prev_cause and prev_cause.cause and prev_cause.cause.strip() != "":
+            return prev_cause
+        return None
+
+    def has_root(self, column):
+        return any(cause.root_status for cause in self._column(column))
+
+    def valid_rows(self, column):
+        return [cause.row for cause in self._column(column) if cause.status]
+
+    def valid_count(self, column, exclude=None):
+        """Count validated causes in a column, optionally ignoring the cause being decided"""
+        exclude_pk = exclude.pk if exclude is not None else None
+        return sum(1 for cause in self._column(column) if cause.status and cause.pk != exclude_pk)
+
+    def add(self, cause):
+        """Register a new, unsaved cause to be created on save()"""
+        self._cells[(cause.column, cause.row)].append(cause)
+        self._created.append(cause)
+
+    def mark_changed(self, cause):
+        if cause not in self._created:
+            self._changed[cause.pk] = cause
+
+    def save(self):
+        """Persist every changed and created cause in one transaction"""
+        changed, created = list(self._changed.values()), list(self._created)
+        if not changed and not created:
+            return
+
+        now = timezone.now()
+        for cause in changed:
+            # bulk_update skips auto_now fields
+            cause.updated_at = now
+
+        with transaction.atomic():
+            if changed:
+                Causes.objects.bulk_update(changed, self.UPDATE_FIELDS)
+            if created:
+                # A concurrent edit may have filled a placeholder cell since the grid was loaded;
+                # keep that cause instead of rolling back the verdicts of this run
+                Causes.objects.bulk_create(created, ignore_conflicts=True)
+
+        if created:
+            self._reload_cells(created)
+        self._changed.clear()
+        self._created.clear()
+
+    def _reload_cells(self, created):
+        """Replace created placeholders with the rows stored in their cells, in one query"""
+        cells = Q()
+        for cause in created:
+            cells |= Q(column=cause.column, row=cause.row)
+
+        stored = defaultdict(list)
+        for cause in Causes.objects.filter(cells, question_id=self.question_id):
+            stored[(cause.column, cause.row)].append(cause)
+
+        for cause in created:
+            key = (cause.column, cause.row)
+            others = [cell for cell in self._cells[key] if cell is not cause]
+            known = {cell.pk for cell in others}
+            self._cells[key] = others + [row for row in stored[key] if row.pk not in known]
+
+    def _column(self, column):
+        return [cause for (cell_column, _), cells in self._cells.items() if cell_column == column for cause in cells]
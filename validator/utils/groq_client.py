@@ -0,0 +1,63 @@
+import atexit
+import threading
+import httpx
+from django.conf import settings
+from groq import Groq, DefaultHttpxClient
+
+class GroqClientRegistry:
+    """
+    Process-wide registry of Groq clients.
+    Each API key gets one client backed by a keep-alive httpx connection
+    pool, so validation steps reuse open TLS connections instead of paying
+    for a new handshake on every call.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def get(self, api_key: str | None = None) -> Groq:
+        """Return the shared client for the API key, creating it on first use"""
+        api_key = api_key or settings.GROQ_API_KEY
+        client = self._clients.get(api_key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            # Another thread may have created it while we waited for the lock
+            client = self._clients.get(api_key)
+            if client is None:
+                client = self._create_client(api_key)
+                self._clients[api_key] = client
+        return client
+
+    def close(self):
+        """Close every pooled client; the next get() builds a fresh one"""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
+
+    def _create_client(self, api_key: str) -> Groq:
+        config = getattr(settings, 'VALIDATOR', {}).get('GROQ_CLIENT', {})
+        timeout = httpx.Timeout(
+            config.get('TIMEOUT', 60.0),
+            connect=config.get('CONNECT_TIMEOUT', 5.0),
+        )
+        http_client = DefaultHttpxClient(
+            limits=httpx.Limits(
+                max_connections=config.get('MAX_CONNECTIONS', 20),
+                max_keepalive_connections=config.get('MAX_KEEPALIVE_CONNECTIONS', 10),
+                keepalive_expiry=config.get('KEEPALIVE_EXPIRY', 30.0),
+            ),
+            timeout=timeout,
+        )
+        # Retries are owned by groq_resilience, so the SDK must not retry on its own as well
+        return Groq(api_key=api_key, http_client=http_client, timeout=timeout, max_retries=0)
+
+groq_clients = GroqClientRegistry()
+
+# Release pooled connections when the worker process exits
+atexit.register(groq_clients.close)
@@ -0,0 +1,338 @@
+import json
+import math
+import random
+import re
+import threading
+import time
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import groq
+from django.conf import settings
+from validator.constants import ErrorMsg
+from validator.enums import ValidationType
+from validator.exceptions import AIServiceErrorException
+from validator.utils.groq_client import groq_clients
+from validator.utils.resilience import groq_resilience
+
+GROQ_MODEL = "deepseek-r1-distill-llama-70b"
+GROQ_FAST_MODEL = "llama-3.1-8b-instant"
+# Only reasoning models accept reasoning_format
+GROQ_REASONING_MODELS = {GROQ_MODEL}
+
+class LLMBackend:
+    """
+    Interface between the validator and a chat model.
+    Subclasses implement _complete(); chat() counts every call per backend so
+    benchmarks and metrics can report LLM calls per validation.
+    """
+
+    name = None
+    model = None
+
+    _call_counts = Counter()
+    _call_counts_lock = threading.Lock()
+
+    def chat(self, system_message: str, user_prompt: str, validation_type: ValidationType,
+             json_output: bool = False, model: str | None = None) -> str:
+        """Send one system/user prompt pair and return the raw answer; model overrides the backend default"""
+        with LLMBackend._call_counts_lock:
+            LLMBackend._call_counts[self.name] += 1
+        return self._complete(system_message, user_prompt, validation_type, json_output, model or self.model)
+
+    def model_for(self, validation_type: ValidationType) -> str:
+        """Model answering prompts of a validation type, used to key cached verdicts"""
+        return self.model
+
+    def _complete(self, system_message, user_prompt, validation_type, json_output, model):
+        raise NotImplementedError("Subclasses must implement _complete()")
+
+    @classmethod
+    def call_counts(cls) -> dict:
+        """Return the number of chat calls made per backend in this process"""
+        with LLMBackend._call_counts_lock:
+            return dict(LLMBackend._call_counts)
+
+
+class GroqBackend(LLMBackend):
+    name = 'groq'
+    model = GROQ_MODEL
+
+    def _complete(self, system_message, user_prompt, validation_type, json_output, model):
+        client = groq_clients.get(settings.GROQ_API_KEY)
+
+        def request(json_output):
+            # With json_output the model is constrained to answer with a JSON object
+            extra_options = {"response_format": {"type": "json_object"}} if json_output else {}
+            if model in GROQ_REASONING_MODELS:
+                extra_options["reasoning_format"] = "hidden"
+
+            # Retries, deadlines and the circuit breaker live in groq_resilience
+            def create(timeout):
+                return client.chat.completions.create(
+                    messages=[
+                        {
+                            "role": "system",
+                            "content": system_message,
+                        },
+                        {
+                            "role": "user",
+                            "content": user_prompt
+                        }
+                    ],
+                    model=model,
+                    temperature=0.6,
+                    top_p=0.95,
+                    stream=False,
+                    seed=42,
+                    timeout=timeout,
+                    **extra_options
+                )
+
+            return groq_resilience.call(create).choices[0].message.content
+
+        try:
+            return request(json_output)
+        except AIServiceErrorException as e:
+            if not (json_output and _is_json_validate_failed(e.__cause__)):
+                raise
+            # Groq rejects answers that are not valid JSON; ask once more without the
+            # constraint and leave the answer to the verdict parser's fallback
+            return request(False)
+
+
+def _is_json_validate_failed(error) -> bool:
+    """Whether a Groq error is the 400 returned when a JSON-mode answer is not valid JSON"""
+    if not isinstance(error, groq.BadRequestError):
+        return False
+    body = error.body if isinstance(error.body, dict) else {}
+    details = body.get('error', body)
+    return isinstance(details, dict) and details.get('code') == 'json_validate_failed'
+
+
+class LocalBackend(LLMBackend):
+    """
+    Deterministic stand-in for the model, for load tests and offline benchmarks.
+    Verdicts come from canned rules matched against the user prompt: by default
+    every cause is valid, causes from ROOT_ROW onwards are root causes, invalid
+    causes are "not the cause" and root causes are Harta. Latency and failures
+    are drawn from a seeded random generator.
+    """
+
+    name = 'local'
+    model = 'local-stand-in'
+
+    _ROW_PATTERN = re.compile(r'\brow (\d+)\b')
+    _BATCH_PATTERN = re.compile(r'Causes: (\[.*\])\. For every cause', re.DOTALL)
+
+    def __init__(self, config=None):
+        if config is None:
+            config = getattr(settings, 'VALIDATOR', {}).get('LOCAL_LLM', {})
+        latency = config.get('LATENCY', {})
+        self.distribution = latency.get('DISTRIBUTION', 'fixed')
+        self.mean = latency.get('MEAN', 0.0)
+        self.sigma = latency.get('SIGMA', 0.0)
+        self.error_rate = config.get('ERROR_RATE', 0.0)
+        self.root_row = config.get('ROOT_ROW', 3)
+        # Each rule is {'PATTERN': regex matched against the user prompt, 'ANSWER': 'true', 'false', '1', '2' or '3'}
+        self.rules = [(re.compile(rule['PATTERN'], re.IGNORECASE), str(rule['ANSWER'])) for rule in config.get('RULES', [])]
+
+        self._random = random.Random(config.get('SEED', 42))
+        self._random_lock = threading.Lock()
+
+    def _complete(self, system_message, user_prompt, validation_type, json_output, model):
+        with self._random_lock:
+            delay = self._sample_latency()
+            failed = self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        if failed:
+            raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+
+        if validation_type == ValidationType.BATCH:
+            return self._batch_answer(user_prompt)
+
+        verdict = self._verdict(user_prompt, validation_type)
+        return json.dumps({"verdict": json.loads(verdict)}) if json_output else verdict
+
+    def _sample_latency(self) -> float:
+        if self.distribution == 'lognormal' and self.mean > 0:
+            # Parameterised by the median (mean of the underlying normal) and its spread
+            return self._random.lognormvariate(math.log(self.mean), self.sigma)
+        if self.distribution == 'uniform':
+            return self._random.uniform(max(self.mean - self.sigma, 0.0), self.mean + self.sigma)
+        if self.distribution == 'normal':
+            return max(self._random.gauss(self.mean, self.sigma), 0.0)
+        return self.mean
+
+    def _verdict(self, user_prompt, validation_type) -> str:
+        for pattern, answer in self.rules:
+            if pattern.search(user_prompt):
+                return answer.lower()
+
+        if validation_type == ValidationType.ROOT:
+            match = self._ROW_PATTERN.search(user_prompt)
+            return 'true' if match and int(match.group(1)) >= self.root_row else 'false'
+        if validation_type in (ValidationType.FALSE, ValidationType.ROOT_TYPE):
+            return '1'
+        return 'true'
+
+    def _batch_answer(self, user_prompt) -> str:
+        match = self._BATCH_PATTERN.search(user_prompt)
+        items = json.loads(match.group(1)) if match else []
+
+        verdicts = []
+        for item in items:
+            valid = self._verdict(f"Is '{item['cause']}' the cause of '{item['parent']}'?", ValidationType.NORMAL) == 'true'
+            row = int(item['cell'][1:])
+            verdicts.append({
+                "id": item['id'],
+                "valid": valid,
+                "root": valid and row >= self.root_row,
+                "category": 1 if valid else None,
+                "feedback_type": None if valid else 1,
+            })
+        return json.dumps(verdicts)
+
+
+class LLMRouter(LLMBackend):
+    """
+    Routes each validation type to its own list of models on an underlying backend.
+    VALIDATOR['LLM_ROUTER']['ROUTES'] maps a ValidationType value to
+    {'MODELS': [...], 'HEDGE_AFTER': seconds}. Models are tried in order when
+    one fails. With HEDGE_AFTER, a request still unanswered after that delay
+    (about the p95 latency of the model) is raced against the next model, or
+    the same model when it is the last one, and the first answer wins.
+    """
+
+    name = 'router'
+
+    _executor = None
+    _executor_lock = threading.Lock()
+    _stats = Counter()
+    _stats_lock = threading.Lock()
+
+    def __init__(self, config=None, backend: LLMBackend | None = None):
+        if config is None:
+            config = getattr(settings, 'VALIDATOR', {}).get('LLM_ROUTER', {})
+        self.backend = backend or get_backend(config.get('BACKEND', GroqBackend.name))
+        self.routes = config.get('ROUTES', {})
+        self.max_workers = config.get('MAX_WORKERS', 10)
+        self.model = self.backend.model
+
+    def chat(self, system_message: str, user_prompt: str, validation_type: ValidationType,
+             json_output: bool = False, model: str | None = None) -> str:
+        # Provider calls are counted by the underlying backend, once per attempt
+        route = self._route(validation_type)
+        models = [model] if model else route['MODELS']
+
+        def call(chosen_model):
+            return self.backend.chat(system_message, user_prompt, validation_type, json_output, model=chosen_model)
+
+        hedge_after = route.get('HEDGE_AFTER')
+        if hedge_after is None:
+            return self._with_fallback(models, call, validation_type)
+        return self._hedged(models, call, validation_type, hedge_after)
+
+    def model_for(self, validation_type: ValidationType) -> str:
+        # The answer may come from any model of the route, so the route as a whole keys the cache
+        return '|'.join(self._route(validation_type)['MODELS'])
+
+    @classmethod
+    def stats(cls) -> dict:
+        """Return hedge and fallback counters per validation type for this process"""
+        with cls._stats_lock:
+            stats = {}
+            for (validation_type, event), count in cls._stats.items():
+                stats.setdefault(validation_type, {})[event] = count
+            return stats
+
+    @classmethod
+    def reset_stats(cls):
+        with cls._stats_lock:
+            cls._stats.clear()
+
+    def _route(self, validation_type) -> dict:
+        route = self.routes.get(validation_type.value, {})
+        return {'MODELS': route.get('MODELS') or [self.backend.model], 'HEDGE_AFTER': route.get('HEDGE_AFTER')}
+
+    def _with_fallback(self, models, call, validation_type):
+        error = None
+        for index, model in enumerate(models):
+            if index:
+                self._record(validation_type, 'fallbacks')
+            try:
+                return call(model)
+            except AIServiceErrorException as e:
+                error = e
+        self._record(validation_type, 'failures')
+        raise error
+
+    def _hedged(self, models, call, validation_type, hedge_after):
+        # Without a second model the hedge is a duplicate request to the same one
+        attempts = models if len(models) > 1 else models * 2
+        executor = self._get_executor()
+        in_flight = {}
+        hedges = set()
+        error = None
+
+        def launch(index):
+            in_flight[executor.submit(call, attempts[index])] = index
+
+        launch(0)
+        launched = 1
+        while in_flight:
+            can_hedge = launched < len(attempts)
+            done, _ = wait(in_flight, timeout=hedge_after if can_hedge else None, return_when=FIRST_COMPLETED)
+            if not done:
+                # Too slow: race the next attempt against the one in flight
+                self._record(validation_type, 'hedged')
+                hedges.add(launched)
+                launch(launched)
+                launched += 1
+                continue
+
+            for future in done:
+                index = in_flight.pop(future)
+                try:
+                    answer = future.result()
+                except AIServiceErrorException as e:
+                    error = e
+                    continue
+                if index in hedges:
+                    self._record(validation_type, 'hedge_wins')
+                # Slower attempts still running are left to finish and discarded
+                return answer
+
+            if not in_flight and launched < len(attempts):
+                self._record(validation_type, 'fallbacks')
+                launch(launched)
+                launched += 1
+
+        self._record(validation_type, 'failures')
+        raise error
+
+    def _get_executor(self):
+        with LLMRouter._executor_lock:
+            if LLMRouter._executor is None:
+                LLMRouter._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='llm-hedge')
+            return LLMRouter._executor
+
+    @classmethod
+    def _record(cls, validation_type, event):
+        with cls._stats_lock:
+            cls._stats[(validation_type.value, event)] += 1
+
+
+BACKENDS = {
+    GroqBackend.name: GroqBackend,
+    LocalBackend.name: LocalBackend,
+    LLMRouter.name: LLMRouter,
+}
+
+def get_backend(name: str | None = None) -> LLMBackend:
+    """Build the backend selected by VALIDATOR['LLM_BACKEND'] (Groq by default)"""
+    name = name or getattr(settings, 'VALIDATOR', {}).get('LLM_BACKEND', GroqBackend.name)
+    try:
+        return BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown LLM backend '{name}'")
@@ -0,0 +1,121 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from django.conf import settings
+from django.db import connections
+from question.models import Question
+from validator.enums import ValidationType
+from validator.services import CausesService
+from validator.utils.cause_grid import CauseGrid
+
+logger = logging.getLogger(__name__)
+
+class VerdictPrefetcher:
+    """
+    Speculatively warms the verdict cache while the user is still editing.
+    When a cause's text is saved, a background task asks for its NORMAL
+    verdict and, if it is valid, its ROOT verdict, using exactly the prompts
+    the validator will send later; the explicit validate call then mostly hits
+    the cache. Saves of the same cause within DEBOUNCE seconds collapse into
+    one task that reads the latest text. Opt-in through VALIDATOR['PREFETCH'].
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._timers = {}
+        self._executor = None
+        self._stats = dict.fromkeys(('scheduled', 'completed', 'skipped', 'failed'), 0)
+
+    @property
+    def enabled(self) -> bool:
+        return self._config().get('ENABLED', False)
+
+    def schedule(self, question_id, cause_id):
+        """Prefetch the verdicts of a cause in the background, once its edits settle"""
+        if not self.enabled:
+            return
+
+        timer = threading.Timer(self._config().get('DEBOUNCE', 1.0), self._submit, args=(question_id, cause_id))
+        timer.daemon = True
+        with self._lock:
+            previous = self._timers.pop(cause_id, None)
+            if previous is not None:
+                previous.cancel()
+            self._timers[cause_id] = timer
+            self._stats['scheduled'] += 1
+        timer.start()
+
+    def run(self, question_id, cause_id):
+        """Compute and cache the verdicts of one cause now"""
+        grid = CauseGrid.load(question_id)
+        cause = next((c for c in grid.causes() if str(c.pk) == str(cause_id)), None)
+        problem = Question.objects.filter(pk=question_id).first()
+        if cause is None or problem is None or not cause.cause.strip():
+            self._record('skipped')
+            return
+
+        service = CausesService()
+        service.grid = grid
+        prev_cause = grid.previous_valid(cause)
+        if cause.row > 1 and prev_cause is None:
+            # The parent is not valid yet, so validation will not ask about this cause
+            self._record('skipped')
+            return
+
+        parent_text = problem.question if cause.row == 1 else prev_cause.cause
+        if service._obvious_feedback(cause, parent_text, problem, prev_cause) is not None:
+            # Decided locally during validation; nothing to warm
+            self._record('skipped')
+            return
+
+        system_message, user_prompt = service.prompts.cause_validity(cause, problem, prev_cause)
+        valid = service.api_call(system_message, user_prompt, ValidationType.NORMAL) == 1
+        if valid and not service.check_if_corruption_related(cause.cause) and not service._skip_root_check(cause, problem):
+            system_message, user_prompt = service.prompts.root_check(cause, problem)
+            service.api_call(system_message, user_prompt, ValidationType.ROOT)
+        self._record('completed')
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def cancel_all(self):
+        """Drop every prefetch that has not started yet"""
+        with self._lock:
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
+
+    def _submit(self, question_id, cause_id):
+        with self._lock:
+            # Runs on the timer's thread; a newer timer for the cause must stay registered
+            if self._timers.get(cause_id) is threading.current_thread():
+                del self._timers[cause_id]
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._config().get('MAX_WORKERS', 2), thread_name_prefix='verdict-prefetch'
+                )
+            executor = self._executor
+        executor.submit(self._run_safely, question_id, cause_id)
+
+    def _run_safely(self, question_id, cause_id):
+        try:
+            self.run(question_id, cause_id)
+        except Exception:
+            # Speculative work: the explicit validation will simply ask again
+            logger.warning("Prefetching verdicts of cause %s failed", cause_id, exc_info=True)
+            self._record('failed')
+        finally:
+            # Release the database connection opened by this worker thread
+            connections.close_all()
+
+    def _record(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'VALIDATOR', {}).get('PREFETCH', {})
+
+verdict_prefetcher = VerdictPrefetcher()
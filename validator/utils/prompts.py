@@ -0,0 +1,199 @@
+import json
+import re
+import threading
+from django.conf import settings
+from validator.enums import ValidationType
+from validator.utils.verdict_parser import verdict_parser
+
+COLUMNS = 'ABCDE'
+
+# Static instruction blocks, written once and shared by every prompt that needs them
+ANALYSIS_CONTEXT = (
+    "You analyze cause-and-effect chains in a column-based root cause analysis. "
+    "Each column is an independent causal chain. The 'previous cause' is always the cause directly above "
+    "in the same column, never one from another column."
+)
+CHAIN_RULES = (
+    "Row 1 causes must directly cause the problem; every later cause must directly cause its previous cause. "
+    "Chains may converge as the analysis deepens, so similar causes in different columns are acceptable."
+)
+ROOT_RULES = (
+    "A root cause is the deepest cause in a chain that can be addressed directly and whose removal would stop the problem recurring; "
+    "not every direct cause is a root cause. Root causes here usually involve corruption of wealth, power or love, "
+    "and a cause that mentions corruption explicitly is very likely a root cause."
+)
+CATEGORY_RULES = (
+    "Corruption categories: 1 Harta (wealth, money, resources: bribery, embezzlement, financial misconduct), "
+    "2 Tahta (power, authority, position: abuse of authority, nepotism, power-seeking), "
+    "3 Cinta (love, relationships, desires: favoritism from personal bonds). "
+    "Always choose the closest category, even if the fit is partial."
+)
+FEEDBACK_CODES = "1 = NOT THE CAUSE, 2 = POSITIVE OR NEUTRAL, 3 = SIMILAR TO THE PREVIOUS cause"
+
+_TOKEN_PATTERN = re.compile(r"\w{1,4}|[^\w\s]")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+def count_tokens(text: str) -> int:
+    """
+    Estimate the number of tokens in a text without a model tokenizer.
+    Words count one token per four characters and punctuation one token each,
+    which tracks BPE tokenizers closely enough for budgeting and reporting.
+    """
+    return len(_TOKEN_PATTERN.findall(text or ''))
+
+def normalize_text(text: str, max_tokens: int) -> str:
+    """Collapse whitespace and cut the text at a word boundary once it exceeds the budget"""
+    words = _WHITESPACE_PATTERN.sub(' ', text or '').strip().split(' ')
+    kept, used = [], 0
+    for word in words:
+        used += count_tokens(word)
+        if used > max_tokens:
+            return ' '.join(kept) + '…'
+        kept.append(word)
+    return ' '.join(kept)
+
+
+class TokenUsage:
+    """Thread-safe tally of prompts sent and their estimated tokens"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.prompts = 0
+        self.tokens = 0
+
+    def add(self, tokens: int):
+        with self._lock:
+            self.prompts += 1
+            self.tokens += tokens
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {'prompts': self.prompts, 'tokens': self.tokens}
+
+    def clear(self):
+        with self._lock:
+            self.prompts = 0
+            self.tokens = 0
+
+
+class PromptBuilder:
+    """
+    Assembles the validator prompts from the shared instruction blocks.
+    Free text from users is normalized and held to a token budget taken from
+    VALIDATOR['PROMPT'], so a 500 character cause cannot inflate every prompt.
+    """
+
+    def __init__(self):
+        config = getattr(settings, 'VALIDATOR', {}).get('PROMPT', {})
+        self.cause_max_tokens = config.get('CAUSE_MAX_TOKENS', 100)
+        self.question_max_tokens = config.get('QUESTION_MAX_TOKENS', 100)
+
+    def structured_output(self) -> bool:
+        """Whether single verdicts are requested as JSON objects instead of free text"""
+        return getattr(settings, 'VALIDATOR', {}).get('STRUCTURED_OUTPUT', True)
+
+    def answer_format(self, validation_type: ValidationType, choices=(1, 2, 3)) -> str:
+        """The one answer instruction of a prompt, matching the output mode"""
+        return verdict_parser.format_instruction(validation_type, self.structured_output(), choices)
+
+    def system(self, *blocks: str) -> str:
+        """Join instruction blocks, dropping repeated ones"""
+        return ' '.join(dict.fromkeys(block for block in blocks if block))
+
+    def cause_text(self, text: str) -> str:
+        return normalize_text(text, self.cause_max_tokens)
+
+    def question_text(self, text: str) -> str:
+        return normalize_text(text, self.question_max_tokens)
+
+    def cause_validity(self, cause, problem, prev_cause):
+        system_message = self.system(
+            ANALYSIS_CONTEXT, CHAIN_RULES,
+            "Decide whether the given cause is valid for its position in the analysis."
+        )
+        cell = f"{COLUMNS[cause.column]}{cause.row}"
+        if cause.row == 1:
+            user_prompt = (
+                f"Problem: '{self.question_text(problem.question)}'. "
+                f"Cause {cell}: '{self.cause_text(cause.cause)}'. "
+                f"Is this cause a direct cause of the problem? {self.answer_format(ValidationType.NORMAL)}"
+            )
+        else:
+            user_prompt = (
+                f"Previous cause {COLUMNS[cause.column]}{cause.row - 1}: '{self.cause_text(prev_cause.cause)}'. "
+                f"Cause {cell}: '{self.cause_text(cause.cause)}'. "
+                f"Is this cause a direct cause of the previous cause? {self.answer_format(ValidationType.NORMAL)}"
+            )
+        return system_message, user_prompt
+
+    def false_feedback(self, cause, problem, prev_cause):
+        system_message = self.system(
+            ANALYSIS_CONTEXT,
+            "The given cause was judged invalid. Classify why with a numeric code."
+        )
+        if prev_cause:
+            user_prompt = (
+                f"'{self.cause_text(cause.cause)}' (column {COLUMNS[cause.column]}, row {cause.row}) is not a valid cause of "
+                f"the previous cause '{self.cause_text(prev_cause.cause)}' (row {cause.row - 1}). "
+                f"Codes: {FEEDBACK_CODES}. {self.answer_format(ValidationType.FALSE)}"
+            )
+        else:
+            user_prompt = (
+                f"'{self.cause_text(cause.cause)}' (column {COLUMNS[cause.column]}, first row) is not a valid cause of "
+                f"the problem '{self.question_text(problem.question)}'. "
+                f"Codes: 1 = NOT THE CAUSE, 2 = POSITIVE OR NEUTRAL. {self.answer_format(ValidationType.FALSE, choices=(1, 2))}"
+            )
+        return system_message, user_prompt
+
+    def root_check(self, cause, problem):
+        system_message = self.system(
+            ROOT_RULES,
+            "Answer True if the given cause is a root cause, or False if it is an intermediate cause with deeper causes."
+        )
+        user_prompt = (
+            f"Problem: '{self.question_text(problem.question)}'. "
+            f"Cause from column {COLUMNS[cause.column]}, row {cause.row}: '{self.cause_text(cause.cause)}'. "
+            f"Is it the fundamental reason behind the problem? {self.answer_format(ValidationType.ROOT)}"
+        )
+        return system_message, user_prompt
+
+    def corruption_category(self, cause):
+        system_message = self.system(
+            "Classify a root cause into exactly one corruption category, the final step of the analysis.",
+            CATEGORY_RULES
+        )
+        user_prompt = (
+            f"Root cause: '{self.cause_text(cause.cause)}'. "
+            f"Which category is it? {self.answer_format(ValidationType.ROOT_TYPE)}"
+        )
+        return system_message, user_prompt
+
+    def batch(self, items, problem):
+        """items is a list of (cause, parent_text) pairs; the parent of a row 1 cause is the problem"""
+        payload = [
+            {
+                "id": index,
+                "cell": f"{COLUMNS[cause.column]}{cause.row}",
+                "cause": self.cause_text(cause.cause),
+                "parent": self.cause_text(parent_text),
+            }
+            for index, (cause, parent_text) in enumerate(items)
+        ]
+        system_message = self.system(
+            ANALYSIS_CONTEXT, CHAIN_RULES, ROOT_RULES, CATEGORY_RULES,
+            "You receive several causes at once. Judge every cause independently against its own 'parent'. "
+            "Respond ONLY with a JSON array containing one object per cause and no other text."
+        )
+        user_prompt = (
+            f"Problem: '{self.question_text(problem.question)}'. "
+            f"Causes: {json.dumps(payload, ensure_ascii=False)}. "
+            "For every cause return an object with these keys: "
+            "\"id\": the id of the cause; "
+            "\"valid\": true if the cause directly causes its parent, otherwise false; "
+            "\"root\": true if a valid cause is a root cause, otherwise false; "
+            "\"category\": the corruption category of a valid cause, otherwise null; "
+            f"\"feedback_type\": for an invalid cause {FEEDBACK_CODES} (3 only outside the first row), otherwise null."
+        )
+        return system_message, user_prompt
+
+prompt_metrics = TokenUsage()
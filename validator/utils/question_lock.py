@@ -0,0 +1,90 @@
+import hashlib
+import time
+import uuid
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DatabaseError, connection, transaction
+from question.models import Question
+
+class QuestionLock:
+    """
+    Cross-process lock held while a question is being validated.
+    PostgreSQL uses a session advisory lock, other databases that support
+    SELECT ... FOR UPDATE lock the question row, and SQLite falls back to an
+    expiring cache key. Settings come from VALIDATOR['LOCK'].
+    """
+
+    ADVISORY, ROW, CACHE = 'advisory', 'row', 'cache'
+    KEY_PREFIX = "validation-lock"
+
+    def __init__(self, question_id, clock=time.monotonic, sleep=time.sleep):
+        config = getattr(settings, 'VALIDATOR', {}).get('LOCK', {})
+        self.question_id = question_id
+        self.poll_interval = config.get('POLL_INTERVAL', 0.2)
+        self.ttl = config.get('TTL', 600)
+        self._clock = clock
+        self._sleep = sleep
+        self._token = None
+        self._atomic = None
+
+        if connection.vendor == 'postgresql':
+            self.strategy = self.ADVISORY
+        elif connection.features.has_select_for_update:
+            self.strategy = self.ROW
+        else:
+            self.strategy = self.CACHE
+
+    def acquire(self, timeout: float = 0) -> bool:
+        """Try to take the lock, polling for up to timeout seconds; returns whether it was taken"""
+        deadline = self._clock() + timeout
+        while True:
+            if self._try_acquire():
+                return True
+            if self._clock() + self.poll_interval > deadline:
+                return False
+            self._sleep(self.poll_interval)
+
+    def release(self):
+        if self.strategy == self.ADVISORY:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_advisory_unlock(%s)", [self._advisory_key()])
+        elif self.strategy == self.ROW:
+            atomic, self._atomic = self._atomic, None
+            atomic.__exit__(None, None, None)
+        else:
+            # Only delete the key if it is still ours; an expired lock may have been taken over
+            if cache.get(self._cache_key()) == self._token:
+                cache.delete(self._cache_key())
+            self._token = None
+
+    def _try_acquire(self) -> bool:
+        if self.strategy == self.ADVISORY:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_try_advisory_lock(%s)", [self._advisory_key()])
+                return cursor.fetchone()[0]
+
+        if self.strategy == self.ROW:
+            # The row stays locked until the transaction ends in release()
+            atomic = transaction.atomic()
+            atomic.__enter__()
+            try:
+                list(Question.objects.select_for_update(nowait=True).filter(pk=self.question_id).values_list('pk'))
+            except DatabaseError as e:
+                atomic.__exit__(type(e), e, e.__traceback__)
+                return False
+            self._atomic = atomic
+            return True
+
+        token = uuid.uuid4().hex
+        if cache.add(self._cache_key(), token, self.ttl):
+            self._token = token
+            return True
+        return False
+
+    def _advisory_key(self) -> int:
+        # pg advisory locks take a signed 64-bit key
+        digest = hashlib.blake2b(f"{self.KEY_PREFIX}:{self.question_id}".encode(), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    def _cache_key(self) -> str:
+        return f"{self.KEY_PREFIX}:{self.question_id}"
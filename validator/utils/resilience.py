@@ -0,0 +1,228 @@
+import email.utils
+import random
+import threading
+import time
+import groq
+import requests
+from django.conf import settings
+from validator.constants import ErrorMsg
+from validator.exceptions import AIServiceErrorException
+
+# Failures worth another attempt: the provider may answer the same request later
+RETRYABLE_EXCEPTIONS = (
+    groq.APIConnectionError,  # Includes APITimeoutError
+    groq.RateLimitError,
+    groq.InternalServerError,
+    requests.exceptions.RequestException,
+)
+RETRYABLE_STATUS_CODES = {408, 409, 429}
+
+class CircuitBreaker:
+    """
+    Process-wide circuit breaker for one provider.
+    After FAILURE_THRESHOLD consecutive failures the circuit opens and calls
+    fail immediately; after RECOVERY_TIMEOUT seconds a limited number of
+    half-open trial calls decide whether it closes again.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+    # Counter incremented on each transition into a state
+    TRANSITION_COUNTERS = {CLOSED: 'closed', OPEN: 'opened', HALF_OPEN: 'half_opened'}
+
+    def __init__(self, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1, clock=time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.reset()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._current_state()
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; counts a rejection otherwise"""
+        with self._lock:
+            state = self._current_state()
+            if state == self.CLOSED:
+                return True
+            if state == self.HALF_OPEN and self._half_open_calls < self.half_open_max_calls:
+                self._half_open_calls += 1
+                return True
+            self._stats['rejected'] += 1
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            if self._current_state() != self.CLOSED:
+                self._transition(self.CLOSED)
+
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            state = self._current_state()
+            if state == self.HALF_OPEN or (state == self.CLOSED and self._failures >= self.failure_threshold):
+                self._transition(self.OPEN)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats, state=self._current_state(), consecutive_failures=self._failures)
+
+    def reset(self):
+        with self._lock:
+            self._state = self.CLOSED
+            self._failures = 0
+            self._opened_at = 0.0
+            self._half_open_calls = 0
+            self._stats = {'rejected': 0, 'opened': 0, 'half_opened': 0, 'closed': 0}
+
+    def _current_state(self):
+        if self._state == self.OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._transition(self.HALF_OPEN)
+        return self._state
+
+    def _transition(self, state):
+        self._state = state
+        self._stats[self.TRANSITION_COUNTERS[state]] += 1
+        if state == self.OPEN:
+            self._opened_at = self._clock()
+        if state == self.HALF_OPEN:
+            self._half_open_calls = 0
+
+
+class ResilientCaller:
+    """
+    Runs provider calls under a deadline with jittered exponential retries and
+    a shared circuit breaker. Every failure surfaces as AIServiceErrorException.
+    Settings are read from VALIDATOR['GROQ_RESILIENCE'] on every call.
+    """
+
+    def __init__(self, breaker=None, sleep=time.sleep, clock=time.monotonic):
+        config = self._config()
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=config.get('FAILURE_THRESHOLD', 5),
+            recovery_timeout=config.get('RECOVERY_TIMEOUT', 30.0),
+            half_open_max_calls=config.get('HALF_OPEN_MAX_CALLS', 1),
+        )
+        self._sleep = sleep
+        self._clock = clock
+        self._random = random.Random()
+        self._lock = threading.Lock()
+        self._stats = self._empty_stats()
+
+    def call(self, func):
+        """
+        Call func(timeout) until it succeeds, the retries are spent or the deadline passes.
+        timeout is the time left for that attempt, in seconds.
+        """
+        config = self._config()
+        deadline = self._clock() + config.get('DEADLINE', 30.0)
+        max_retries = config.get('MAX_RETRIES', 2)
+        attempt_timeout = config.get('ATTEMPT_TIMEOUT', 20.0)
+        self._record('calls')
+
+        attempt = 0
+        while True:
+            if not self.breaker.allow():
+                # Fail fast while the provider is unhealthy
+                raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+
+            remaining = deadline - self._clock()
+            if remaining <= 0:
+                self._record('deadline_exceeded')
+                raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR)
+
+            try:
+                result = func(min(attempt_timeout, remaining))
+            except Exception as e:
+                if not self._is_retryable(e):
+                    # The request itself is wrong, but the provider answered: it is healthy,
+                    # and a half-open trial slot must not stay taken
+                    self.breaker.record_success()
+                    self._record('failures')
+                    raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR) from e
+
+                self.breaker.record_failure()
+                if isinstance(e, groq.APITimeoutError):
+                    self._record('timeouts')
+
+                attempt += 1
+                delay = self._retry_delay(e, attempt, config)
+                if attempt > max_retries or self._clock() + delay >= deadline:
+                    self._record('failures')
+                    raise AIServiceErrorException(ErrorMsg.AI_SERVICE_ERROR) from e
+
+                self._record('retries')
+                self._sleep(delay)
+                continue
+
+            self.breaker.record_success()
+            self._record('successes')
+            return result
+
+    def stats(self) -> dict:
+        """Return the call counters and the circuit breaker state for this process"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['circuit'] = self.breaker.stats()
+        return stats
+
+    def reset(self):
+        with self._lock:
+            self._stats = self._empty_stats()
+        self.breaker.reset()
+
+    def _retry_delay(self, error, attempt, config) -> float:
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            return retry_after
+
+        # Full jitter: a random delay up to the exponential backoff cap
+        cap = min(config.get('BACKOFF_MAX', 8.0), config.get('BACKOFF_BASE', 0.5) * 2 ** (attempt - 1))
+        with self._lock:
+            return self._random.uniform(0, cap)
+
+    @staticmethod
+    def _retry_after(error) -> float | None:
+        """Seconds requested by a Retry-After header (delta-seconds or HTTP date), if any"""
+        response = getattr(error, 'response', None)
+        headers = getattr(response, 'headers', None)
+        if not headers:
+            return None
+
+        value = headers.get('retry-after')
+        if not value:
+            return None
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        return max(retry_at.timestamp() - time.time(), 0.0)
+
+    @staticmethod
+    def _is_retryable(error) -> bool:
+        if isinstance(error, RETRYABLE_EXCEPTIONS):
+            return True
+        return isinstance(error, groq.APIStatusError) and error.status_code in RETRYABLE_STATUS_CODES
+
+    @staticmethod
+    def _config() -> dict:
+        return getattr(settings, 'VALIDATOR', {}).get('GROQ_RESILIENCE', {})
+
+    @staticmethod
+    def _empty_stats():
+        return dict.fromkeys(('calls', 'successes', 'retries', 'timeouts', 'failures', 'deadline_exceeded'), 0)
+
+    def _record(self, counter):
+        with self._lock:
+            self._stats[counter] += 1
+
+groq_resilience = ResilientCaller()
@@ -0,0 +1,112 @@
+import re
+import threading
+from collections import Counter
+from django.conf import settings
+from validator.enums import ValidationType
+
+# Terms that make a valid cause a root cause without asking the LLM
+CORRUPTION_TERMS = [
+    'korupsi', 'suap', 'sogok', 'pungli', 'pungutan liar',
+    'penyalahgunaan wewenang', 'nepotisme', 'kolusi',
+    'gratifikasi', 'pemalsuan', 'penggelapan', 'penyelewengan',
+    'pemerasan', 'mark up', 'penyimpangan'
+]
+
+# Terms that settle the corruption category of a root cause; keys are the category codes
+CATEGORY_TERMS = {
+    1: [  # Harta
+        'suap', 'sogok', 'gratifikasi', 'penggelapan', 'pungli', 'pungutan liar',
+        'pemerasan', 'mark up', 'markup', 'memperkaya diri', 'uang pelicin',
+    ],
+    2: [  # Tahta
+        'penyalahgunaan wewenang', 'penyalahgunaan jabatan', 'nepotisme', 'kolusi',
+        'haus kekuasaan', 'mempertahankan jabatan', 'perebutan kekuasaan',
+    ],
+    3: [  # Cinta
+        'perselingkuhan', 'hubungan asmara', 'hubungan pribadi', 'kedekatan pribadi',
+        'favoritisme', 'pilih kasih',
+    ],
+}
+
+# Feedback types for an invalid cause, as used by CausesService._apply_false_feedback
+NOT_THE_CAUSE, SIMILAR_TO_PREVIOUS = 1, 3
+
+_NON_WORD_PATTERN = re.compile(r'[\W_]+')
+
+def _compile_terms(terms) -> re.Pattern:
+    # Longest terms first so overlapping alternatives prefer the most specific one
+    alternatives = '|'.join(re.escape(term.lower()) for term in sorted(set(terms), key=len, reverse=True))
+    return re.compile(alternatives or r'(?!)')
+
+def normalize_for_matching(text: str) -> str:
+    """Casefold and reduce the text to words separated by single spaces"""
+    return _NON_WORD_PATTERN.sub(' ', (text or '').casefold()).strip()
+
+
+class RuleClassifier:
+    """
+    Decides obvious verdicts locally so they never reach the LLM.
+    Each term table is compiled once into a single regex, so a cause is
+    scanned in one pass however many rules there are. The tables come from
+    VALIDATOR['RULES'] and default to the lists above.
+    """
+
+    def __init__(self, config=None):
+        if config is None:
+            config = getattr(settings, 'VALIDATOR', {}).get('RULES', {})
+        self._corruption_pattern = _compile_terms(config.get('CORRUPTION_TERMS', CORRUPTION_TERMS))
+
+        category_terms = config.get('CATEGORY_TERMS', CATEGORY_TERMS)
+        # One named group per category: the group that matched tells the category
+        self._category_pattern = re.compile('|'.join(
+            f"(?P<category_{int(category)}>{_compile_terms(terms).pattern})"
+            for category, terms in category_terms.items()
+        ) or r'(?!)')
+
+        self._lock = threading.Lock()
+        self._saved = Counter()
+
+    def is_corruption_related(self, text: str) -> bool:
+        """Whether the text mentions corruption explicitly"""
+        return self._corruption_pattern.search((text or '').lower()) is not None
+
+    def corruption_category(self, text: str) -> int | None:
+        """The category whose terms the text mentions, or None when there are none or several"""
+        categories = {
+            int(match.lastgroup.rsplit('_', 1)[1])
+            for match in self._category_pattern.finditer((text or '').lower())
+        }
+        return categories.pop() if len(categories) == 1 else None
+
+    def obvious_invalid(self, cause_text: str, parent_text: str, question_text: str, first_row: bool) -> int | None:
+        """
+        Feedback type for a cause that is obviously invalid, or None when the LLM has to decide.
+        A cause restating the problem is not its cause, and a cause repeating the cause
+        above it is similar to the previous cause.
+        """
+        cause = normalize_for_matching(cause_text)
+        if not cause:
+            return None
+        if cause == normalize_for_matching(question_text):
+            return NOT_THE_CAUSE
+        if not first_row and cause == normalize_for_matching(parent_text):
+            return SIMILAR_TO_PREVIOUS
+        return None
+
+    def record_saved(self, validation_type: ValidationType, calls: int = 1):
+        """Count LLM calls a rule made unnecessary"""
+        with self._lock:
+            self._saved[validation_type.value] += calls
+
+    def stats(self) -> dict:
+        """Return the LLM calls saved per validation type and in total for this process"""
+        with self._lock:
+            stats = dict(self._saved)
+        stats['total'] = sum(stats.values())
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._saved.clear()
+
+rule_classifier = RuleClassifier()
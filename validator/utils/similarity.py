@@ -0,0 +1,81 @@
+import hashlib
+import random
+from django.conf import settings
+from validator.utils.rule_classifier import normalize_for_matching
+
+# Mersenne prime 2^61 - 1, the modulus of the MinHash permutations
+_PRIME = (1 << 61) - 1
+
+class SimilarityIndex:
+    """
+    MinHash index over the causes of one question.
+    Each cause is reduced to the character shingles of its normalized text
+    and summarized by NUM_PERM minimum hashes; the share of equal minimums
+    estimates the Jaccard similarity of two causes without comparing their
+    shingle sets. Signatures are computed once per distinct text.
+    """
+
+    def __init__(self, num_perm=None, shingle_size=None, seed=1):
+        config = getattr(settings, 'VALIDATOR', {}).get('SIMILARITY', {})
+        self.num_perm = num_perm or config.get('NUM_PERM', 64)
+        self.shingle_size = shingle_size or config.get('SHINGLE_SIZE', 4)
+
+        generator = random.Random(seed)
+        self._permutations = [
+            (generator.randrange(1, _PRIME), generator.randrange(0, _PRIME))
+            for _ in range(self.num_perm)
+        ]
+        self._signatures = {}
+        self._entries = []
+
+    @classmethod
+    def from_causes(cls, causes, **kwargs):
+        index = cls(**kwargs)
+        for cause in causes:
+            index.add(cause)
+        return index
+
+    def add(self, cause):
+        """Index a cause by its text; empty causes are ignored"""
+        if normalize_for_matching(cause.cause):
+            self._entries.append(cause)
+
+    def similarity(self, text: str, other: str) -> float:
+        """Estimated Jaccard similarity of the shingles of two texts, from 0 to 1"""
+        first, second = self.signature(text), self.signature(other)
+        if not first or not second:
+            return 0.0
+        return sum(a == b for a, b in zip(first, second)) / self.num_perm
+
+    def most_similar(self, cause, other_columns_only=False):
+        """Return the indexed cause closest to the given one and its score, or (None, 0.0)"""
+        best, best_score = None, 0.0
+        for candidate in self._entries:
+            if candidate.pk == cause.pk or (other_columns_only and candidate.column == cause.column):
+                continue
+            score = self.similarity(cause.cause, candidate.cause)
+            if score > best_score:
+                best, best_score = candidate, score
+        return best, best_score
+
+    def signature(self, text: str) -> tuple:
+        normalized = normalize_for_matching(text)
+        if not normalized:
+            return ()
+
+        signature = self._signatures.get(normalized)
+        if signature is None:
+            hashes = [self._hash(shingle) for shingle in self._shingles(normalized)]
+            signature = tuple(min((a * value + b) % _PRIME for value in hashes) for a, b in self._permutations)
+            self._signatures[normalized] = signature
+        return signature
+
+    def _shingles(self, normalized: str) -> set:
+        size = self.shingle_size
+        if len(normalized) <= size:
+            return {normalized}
+        return {normalized[i:i + size] for i in range(len(normalized) - size + 1)}
+
+    @staticmethod
+    def _hash(shingle: str) -> int:
+        return int.from_bytes(hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest(), 'big')
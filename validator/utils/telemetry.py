@@ -0,0 +1,176 @@
+import logging
+import math
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the LLM call latency histogram, in seconds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, math.inf)
+
+class Span:
+    """One timed operation and its attributes"""
+
+    def __init__(self, name: str, **attributes):
+        self.name = name
+        self.attributes = dict(attributes)
+        self.duration = 0.0
+        self.error = None
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def as_dict(self) -> dict:
+        return dict(self.attributes, name=self.name, duration=self.duration, error=self.error)
+
+
+class Telemetry:
+    """
+    Exporter-agnostic span recorder for the validator.
+    Finished spans are aggregated into counters and latency histograms that
+    render as Prometheus text, kept in a short ring buffer, and handed to any
+    registered exporter (a callable taking the span), so tracing backends can
+    be attached without touching the validator.
+    """
+
+    def __init__(self, recent_size=100):
+        self._lock = threading.Lock()
+        self._exporters = []
+        self._recent_size = recent_size
+        self.reset()
+
+    @contextmanager
+    def span(self, name: str, **attributes):
+        """Time the block as a span; attributes can be added with span.set()"""
+        span = Span(name, **attributes)
+        started = time.perf_counter()
+        try:
+            yield span
+        except Exception as e:
+            span.error = type(e).__name__
+            raise
+        finally:
+            span.duration = time.perf_counter() - started
+            self.record(span)
+
+    def record(self, span: Span):
+        validation_type = span.attributes.get('validation_type', '')
+        cache_hit = 'true' if span.attributes.get('cache_hit') else 'false'
+        with self._lock:
+            self._calls[(span.name, validation_type, cache_hit)] += 1
+            if span.error:
+                self._errors[(span.name, validation_type, span.error)] += 1
+            if 'verdict' in span.attributes:
+                self._verdicts[(validation_type, str(span.attributes['verdict']))] += 1
+            self._prompt_tokens[validation_type] += span.attributes.get('prompt_tokens', 0)
+            self._completion_tokens[validation_type] += span.attributes.get('completion_tokens', 0)
+
+            # Cache hits never reach the model, so only real calls shape the latency histogram
+            if cache_hit == 'false':
+                histogram = self._latency[(span.name, validation_type)]
+                for index, bound in enumerate(LATENCY_BUCKETS):
+                    if span.duration <= bound:
+                        histogram['buckets'][index] += 1
+                histogram['sum'] += span.duration
+                histogram['count'] += 1
+
+            self._recent.append(span.as_dict())
+            exporters = list(self._exporters)
+
+        for exporter in exporters:
+            try:
+                exporter(span)
+            except Exception:
+                # A broken exporter must never fail a validation
+                logger.exception("Telemetry exporter %r failed", exporter)
+
+    def add_exporter(self, exporter):
+        with self._lock:
+            self._exporters.append(exporter)
+
+    def remove_exporter(self, exporter):
+        with self._lock:
+            self._exporters.remove(exporter)
+
+    def recent(self) -> list:
+        """The most recent spans, oldest first"""
+        with self._lock:
+            return list(self._recent)
+
+    def reset(self):
+        with self._lock:
+            self._calls = defaultdict(int)
+            self._errors = defaultdict(int)
+            self._verdicts = defaultdict(int)
+            self._prompt_tokens = defaultdict(int)
+            self._completion_tokens = defaultdict(int)
+            self._latency = defaultdict(lambda: {'buckets': [0] * len(LATENCY_BUCKETS), 'sum': 0.0, 'count': 0})
+            self._recent = deque(maxlen=self._recent_size)
+
+    def render_prometheus(self, families=()) -> str:
+        """
+        Render the aggregated spans in the Prometheus text format.
+        families is an iterable of (name, type, help, [(labels, value), ...]) for
+        metrics collected elsewhere, appended after the span metrics.
+        """
+        with self._lock:
+            calls = dict(self._calls)
+            errors = dict(self._errors)
+            verdicts = dict(self._verdicts)
+            prompt_tokens = dict(self._prompt_tokens)
+            completion_tokens = dict(self._completion_tokens)
+            latency = {key: dict(value, buckets=list(value['buckets'])) for key, value in self._latency.items()}
+
+        lines = []
+        _family(lines, 'validator_llm_calls_total', 'counter', 'Validator LLM calls, including verdict cache hits', [
+            ({'span': name, 'validation_type': validation_type, 'cache_hit': cache_hit}, count)
+            for (name, validation_type, cache_hit), count in sorted(calls.items())
+        ])
+        _family(lines, 'validator_llm_errors_total', 'counter', 'Validator LLM calls that raised', [
+            ({'span': name, 'validation_type': validation_type, 'error': error}, count)
+            for (name, validation_type, error), count in sorted(errors.items())
+        ])
+        _family(lines, 'validator_verdicts_total', 'counter', 'Verdicts returned per validation type', [
+            ({'validation_type': validation_type, 'verdict': verdict}, count)
+            for (validation_type, verdict), count in sorted(verdicts.items())
+        ])
+        _family(lines, 'validator_prompt_tokens_total', 'counter', 'Estimated prompt tokens sent to the model', [
+            ({'validation_type': validation_type}, count) for validation_type, count in sorted(prompt_tokens.items())
+        ])
+        _family(lines, 'validator_completion_tokens_total', 'counter', 'Estimated completion tokens received from the model', [
+            ({'validation_type': validation_type}, count) for validation_type, count in sorted(completion_tokens.items())
+        ])
+
+        lines.append('# HELP validator_llm_call_duration_seconds Latency of validator LLM calls that reached the model')
+        lines.append('# TYPE validator_llm_call_duration_seconds histogram')
+        for (name, validation_type), histogram in sorted(latency.items()):
+            labels = {'span': name, 'validation_type': validation_type}
+            for bound, count in zip(LATENCY_BUCKETS, histogram['buckets']):
+                le = '+Inf' if bound == math.inf else repr(bound)
+                lines.append(f"validator_llm_call_duration_seconds_bucket{_labels(dict(labels, le=le))} {count}")
+            lines.append(f"validator_llm_call_duration_seconds_sum{_labels(labels)} {histogram['sum']}")
+            lines.append(f"validator_llm_call_duration_seconds_count{_labels(labels)} {histogram['count']}")
+
+        for name, metric_type, help_text, samples in families:
+            _family(lines, name, metric_type, help_text, samples)
+
+        return '\n'.join(lines) + '\n'
+
+
+def _family(lines, name, metric_type, help_text, samples):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {metric_type}")
+    for labels, value in samples:
+        lines.append(f"{name}{_labels(labels)} {value}")
+
+def _labels(labels: dict) -> str:
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + '}'
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+telemetry = Telemetry()
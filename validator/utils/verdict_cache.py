@@ -0,0 +1,90 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from django.conf import settings
+from django.core.cache import cache
+
+class VerdictCache:
+    """
+    Two-tier cache for LLM verdicts.
+    An in-process LRU sits in front of Django's cache so repeated prompts
+    skip the network entirely, and identical prompts from other workers
+    are still shared through the Django cache backend.
+    """
+
+    KEY_PREFIX = "verdict"
+
+    def __init__(self, ttl=None, local_maxsize=None):
+        config = getattr(settings, 'VALIDATOR', {}).get('VERDICT_CACHE', {})
+        self.ttl = ttl if ttl is not None else config.get('TTL', 60 * 60 * 24)
+        self.local_maxsize = local_maxsize if local_maxsize is not None else config.get('LOCAL_MAXSIZE', 1024)
+        self.enabled = config.get('ENABLED', True)
+        self.cache = cache  # Using Django's cache framework
+
+        self._local = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'local_hits': 0, 'misses': 0}
+
+    def make_key(self, model: str, system_message: str, user_prompt: str, validation_type) -> str:
+        """Build a content-addressed key for a prompt"""
+        validation_value = getattr(validation_type, 'value', validation_type)
+        digest = hashlib.sha256()
+        for part in (model, system_message, user_prompt, validation_value):
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b'\x00')  # Separator so field boundaries are part of the hash
+        return f"{self.KEY_PREFIX}:{digest.hexdigest()}"
+
+    def get(self, key: str):
+        """Return the cached verdict or None, checking the local tier first"""
+        if not self.enabled:
+            return None
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is not None:
+                expires_at, verdict = entry
+                if expires_at > now:
+                    self._local.move_to_end(key)
+                    self._stats['hits'] += 1
+                    self._stats['local_hits'] += 1
+                    return verdict
+                del self._local[key]
+
+        verdict = self.cache.get(key)
+        with self._lock:
+            if verdict is None:
+                self._stats['misses'] += 1
+                return None
+            self._stats['hits'] += 1
+            self._store_local(key, verdict, now)
+        return verdict
+
+    def set(self, key: str, verdict):
+        """Store a verdict in both tiers"""
+        if not self.enabled:
+            return
+
+        self.cache.set(key, verdict, self.ttl)
+        with self._lock:
+            self._store_local(key, verdict, time.monotonic())
+
+    def stats(self) -> dict:
+        """Return a snapshot of the hit/miss counters for this process"""
+        with self._lock:
+            return dict(self._stats, local_size=len(self._local))
+
+    def clear(self):
+        """Drop the local tier and reset the counters"""
+        with self._lock:
+            self._local.clear()
+            self._stats = {'hits': 0, 'local_hits': 0, 'misses': 0}
+
+    def _store_local(self, key, verdict, now):
+        self._local[key] = (now + self.ttl, verdict)
+        self._local.move_to_end(key)
+        while len(self._local) > self.local_maxsize:
+            self._local.popitem(last=False)
+
+verdict_cache = VerdictCache()
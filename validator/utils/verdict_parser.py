@@ -0,0 +1,101 @@
+import logging
+import re
+import threading
+from pydantic import ValidationError
+from validator.dataclasses.verdict import BooleanVerdictDataClass, ChoiceVerdictDataClass
+from validator.enums import ValidationType
+
+logger = logging.getLogger(__name__)
+
+BOOLEAN_TYPES = (ValidationType.NORMAL, ValidationType.ROOT)
+
+# The answer line of a prompt, as a JSON object or as free text
+FORMAT_INSTRUCTIONS = {
+    ('boolean', True): 'Respond ONLY with a JSON object of the form {{"verdict": true}} or {{"verdict": false}}.',
+    ('boolean', False): 'Answer only with True or False.',
+    ('choice', True): 'Respond ONLY with a JSON object of the form {{"verdict": N}} where N is {choices}.',
+    ('choice', False): 'Answer ONLY with {choices}.',
+}
+
+_BOOLEAN_PATTERN = re.compile(r'\b(true|false)\b', re.IGNORECASE)
+_CHOICE_PATTERN = re.compile(r'(?<!\d)([123])(?!\d)')
+
+class VerdictParser:
+    """
+    Turns raw model answers into verdicts.
+    The answer is first parsed strictly as the requested JSON object; only if
+    that fails is the first standalone true/false or 1-3 token used. Every
+    outcome is counted so the parse-failure rate can be monitored.
+    """
+
+    OUTCOMES = ('structured', 'fallback', 'failed')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(self.OUTCOMES, 0)
+
+    def format_instruction(self, validation_type: ValidationType, structured: bool = True, choices=(1, 2, 3)) -> str:
+        """The answer line for a prompt; choices are the codes a numeric answer may take"""
+        kind = 'boolean' if validation_type in BOOLEAN_TYPES else 'choice'
+        codes = [str(choice) for choice in choices]
+        return FORMAT_INSTRUCTIONS[(kind, structured)].format(choices=', '.join(codes[:-1]) + ' or ' + codes[-1])
+
+    def parse(self, answer: str, validation_type: ValidationType) -> int | None:
+        """Return the verdict of an answer, or None if it is not recognized"""
+        answer = answer or ''
+
+        verdict = self._parse_structured(answer, validation_type)
+        if verdict is not None:
+            self._record('structured')
+            return verdict
+
+        verdict = self._parse_fallback(answer, validation_type)
+        if verdict is not None:
+            self._record('fallback')
+            return verdict
+
+        self._record('failed')
+        logger.warning("Unrecognized %s verdict: %.200r", getattr(validation_type, 'value', validation_type), answer)
+        return None
+
+    def stats(self) -> dict:
+        """Return the outcome counters and the derived failure rates for this process"""
+        with self._lock:
+            stats = dict(self._stats)
+
+        total = sum(stats.values())
+        stats['total'] = total
+        # Answers that were not the requested JSON, and answers that could not be read at all
+        stats['structured_failure_rate'] = (stats['fallback'] + stats['failed']) / total if total else 0.0
+        stats['failure_rate'] = stats['failed'] / total if total else 0.0
+        return stats
+
+    def clear(self):
+        with self._lock:
+            self._stats = dict.fromkeys(self.OUTCOMES, 0)
+
+    def _parse_structured(self, answer, validation_type):
+        # Models sometimes wrap the object in prose or a code fence
+        start, end = answer.find('{'), answer.rfind('}')
+        if start == -1 or end < start:
+            return None
+
+        model = BooleanVerdictDataClass if validation_type in BOOLEAN_TYPES else ChoiceVerdictDataClass
+        try:
+            return int(model.model_validate_json(answer[start:end + 1]).verdict)
+        except (ValidationError, ValueError):
+            return None
+
+    def _parse_fallback(self, answer, validation_type):
+        if validation_type in BOOLEAN_TYPES:
+            match = _BOOLEAN_PATTERN.search(answer)
+            return int(match.group(1).lower() == 'true') if match else None
+
+        match = _CHOICE_PATTERN.search(answer)
+        return int(match.group(1)) if match else None
+
+    def _record(self, outcome):
+        with self._lock:
+            self._stats[outcome] += 1
+
+verdict_parser = VerdictParser()
@@ -1,6 +1,17 @@
+import json
+import queue
+import threading
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.crypto import constant_time_compare
 from rest_framework.views import APIView
 from rest_framework.response import Response
-from .services import CausesService
+from .models import ValidationJob
+from .serializers import ValidationJobResponse, ValidationJobStatusResponse
+from .services import CausesService, MetricsService, ValidationJobService
+from cause.models import Causes
 from cause.serializers import CausesResponse
 from rest_framework import status
 from drf_spectacular.utils import extend_schema
@@ -13,7 +24,96 @@ class ValidateView(APIView):
         responses=CausesResponse,
     )
     def patch(self, request, question_id):
-        service = CausesService() 
+        if getattr(settings, 'VALIDATOR', {}).get('ASYNC_JOBS', False):
+            job = ValidationJobService().enqueue(question_id=question_id)
+            return Response(ValidationJobResponse(job).data, status=status.HTTP_202_ACCEPTED)
+
+        service = CausesService()
         updated_causes = service.validate(question_id=question_id, request=request)
         serializer = CausesResponse(updated_causes, many=True)
-        return Response(serializer.data, status=status.HTTP_200_OK)
\ No newline at end of file
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+@permission_classes([])
+class ValidateStreamView(APIView):
+    """
+    Streams validation results as newline-delimited JSON.
+    Every decided cause is pushed as a {"type": "cause"} line, followed by a
+    final {"type": "done"} line with all causes of the question and the
+    prompts and tokens sent for them ("usage"), or an
+    {"type": "error"} line if the validation fails.
+    """
+
+    @extend_schema(
+        description='Run Root Cause Analysis for a specific question and stream each cause as soon as it is decided',
+        responses=CausesResponse,
+    )
+    def patch(self, request, question_id):
+        events = queue.Queue()
+        service = CausesService(
+            on_cause_decided=lambda cause: events.put({'type': 'cause', 'cause': CausesResponse(cause).data})
+        )
+
+        def run_validation():
+            try:
+                causes = service.validate(question_id=question_id, request=request)
+                events.put({
+                    'type': 'done',
+                    'causes': CausesResponse(causes, many=True).data,
+                    'usage': service.token_usage.stats(),
+                })
+            except Exception as e:
+                events.put({'type': 'error', 'detail': str(e)})
+            finally:
+                # Release the database connection opened by this thread
+                connections.close_all()
+
+        threading.Thread(target=run_validation, daemon=True).start()
+
+        def stream():
+            while True:
+                event = events.get()
+                yield json.dumps(event, cls=DjangoJSONEncoder) + '\n'
+                if event['type'] != 'cause':
+                    break
+
+        response = StreamingHttpResponse(stream(), content_type='application/x-ndjson')
+        response['Cache-Control'] = 'no-cache'
+        response['X-Accel-Buffering'] = 'no'  # Keep reverse proxies from buffering the stream
+        return response
+
+@permission_classes([])
+class ValidationJobView(APIView):
+    @extend_schema(
+        description='Return the status and progress of a queued validation, with the validated causes once it succeeded',
+        responses=ValidationJobStatusResponse,
+    )
+    def get(self, request, job_id):
+        job = ValidationJobService().get(job_id=job_id)
+        if job.status == ValidationJob.StatusChoices.SUCCEEDED:
+            job.causes = Causes.objects.filter(question_id=job.question_id).order_by('column', 'row')
+
+        serializer = ValidationJobStatusResponse(job)
+        return Response(serializer.data, status=status.HTTP_200_OK)
+
+class MetricsView(APIView):
+    """
+    Validator telemetry in the Prometheus text format.
+    Scrapers do not carry user tokens, so the endpoint skips JWT authentication and
+    requires VALIDATOR['METRICS_TOKEN'] as a bearer token instead. Without a configured
+    token the endpoint does not exist.
+    """
+    authentication_classes = []
+    permission_classes = []
+
+    @extend_schema(
+        description='Validator LLM calls, tokens, latency, cache and circuit breaker metrics for Prometheus',
+        responses={(200, 'text/plain'): str},
+    )
+    def get(self, request):
+        token = getattr(settings, 'VALIDATOR', {}).get('METRICS_TOKEN')
+        if not token:
+            return HttpResponse(status=status.HTTP_404_NOT_FOUND)
+        if not constant_time_compare(request.headers.get('Authorization', ''), f"Bearer {token}"):
+            return HttpResponse(status=status.HTTP_401_UNAUTHORIZED)
+
+        return HttpResponse(MetricsService().render(), content_type=MetricsService.CONTENT_TYPE)